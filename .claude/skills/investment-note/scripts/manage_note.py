@@ -7,8 +7,21 @@ import os
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", ".."))
 
-from scripts.common import print_suggestions
-from src.data.note_manager import save_note, load_notes, delete_note
+from src.data.note_manager import save_note, iter_notes, delete_note
+
+# Markdown table cell escaping: pipes break columns, newlines break rows
+_CELL_ESCAPE = str.maketrans({"|": "\\|", "\n": " "})
+
+
+def print_suggestions(**kwargs):
+    """Lazy proxy for scripts.common.print_suggestions.
+
+    scripts.common imports graph_store/graph_query (numpy, networkx) at module
+    load, which only the save path needs; list/delete skip that cost.
+    """
+    from scripts.common import print_suggestions as _print_suggestions
+
+    _print_suggestions(**kwargs)
 
 
 def cmd_save(args):
@@ -71,9 +84,20 @@ def cmd_save(args):
 
 def cmd_list(args):
     """List notes."""
-    notes = load_notes(symbol=args.symbol, note_type=args.type, category=args.category)
+    # Stream notes file by file; only the truncated table rows are buffered
+    rows = []
+    for n in iter_notes(symbol=args.symbol, note_type=args.type, category=args.category):
+        content = n.get("content", "")
+        short = content[:50] + "..." if len(content) > 50 else content
+        short = short.translate(_CELL_ESCAPE)
+        target = n.get("symbol") or n.get("category", "-")
+        # KIK-473: show detected symbols for journal notes without explicit symbol
+        if n.get("type") == "journal" and not n.get("symbol") and n.get("detected_symbols"):
+            target = ", ".join(n["detected_symbols"])
+        cat = n.get("category", "-")
+        rows.append(f"| {n.get('date', '-')} | {target} | {cat} | {n.get('type', '-')} | {short} |")
 
-    if not notes:
+    if not rows:
         if args.symbol:
             print(f"{args.symbol} のメモはありません。")
         elif args.category:
@@ -91,21 +115,17 @@ def cmd_list(args):
         label_parts.append(args.type)
     label = " / ".join(label_parts) if label_parts else "全件"
 
-    print(f"## 投資メモ一覧 ({label}: {len(notes)} 件)\n")
-    print("| 日付 | 対象 | カテゴリ | タイプ | 内容 |")
-    print("|:-----|:-----|:---------|:-------|:-----|")
-    for n in notes:
-        content = n.get("content", "")
-        short = content[:50] + "..." if len(content) > 50 else content
-        short = short.replace("|", "\\|").replace("\n", " ")
-        target = n.get("symbol") or n.get("category", "-")
-        # KIK-473: show detected symbols for journal notes without explicit symbol
-        if n.get("type") == "journal" and not n.get("symbol") and n.get("detected_symbols"):
-            target = ", ".join(n["detected_symbols"])
-        cat = n.get("category", "-")
-        print(f"| {n.get('date', '-')} | {target} | {cat} | {n.get('type', '-')} | {short} |")
-
-    print(f"\n合計 {len(notes)} 件")
+    total = len(rows)
+    lines = [
+        f"## 投資メモ一覧 ({label}: {total} 件)\n",
+        "| 日付 | 対象 | カテゴリ | タイプ | 内容 |",
+        "|:-----|:-----|:---------|:-------|:-----|",
+        *rows,
+        f"\n合計 {total} 件",
+    ]
+
+    # Emit the whole table with a single write instead of one print per row
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def cmd_delete(args):
@@ -20,9 +20,7 @@ from src.core.screening.screener_registry import (
     build_default_registry, RegionConfig, run_screener_with_spec,
 )
 from src.output.formatter import format_markdown, format_auto_theme_header
-from src.markets.japan import JapanMarket
-from src.markets.us import USMarket
-from src.markets.asean import ASEANMarket
+from src.markets import MARKETS, get_market
 
 # Module availability from common.py (KIK-448); import specific functions when available
 HAS_HISTORY = HAS_HISTORY_STORE
@@ -57,13 +55,6 @@ if HAS_SCREENING_SUMMARY:
 _registry = build_default_registry()
 _region_config = RegionConfig()
 
-# Legacy market classes (only used by run_legacy_mode)
-MARKETS = {
-    "japan": JapanMarket,
-    "us": USMarket,
-    "asean": ASEANMarket,
-}
-
 VALID_SECTORS = [
     "Technology",
     "Financial Services",
@@ -397,17 +388,16 @@ def run_legacy_mode(args):
         sys.exit(1)
 
     if market_key == "all":
-        markets_to_run = list(MARKETS.items())
+        markets_to_run = [(name, get_market(name)) for name in MARKETS]
     else:
         if market_key not in MARKETS:
             print(f"Error: Unknown market '{market_key}'")
             sys.exit(1)
-        markets_to_run = [(market_key, MARKETS[market_key])]
+        markets_to_run = [(market_key, get_market(market_key))]
 
     client = yahoo_client
 
-    for market_name, market_cls in markets_to_run:
-        market = market_cls()
+    for market_name, market in markets_to_run:
 
         screener = ValueScreener(client, market)
         results = screener.screen(preset=args.preset, top_n=args.top)
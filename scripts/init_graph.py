@@ -18,20 +18,32 @@ This script:
 import argparse
 import csv
 import json
+import os
 import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from pathlib import Path
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from scripts.common import try_import
 from src.data.graph_store import (
+    bulk_merge_stocks,
     clear_all,
     get_mode,
     init_schema,
     is_available,
     link_research_supersedes,
+    list_constraints,
     merge_forecast,
     merge_health,
     merge_market_context,
@@ -42,12 +54,13 @@ from src.data.graph_store import (
     merge_research,
     merge_research_full,
     merge_screen,
-    merge_stock,
     merge_stress_test,
     merge_trade,
     merge_watchlist,
     sync_portfolio,
+    write_batch,
 )
+from src.data.note_manager import iter_notes
 
 # KIK-420: Optional embedding support (graceful degradation if TEI unavailable)
 HAS_EMBEDDING, _emb = try_import("src.data", "embedding_client")
@@ -58,6 +71,10 @@ if HAS_SUMMARY_BUILDER:
     summary_builder = _sb["summary_builder"]
 HAS_EMBEDDING = HAS_EMBEDDING and HAS_SUMMARY_BUILDER
 
+# History importers write disjoint node types, so they can run concurrently
+# once import_history has MERGEd the Stock nodes they all share.
+_MAX_WORKERS = int(os.environ.get("GRAPH_IMPORT_MAX_WORKERS", "8"))
+
 
 def _get_embedding(summary_text: str) -> "list[float] | None":
     """Get embedding for summary text. Returns None if TEI unavailable."""
@@ -69,144 +86,245 @@ def _get_embedding(summary_text: str) -> "list[float] | None":
         return None
 
 
-def import_screens(history_dir: str) -> int:
+def _load_json(fp: "str | Path"):
+    """Parse a history JSON file, using orjson when installed.
+
+    The file is read as bytes so orjson can decode UTF-8 in C.
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    keep catching the stdlib exception.
+    """
+    with open(fp, "rb") as f:
+        raw = f.read()
+    if _HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _iter_json(d: Path):
+    """Yield (path, parsed) for each ``*.json`` file in *d*, sorted by name.
+
+    Uses a single os.scandir() walk instead of Path.glob(). Files that
+    cannot be read or parsed are skipped. Name order is kept so later
+    files overwrite earlier ones deterministically on MERGE.
+    """
+    try:
+        with os.scandir(d) as it:
+            entries = sorted(
+                (e for e in it if e.name.endswith(".json") and e.is_file()),
+                key=lambda e: e.name,
+            )
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            yield Path(entry.path), _load_json(entry.path)
+        except (json.JSONDecodeError, OSError):
+            continue
+
+
+def _collect_stock(seen: dict[str, dict], symbol: str, **meta: str) -> None:
+    """Record a Stock row once per symbol, keeping non-empty metadata.
+
+    Rows are flushed with a single bulk_merge_stocks() call per importer,
+    so a symbol that appears in many history files is MERGEd only once.
+    """
+    row = seen.setdefault(symbol, {"symbol": symbol})
+    for key, value in meta.items():
+        if value:
+            row[key] = value
+
+
+# Stock rows referenced by each history type, as (symbol, metadata) pairs.
+# Shared by the importers and the collect_history_stocks() pre-pass.
+
+def _screen_stock_rows(data: dict):
+    for r in data.get("results", []):
+        if sym := r.get("symbol"):
+            yield sym, {"name": r.get("name", ""), "sector": r.get("sector", "")}
+
+
+def _report_stock_rows(data: dict):
+    if symbol := data.get("symbol", ""):
+        yield symbol, {"name": data.get("name", ""), "sector": data.get("sector", "")}
+
+
+def _trade_stock_rows(data: dict):
+    if symbol := data.get("symbol", ""):
+        yield symbol, {}
+
+
+def _health_stock_rows(data: dict):
+    for p in data.get("positions", []):
+        if sym := p.get("symbol"):
+            yield sym, {}
+
+
+def _research_stock_rows(data: dict):
+    # Only stock/business research targets are tickers
+    target = data.get("target", "")
+    if target and data.get("research_type", "") in ("stock", "business"):
+        yield target, {"name": data.get("name", "")}
+
+
+def _stress_test_stock_rows(data: dict):
+    for sym in data.get("symbols", []):
+        if sym:
+            yield sym, {}
+
+
+def _forecast_stock_rows(data: dict):
+    for p in data.get("positions", []):
+        if sym := p.get("symbol"):
+            yield sym, {}
+
+
+_HISTORY_STOCK_ROWS = (
+    ("screen", _screen_stock_rows),
+    ("report", _report_stock_rows),
+    ("trade", _trade_stock_rows),
+    ("health", _health_stock_rows),
+    ("research", _research_stock_rows),
+    ("stress_test", _stress_test_stock_rows),
+    ("forecast", _forecast_stock_rows),
+)
+
+
+def collect_history_stocks(history_dir: str) -> list[dict]:
+    """Return one Stock row per symbol referenced anywhere in the history."""
+    seen: dict[str, dict] = {}
+    for subdir, stock_rows in _HISTORY_STOCK_ROWS:
+        for _, data in _iter_json(Path(history_dir) / subdir):
+            if isinstance(data, dict):
+                for sym, meta in stock_rows(data):
+                    _collect_stock(seen, sym, **meta)
+    return list(seen.values())
+
+
+def import_screens(history_dir: str, merge_stocks: bool = True) -> int:
     """Import screening history files."""
     d = Path(history_dir) / "screen"
     if not d.exists():
         return 0
     count = 0
-    for fp in sorted(d.glob("*.json")):
-        try:
-            with open(fp, encoding="utf-8") as f:
-                data = json.load(f)
-            screen_date = data.get("date", "")
-            preset = data.get("preset", "")
-            region = data.get("region", "")
-            results = data.get("results", [])
-            symbols = [r.get("symbol", "") for r in results if r.get("symbol")]
-
-            # Merge stock nodes with metadata
-            for r in results:
-                sym = r.get("symbol", "")
-                if sym:
-                    merge_stock(
-                        symbol=sym,
-                        name=r.get("name", ""),
-                        sector=r.get("sector", ""),
-                    )
-
-            # KIK-420: Generate embedding
-            summary_text = ""
-            emb = None
-            if HAS_EMBEDDING:
-                try:
-                    top_syms = symbols[:5]
-                    summary_text = summary_builder.build_screen_summary(
-                        screen_date, preset, region, top_syms)
-                    emb = _get_embedding(summary_text)
-                except Exception:
-                    pass
-
-            merge_screen(screen_date, preset, region, len(results), symbols,
-                         semantic_summary=summary_text, embedding=emb)
-            count += 1
-        except (json.JSONDecodeError, OSError):
-            continue
+    seen_stocks: dict[str, dict] = {}
+    for _, data in _iter_json(d):
+        screen_date = data.get("date", "")
+        preset = data.get("preset", "")
+        region = data.get("region", "")
+        results = data.get("results", [])
+        # Rank-ordered, de-duplicated symbols (top 5 feed the summary)
+        symbols = list(dict.fromkeys(s for r in results if (s := r.get("symbol"))))
+
+        # Collect stock nodes with metadata (flushed in bulk below)
+        for sym, meta in _screen_stock_rows(data):
+            _collect_stock(seen_stocks, sym, **meta)
+
+        # KIK-420: Generate embedding
+        summary_text = ""
+        emb = None
+        if HAS_EMBEDDING:
+            try:
+                top_syms = symbols[:5]
+                summary_text = summary_builder.build_screen_summary(
+                    screen_date, preset, region, top_syms)
+                emb = _get_embedding(summary_text)
+            except Exception:
+                pass
+
+        merge_screen(screen_date, preset, region, len(results), symbols,
+                     semantic_summary=summary_text, embedding=emb)
+        count += 1
+    if merge_stocks:
+        bulk_merge_stocks(list(seen_stocks.values()))
     return count
 
 
-def import_reports(history_dir: str) -> int:
+def import_reports(history_dir: str, merge_stocks: bool = True) -> int:
     """Import report history files."""
     d = Path(history_dir) / "report"
     if not d.exists():
         return 0
     count = 0
-    for fp in sorted(d.glob("*.json")):
-        try:
-            with open(fp, encoding="utf-8") as f:
-                data = json.load(f)
-            symbol = data.get("symbol", "")
-            if not symbol:
-                continue
-            merge_stock(
-                symbol=symbol,
-                name=data.get("name", ""),
-                sector=data.get("sector", ""),
-            )
-            # KIK-420: Generate embedding
-            summary_text = ""
-            emb = None
-            if HAS_EMBEDDING:
-                try:
-                    summary_text = summary_builder.build_report_summary(
-                        symbol, data.get("name", ""),
-                        data.get("value_score", 0), data.get("verdict", ""),
-                        data.get("sector", ""))
-                    emb = _get_embedding(summary_text)
-                except Exception:
-                    pass
-
-            merge_report_full(
-                report_date=data.get("date", ""),
-                symbol=symbol,
-                score=data.get("value_score", 0),
-                verdict=data.get("verdict", ""),
-                price=data.get("price", 0),
-                per=data.get("per", 0),
-                pbr=data.get("pbr", 0),
-                dividend_yield=data.get("dividend_yield", 0),
-                roe=data.get("roe", 0),
-                market_cap=data.get("market_cap", 0),
-                semantic_summary=summary_text,
-                embedding=emb,
-            )
-            count += 1
-        except (json.JSONDecodeError, OSError):
+    seen_stocks: dict[str, dict] = {}
+    for _, data in _iter_json(d):
+        symbol = data.get("symbol", "")
+        if not symbol:
             continue
+        for sym, meta in _report_stock_rows(data):
+            _collect_stock(seen_stocks, sym, **meta)
+        # KIK-420: Generate embedding
+        summary_text = ""
+        emb = None
+        if HAS_EMBEDDING:
+            try:
+                summary_text = summary_builder.build_report_summary(
+                    symbol, data.get("name", ""),
+                    data.get("value_score", 0), data.get("verdict", ""),
+                    data.get("sector", ""))
+                emb = _get_embedding(summary_text)
+            except Exception:
+                pass
+
+        merge_report_full(
+            report_date=data.get("date", ""),
+            symbol=symbol,
+            score=data.get("value_score", 0),
+            verdict=data.get("verdict", ""),
+            price=data.get("price", 0),
+            per=data.get("per", 0),
+            pbr=data.get("pbr", 0),
+            dividend_yield=data.get("dividend_yield", 0),
+            roe=data.get("roe", 0),
+            market_cap=data.get("market_cap", 0),
+            semantic_summary=summary_text,
+            embedding=emb,
+        )
+        count += 1
+    if merge_stocks:
+        bulk_merge_stocks(list(seen_stocks.values()))
     return count
 
 
-def import_trades(history_dir: str) -> int:
+def import_trades(history_dir: str, merge_stocks: bool = True) -> int:
     """Import trade history files."""
     d = Path(history_dir) / "trade"
     if not d.exists():
         return 0
     count = 0
-    for fp in sorted(d.glob("*.json")):
-        try:
-            with open(fp, encoding="utf-8") as f:
-                data = json.load(f)
-            symbol = data.get("symbol", "")
-            if not symbol:
-                continue
-            merge_stock(symbol=symbol)
-
-            # KIK-420: Generate embedding
-            summary_text = ""
-            emb = None
-            if HAS_EMBEDDING:
-                try:
-                    summary_text = summary_builder.build_trade_summary(
-                        data.get("date", ""), data.get("trade_type", "buy"),
-                        symbol, data.get("shares", 0), data.get("memo", ""))
-                    emb = _get_embedding(summary_text)
-                except Exception:
-                    pass
-
-            merge_trade(
-                trade_date=data.get("date", ""),
-                trade_type=data.get("trade_type", "buy"),
-                symbol=symbol,
-                shares=data.get("shares", 0),
-                price=data.get("price", 0),
-                currency=data.get("currency", "JPY"),
-                memo=data.get("memo", ""),
-                semantic_summary=summary_text,
-                embedding=emb,
-            )
-            count += 1
-        except (json.JSONDecodeError, OSError):
+    seen_stocks: dict[str, dict] = {}
+    for _, data in _iter_json(d):
+        symbol = data.get("symbol", "")
+        if not symbol:
             continue
+        for sym, meta in _trade_stock_rows(data):
+            _collect_stock(seen_stocks, sym, **meta)
+
+        # KIK-420: Generate embedding
+        summary_text = ""
+        emb = None
+        if HAS_EMBEDDING:
+            try:
+                summary_text = summary_builder.build_trade_summary(
+                    data.get("date", ""), data.get("trade_type", "buy"),
+                    symbol, data.get("shares", 0), data.get("memo", ""))
+                emb = _get_embedding(summary_text)
+            except Exception:
+                pass
+
+        merge_trade(
+            trade_date=data.get("date", ""),
+            trade_type=data.get("trade_type", "buy"),
+            symbol=symbol,
+            shares=data.get("shares", 0),
+            price=data.get("price", 0),
+            currency=data.get("currency", "JPY"),
+            memo=data.get("memo", ""),
+            semantic_summary=summary_text,
+            embedding=emb,
+        )
+        count += 1
+    if merge_stocks:
+        bulk_merge_stocks(list(seen_stocks.values()))
     return count
 
 
@@ -216,35 +334,30 @@ def import_health(history_dir: str) -> int:
     if not d.exists():
         return 0
     count = 0
-    for fp in sorted(d.glob("*.json")):
-        try:
-            with open(fp, encoding="utf-8") as f:
-                data = json.load(f)
-            health_date = data.get("date", "")
-            summary = data.get("summary", {})
-            positions = data.get("positions", [])
-            symbols = [p.get("symbol", "") for p in positions if p.get("symbol")]
-
-            # KIK-420: Generate embedding
-            summary_text = ""
-            emb = None
-            if HAS_EMBEDDING:
-                try:
-                    summary_text = summary_builder.build_health_summary(
-                        health_date, summary)
-                    emb = _get_embedding(summary_text)
-                except Exception:
-                    pass
-
-            merge_health(health_date, summary, symbols,
-                         semantic_summary=summary_text, embedding=emb)
-            count += 1
-        except (json.JSONDecodeError, OSError):
-            continue
+    for _, data in _iter_json(d):
+        health_date = data.get("date", "")
+        summary = data.get("summary", {})
+        positions = data.get("positions", [])
+        symbols = list(dict.fromkeys(s for p in positions if (s := p.get("symbol"))))
+
+        # KIK-420: Generate embedding
+        summary_text = ""
+        emb = None
+        if HAS_EMBEDDING:
+            try:
+                summary_text = summary_builder.build_health_summary(
+                    health_date, summary)
+                emb = _get_embedding(summary_text)
+            except Exception:
+                pass
+
+        merge_health(health_date, summary, symbols,
+                     semantic_summary=summary_text, embedding=emb)
+        count += 1
     return count
 
 
-def import_research(history_dir: str) -> int:
+def import_research(history_dir: str, merge_stocks: bool = True) -> int:
     """Import research history files and build SUPERSEDES chains."""
     d = Path(history_dir) / "research"
     if not d.exists():
@@ -252,47 +365,45 @@ def import_research(history_dir: str) -> int:
     count = 0
     # Track unique (type, target) pairs for SUPERSEDES linking
     targets = defaultdict(set)
-    for fp in sorted(d.glob("*.json")):
-        try:
-            with open(fp, encoding="utf-8") as f:
-                data = json.load(f)
-            research_date = data.get("date", "")
-            research_type = data.get("research_type", "")
-            target = data.get("target", "")
-            if not target:
-                continue
-
-            # For stock/business, also merge the Stock node
-            if research_type in ("stock", "business"):
-                merge_stock(symbol=target, name=data.get("name", ""))
-
-            # KIK-420: Generate embedding
-            summary_text = ""
-            emb = None
-            if HAS_EMBEDDING:
-                try:
-                    summary_text = summary_builder.build_research_summary(
-                        research_type, target, data)
-                    emb = _get_embedding(summary_text)
-                except Exception:
-                    pass
-
-            merge_research_full(
-                research_date=research_date,
-                research_type=research_type,
-                target=target,
-                summary=data.get("summary", ""),
-                grok_research=data.get("grok_research"),
-                x_sentiment=data.get("x_sentiment"),
-                news=data.get("news"),
-                semantic_summary=summary_text,
-                embedding=emb,
-            )
-            targets[research_type].add(target)
-            count += 1
-        except (json.JSONDecodeError, OSError):
+    seen_stocks: dict[str, dict] = {}
+    for _, data in _iter_json(d):
+        research_date = data.get("date", "")
+        research_type = data.get("research_type", "")
+        target = data.get("target", "")
+        if not target:
             continue
 
+        # For stock/business, also merge the Stock node
+        for sym, meta in _research_stock_rows(data):
+            _collect_stock(seen_stocks, sym, **meta)
+
+        # KIK-420: Generate embedding
+        summary_text = ""
+        emb = None
+        if HAS_EMBEDDING:
+            try:
+                summary_text = summary_builder.build_research_summary(
+                    research_type, target, data)
+                emb = _get_embedding(summary_text)
+            except Exception:
+                pass
+
+        merge_research_full(
+            research_date=research_date,
+            research_type=research_type,
+            target=target,
+            summary=data.get("summary", ""),
+            grok_research=data.get("grok_research"),
+            x_sentiment=data.get("x_sentiment"),
+            news=data.get("news"),
+            semantic_summary=summary_text,
+            embedding=emb,
+        )
+        targets[research_type].add(target)
+        count += 1
+    if merge_stocks:
+        bulk_merge_stocks(list(seen_stocks.values()))
+
     # Build SUPERSEDES chains for each unique type+target
     for rtype, target_set in targets.items():
         for t in target_set:
@@ -307,79 +418,64 @@ def import_market_context(history_dir: str) -> int:
     if not d.exists():
         return 0
     count = 0
-    for fp in sorted(d.glob("*.json")):
-        try:
-            with open(fp, encoding="utf-8") as f:
-                data = json.load(f)
-            context_date = data.get("date", "")
-            if not context_date:
-                continue
-            indices = data.get("indices", [])
-
-            # KIK-420: Generate embedding
-            summary_text = ""
-            emb = None
-            if HAS_EMBEDDING:
-                try:
-                    summary_text = summary_builder.build_market_context_summary(
-                        context_date, indices, data.get("grok_research"))
-                    emb = _get_embedding(summary_text)
-                except Exception:
-                    pass
-
-            merge_market_context_full(
-                context_date=context_date, indices=indices,
-                grok_research=data.get("grok_research"),
-                semantic_summary=summary_text,
-                embedding=emb,
-            )
-            count += 1
-        except (json.JSONDecodeError, OSError):
+    for _, data in _iter_json(d):
+        context_date = data.get("date", "")
+        if not context_date:
             continue
+        indices = data.get("indices", [])
+
+        # KIK-420: Generate embedding
+        summary_text = ""
+        emb = None
+        if HAS_EMBEDDING:
+            try:
+                summary_text = summary_builder.build_market_context_summary(
+                    context_date, indices, data.get("grok_research"))
+                emb = _get_embedding(summary_text)
+            except Exception:
+                pass
+
+        merge_market_context_full(
+            context_date=context_date, indices=indices,
+            grok_research=data.get("grok_research"),
+            semantic_summary=summary_text,
+            embedding=emb,
+        )
+        count += 1
     return count
 
 
 def import_notes(notes_dir: str) -> int:
-    """Import note files."""
-    d = Path(notes_dir)
-    if not d.exists():
-        return 0
+    """Import note files (per-day JSONL and legacy per-note JSON)."""
     count = 0
-    for fp in sorted(d.glob("*.json")):
-        try:
-            with open(fp, encoding="utf-8") as f:
-                data = json.load(f)
-            notes = data if isinstance(data, list) else [data]
-            for note in notes:
-                note_id = note.get("id", "")
-                if not note_id:
-                    continue
-                # KIK-420: Generate embedding
-                summary_text = ""
-                emb = None
-                if HAS_EMBEDDING:
-                    try:
-                        summary_text = summary_builder.build_note_summary(
-                            note.get("symbol", ""),
-                            note.get("type", "observation"),
-                            note.get("content", ""))
-                        emb = _get_embedding(summary_text)
-                    except Exception:
-                        pass
-
-                merge_note(
-                    note_id=note_id,
-                    note_date=note.get("date", ""),
-                    note_type=note.get("type", "observation"),
-                    content=note.get("content", ""),
-                    symbol=note.get("symbol"),
-                    source=note.get("source", ""),
-                    semantic_summary=summary_text,
-                    embedding=emb,
-                )
-                count += 1
-        except (json.JSONDecodeError, OSError):
+    for note in iter_notes(base_dir=notes_dir):
+        note_id = note.get("id", "")
+        if not note_id:
             continue
+        # KIK-420: Generate embedding
+        summary_text = ""
+        emb = None
+        if HAS_EMBEDDING:
+            try:
+                summary_text = summary_builder.build_note_summary(
+                    note.get("symbol", ""),
+                    note.get("type", "observation"),
+                    note.get("content", ""))
+                emb = _get_embedding(summary_text)
+            except Exception:
+                pass
+
+        merge_note(
+            note_id=note_id,
+            note_date=note.get("date", ""),
+            note_type=note.get("type", "observation"),
+            content=note.get("content", ""),
+            symbol=note.get("symbol"),
+            source=note.get("source", ""),
+            semantic_summary=summary_text,
+            embedding=emb,
+        )
+        count += 1
     return count
 
 
@@ -390,6 +486,7 @@ def import_portfolio(csv_path: str) -> int:
         return 0
     count = 0
     holdings = []
+    seen_stocks: dict[str, dict] = {}
     try:
         with open(p, encoding="utf-8") as f:
             reader = csv.DictReader(f)
@@ -397,11 +494,12 @@ def import_portfolio(csv_path: str) -> int:
                 symbol = row.get("symbol", "")
                 if not symbol or symbol.upper().endswith(".CASH"):
                     continue
-                merge_stock(symbol=symbol, name=row.get("memo", ""))
+                _collect_stock(seen_stocks, symbol, name=row.get("memo", ""))
                 holdings.append(row)
                 count += 1
     except (OSError, csv.Error):
         pass
+    bulk_merge_stocks(list(seen_stocks.values()))
 
     # KIK-414: Sync Portfolio→HOLDS→Stock relationships
     if holdings:
@@ -419,127 +517,177 @@ def import_watchlists(watchlists_dir: str) -> int:
     if not d.exists():
         return 0
     count = 0
-    for fp in sorted(d.glob("*.json")):
-        try:
-            with open(fp, encoding="utf-8") as f:
-                symbols = json.load(f)
-            if not isinstance(symbols, list):
-                continue
-            # Filter empty symbols
-            symbols = [s for s in symbols if s]
-            if not symbols:
-                continue
-            name = fp.stem  # filename without extension
-            for sym in symbols:
-                merge_stock(symbol=sym)
-            summary_text = ""
-            emb = None
-            if HAS_EMBEDDING:
-                try:
-                    summary_text = summary_builder.build_watchlist_summary(
-                        name, symbols)
-                    emb = _get_embedding(summary_text)
-                except Exception:
-                    pass
-            merge_watchlist(name, symbols,
-                            semantic_summary=summary_text, embedding=emb)
-            count += 1
-        except (json.JSONDecodeError, OSError):
+    seen_stocks: dict[str, dict] = {}
+    for fp, symbols in _iter_json(d):
+        if not isinstance(symbols, list):
             continue
+        # Filter empty symbols
+        symbols = [s for s in symbols if s]
+        if not symbols:
+            continue
+        name = fp.stem  # filename without extension
+        for sym in symbols:
+            _collect_stock(seen_stocks, sym)
+        summary_text = ""
+        emb = None
+        if HAS_EMBEDDING:
+            try:
+                summary_text = summary_builder.build_watchlist_summary(
+                    name, symbols)
+                emb = _get_embedding(summary_text)
+            except Exception:
+                pass
+        merge_watchlist(name, symbols,
+                        semantic_summary=summary_text, embedding=emb)
+        count += 1
+    bulk_merge_stocks(list(seen_stocks.values()))
     return count
 
 
-def import_stress_tests(history_dir: str) -> int:
+def import_stress_tests(history_dir: str, merge_stocks: bool = True) -> int:
     """Import stress test history files (KIK-428)."""
     d = Path(history_dir) / "stress_test"
     if not d.exists():
         return 0
     count = 0
-    for fp in sorted(d.glob("*.json")):
-        try:
-            with open(fp, encoding="utf-8") as f:
-                data = json.load(f)
-            test_date = data.get("date", "")
-            scenario = data.get("scenario", "")
-            symbols = data.get("symbols", [])
-            portfolio_impact = data.get("portfolio_impact", 0)
-            var_result = data.get("var_result", {})
-
-            for sym in symbols:
-                if sym:
-                    merge_stock(symbol=sym)
-
-            summary_text = ""
-            emb = None
-            if HAS_EMBEDDING:
-                try:
-                    summary_text = summary_builder.build_stress_test_summary(
-                        test_date, scenario, portfolio_impact, len(symbols))
-                    emb = _get_embedding(summary_text)
-                except Exception:
-                    pass
-
-            merge_stress_test(
-                test_date=test_date, scenario=scenario,
-                portfolio_impact=portfolio_impact, symbols=symbols,
-                var_95=var_result.get("var_95_daily", 0),
-                var_99=var_result.get("var_99_daily", 0),
-                semantic_summary=summary_text, embedding=emb,
-            )
-            count += 1
-        except (json.JSONDecodeError, OSError):
-            continue
+    seen_stocks: dict[str, dict] = {}
+    for _, data in _iter_json(d):
+        test_date = data.get("date", "")
+        scenario = data.get("scenario", "")
+        symbols = data.get("symbols", [])
+        portfolio_impact = data.get("portfolio_impact", 0)
+        var_result = data.get("var_result", {})
+
+        for sym, meta in _stress_test_stock_rows(data):
+            _collect_stock(seen_stocks, sym, **meta)
+
+        summary_text = ""
+        emb = None
+        if HAS_EMBEDDING:
+            try:
+                summary_text = summary_builder.build_stress_test_summary(
+                    test_date, scenario, portfolio_impact, len(symbols))
+                emb = _get_embedding(summary_text)
+            except Exception:
+                pass
+
+        merge_stress_test(
+            test_date=test_date, scenario=scenario,
+            portfolio_impact=portfolio_impact, symbols=symbols,
+            var_95=var_result.get("var_95_daily", 0),
+            var_99=var_result.get("var_99_daily", 0),
+            semantic_summary=summary_text, embedding=emb,
+        )
+        count += 1
+    if merge_stocks:
+        bulk_merge_stocks(list(seen_stocks.values()))
     return count
 
 
-def import_forecasts(history_dir: str) -> int:
+def import_forecasts(history_dir: str, merge_stocks: bool = True) -> int:
     """Import forecast history files (KIK-428)."""
     d = Path(history_dir) / "forecast"
     if not d.exists():
         return 0
     count = 0
-    for fp in sorted(d.glob("*.json")):
-        try:
-            with open(fp, encoding="utf-8") as f:
-                data = json.load(f)
-            forecast_date = data.get("date", "")
-            portfolio = data.get("portfolio", {})
-            positions = data.get("positions", [])
-            symbols = [p.get("symbol", "") for p in positions if p.get("symbol")]
-
-            for sym in symbols:
-                if sym:
-                    merge_stock(symbol=sym)
-
-            summary_text = ""
-            emb = None
-            if HAS_EMBEDDING:
-                try:
-                    summary_text = summary_builder.build_forecast_summary(
-                        forecast_date,
-                        portfolio.get("optimistic"),
-                        portfolio.get("base"),
-                        portfolio.get("pessimistic"),
-                        len(symbols))
-                    emb = _get_embedding(summary_text)
-                except Exception:
-                    pass
-
-            merge_forecast(
-                forecast_date=forecast_date,
-                optimistic=portfolio.get("optimistic", 0),
-                base=portfolio.get("base", 0),
-                pessimistic=portfolio.get("pessimistic", 0),
-                symbols=symbols,
-                total_value_jpy=data.get("total_value_jpy", 0),
-                semantic_summary=summary_text, embedding=emb,
-            )
-            count += 1
-        except (json.JSONDecodeError, OSError):
-            continue
+    seen_stocks: dict[str, dict] = {}
+    for _, data in _iter_json(d):
+        forecast_date = data.get("date", "")
+        portfolio = data.get("portfolio", {})
+        positions = data.get("positions", [])
+        symbols = [p.get("symbol", "") for p in positions if p.get("symbol")]
+
+        for sym, meta in _forecast_stock_rows(data):
+            _collect_stock(seen_stocks, sym, **meta)
+
+        summary_text = ""
+        emb = None
+        if HAS_EMBEDDING:
+            try:
+                summary_text = summary_builder.build_forecast_summary(
+                    forecast_date,
+                    portfolio.get("optimistic"),
+                    portfolio.get("base"),
+                    portfolio.get("pessimistic"),
+                    len(symbols))
+                emb = _get_embedding(summary_text)
+            except Exception:
+                pass
+
+        merge_forecast(
+            forecast_date=forecast_date,
+            optimistic=portfolio.get("optimistic", 0),
+            base=portfolio.get("base", 0),
+            pessimistic=portfolio.get("pessimistic", 0),
+            symbols=symbols,
+            total_value_jpy=data.get("total_value_jpy", 0),
+            semantic_summary=summary_text, embedding=emb,
+        )
+        count += 1
+    if merge_stocks:
+        bulk_merge_stocks(list(seen_stocks.values()))
+    return count
+
+
+def _run_batched(label: str, importer, path: str) -> int:
+    """Run one importer with its graph writes grouped into batched transactions.
+
+    write_batch commits through retried execute_write transactions.  Failures
+    are warned about and never raised: an importer that crashes counts as 0,
+    while lost writes keep the importer's count and report how many of its
+    graph statements failed.
+    """
+    count = None
+    try:
+        with write_batch() as batch:
+            count = importer(path)
+    except Exception as exc:
+        if count is None:
+            print(f"WARNING: {label} import failed: {exc}")
+            return 0
+        print(f"WARNING: {label}: {batch.failed}/{batch.total} graph writes failed"
+              f" ({exc.__cause__ or exc})")
     return count
 
 
+def import_history(history_dir: str, max_workers: int = _MAX_WORKERS) -> dict[str, int]:
+    """Run all history importers concurrently.
+
+    Every Stock node the history refers to is MERGEd first, in one bulk
+    pass, so the concurrent importers never create or update the same Stock
+    node; they only attach their own nodes to it.  If that pass cannot write
+    every Stock, the importers run serially and merge their own Stock rows.
+
+    Returns a dict of importer label -> imported count, in display order.
+    Failures are reported by _run_batched without aborting the others.
+    """
+    stocks = collect_history_stocks(history_dir)
+    stocks_merged = bulk_merge_stocks(stocks) == len(stocks)
+    if not stocks_merged:
+        print("WARNING: Stock pre-pass incomplete; importing history serially")
+        max_workers = 1
+    own_stocks = not stocks_merged
+    importers = [
+        ("Screens", partial(import_screens, merge_stocks=own_stocks)),
+        ("Reports", partial(import_reports, merge_stocks=own_stocks)),
+        ("Trades", partial(import_trades, merge_stocks=own_stocks)),
+        ("Health", import_health),
+        ("Research", partial(import_research, merge_stocks=own_stocks)),
+        ("MarketContext", import_market_context),
+        ("StressTests", partial(import_stress_tests, merge_stocks=own_stocks)),
+        ("Forecasts", partial(import_forecasts, merge_stocks=own_stocks)),
+    ]
+    counts = {label: 0 for label, _ in importers}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_run_batched, label, fn, history_dir): label
+            for label, fn in importers
+        }
+        for future in as_completed(futures):
+            counts[futures[future]] = future.result()
+    return counts
+
+
 def main():
     parser = argparse.ArgumentParser(description="Initialize Neo4j knowledge graph")
     parser.add_argument("--history-dir", default="data/history")
@@ -602,39 +750,30 @@ def main():
         print("ERROR: Failed to create schema.")
         sys.exit(1)
     print("Schema initialized.")
+    constraints = list_constraints()
+    if "stock_symbol" in constraints:
+        print(f"Constraints verified: {len(constraints)} (stock_symbol present)")
+    else:
+        print("WARNING: stock_symbol constraint not found; Stock MERGE will scan")
 
     print(f"\nImporting history from {args.history_dir}...")
-    screens = import_screens(args.history_dir)
-    reports = import_reports(args.history_dir)
-    trades = import_trades(args.history_dir)
-    health = import_health(args.history_dir)
-    research = import_research(args.history_dir)
-    market_ctx = import_market_context(args.history_dir)
-    stress_tests = import_stress_tests(args.history_dir)
-    forecasts = import_forecasts(args.history_dir)
-
-    print(f"  Screens:        {screens}")
-    print(f"  Reports:        {reports}")
-    print(f"  Trades:         {trades}")
-    print(f"  Health:         {health}")
-    print(f"  Research:       {research}")
-    print(f"  MarketContext:  {market_ctx}")
-    print(f"  StressTests:    {stress_tests}")
-    print(f"  Forecasts:      {forecasts}")
+    history = import_history(args.history_dir)
+    for label, n in history.items():
+        print(f"  {label + ':':<16}{n}")
 
     print(f"\nImporting portfolio from {args.portfolio_csv}...")
-    portfolio = import_portfolio(args.portfolio_csv)
+    portfolio = _run_batched("Portfolio", import_portfolio, args.portfolio_csv)
     print(f"  Holdings: {portfolio}")
 
     print(f"\nImporting watchlists from {args.watchlists_dir}...")
-    watchlists = import_watchlists(args.watchlists_dir)
+    watchlists = _run_batched("Watchlists", import_watchlists, args.watchlists_dir)
     print(f"  Watchlists: {watchlists}")
 
     print(f"\nImporting notes from {args.notes_dir}...")
-    notes = import_notes(args.notes_dir)
+    notes = _run_batched("Notes", import_notes, args.notes_dir)
     print(f"  Notes:    {notes}")
 
-    total = screens + reports + trades + health + research + stress_tests + forecasts + portfolio + watchlists + notes
+    total = sum(history.values()) + portfolio + watchlists + notes
     print(f"\nDone. Total {total} records imported.")
 
 
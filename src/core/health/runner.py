@@ -20,7 +20,7 @@ from src.core.health.theme import _compute_theme_exposure
 from src.core.value_trap import detect_value_trap as _detect_value_trap
 
 
-def run_health_check(csv_path: str, client) -> dict:
+def run_health_check(csv_path: str, client, portfolio: list[dict] | None = None) -> dict:
     """Run health check on all portfolio holdings.
 
     For each holding:
@@ -34,6 +34,8 @@ def run_health_check(csv_path: str, client) -> dict:
         Path to portfolio CSV.
     client
         yahoo_client module (get_price_history, get_stock_detail).
+    portfolio : list[dict] | None
+        Already-loaded positions; when given, *csv_path* is not read.
 
     Returns
     -------
@@ -44,7 +46,7 @@ def run_health_check(csv_path: str, client) -> dict:
     from src.core.portfolio.small_cap import classify_market_cap, check_small_cap_allocation
     from src.core.ticker_utils import infer_region_code
 
-    snapshot = get_snapshot(csv_path, client)
+    snapshot = get_snapshot(csv_path, client, portfolio=portfolio)
     positions = snapshot.get("positions", [])
 
     empty_summary = {
@@ -9,7 +9,7 @@ from dataclasses import asdict, dataclass, field
 from typing import Optional, Union
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """A single portfolio position.
 
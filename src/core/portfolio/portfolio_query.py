@@ -4,7 +4,8 @@ Extracted from portfolio_manager.py. Provides real-time pricing,
 P&L calculation, structural analysis, and what-if merge operations.
 """
 
-import copy
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from src.core.common import is_cash as _is_cash
@@ -20,13 +21,16 @@ from src.core.ticker_utils import (
     infer_currency as _infer_currency,
 )
 
+# Concurrent per-symbol Yahoo fetches (same cap as the screeners)
+_MAX_WORKERS = int(os.environ.get("SCREEN_MAX_WORKERS", "5"))
+
 
 # ---------------------------------------------------------------------------
 # Snapshot
 # ---------------------------------------------------------------------------
 
 
-def get_snapshot(csv_path: str, client) -> dict:
+def get_snapshot(csv_path: str, client, portfolio: list[dict] | None = None) -> dict:
     """スナップショット生成。
 
     各銘柄について:
@@ -45,6 +49,8 @@ def get_snapshot(csv_path: str, client) -> dict:
         ポートフォリオCSVのパス
     client
         yahoo_client モジュール（get_stock_info を持つ）
+    portfolio : list[dict] | None
+        読み込み済みの保有銘柄。指定時は csv_path を読まずにこれを使う
 
     Returns
     -------
@@ -59,7 +65,8 @@ def get_snapshot(csv_path: str, client) -> dict:
             "as_of": str,
         }
     """
-    portfolio = load_portfolio(csv_path)
+    if portfolio is None:
+        portfolio = load_portfolio(csv_path)
 
     if not portfolio:
         return {
@@ -85,7 +92,14 @@ def get_snapshot(csv_path: str, client) -> dict:
     else:
         fx_rates = {"JPY": 1.0}
 
-    # Fetch current prices and build position details
+    # Fetch current market data for all non-cash symbols in parallel
+    symbols = list(dict.fromkeys(
+        pos["symbol"] for pos in portfolio if not _is_cash(pos["symbol"])
+    ))
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        infos = dict(zip(symbols, executor.map(client.get_stock_info, symbols)))
+
+    # Build position details
     positions: list[dict] = []
     total_value_jpy = 0.0
     total_cost_jpy = 0.0
@@ -124,8 +138,7 @@ def get_snapshot(csv_path: str, client) -> dict:
             })
             continue
 
-        # Get current market data
-        info = client.get_stock_info(symbol)
+        info = infos[symbol]
         current_price = None
         name = None
         sector = None
@@ -205,7 +218,9 @@ def get_snapshot(csv_path: str, client) -> dict:
 # ---------------------------------------------------------------------------
 
 
-def get_structure_analysis(csv_path: str, client) -> dict:
+def get_structure_analysis(
+    csv_path: str, client, portfolio: list[dict] | None = None
+) -> dict:
     """構造分析。PFの偏りを自動集計。
 
     各銘柄のセクター・地域・通貨をyfinanceから取得し、
@@ -219,6 +234,8 @@ def get_structure_analysis(csv_path: str, client) -> dict:
         ポートフォリオCSVのパス
     client
         yahoo_client モジュール（get_stock_info を持つ）
+    portfolio : list[dict] | None
+        読み込み済みの保有銘柄。指定時は csv_path を読まずにこれを使う
 
     Returns
     -------
@@ -239,7 +256,7 @@ def get_structure_analysis(csv_path: str, client) -> dict:
     from src.core.ticker_utils import infer_region_code
 
     # Get snapshot first (this also fetches current prices and FX rates)
-    snapshot = get_snapshot(csv_path, client)
+    snapshot = get_snapshot(csv_path, client, portfolio=portfolio)
     positions = snapshot["positions"]
 
     if not positions:
@@ -369,7 +386,7 @@ def merge_positions(
 ) -> list[dict]:
     """現在PFに提案銘柄をマージ（加重平均コスト計算）。
 
-    入力リストは変更しない（deep copy して操作）。
+    入力リストは変更しない（各ポジション dict をコピーして操作）。
 
     Parameters
     ----------
@@ -384,7 +401,8 @@ def merge_positions(
     list[dict]
         マージ後のポートフォリオ。
     """
-    merged = copy.deepcopy(current)
+    # Positions hold only scalar values, so a per-dict copy isolates the input
+    merged = [dict(p) for p in current]
     symbol_map: dict[str, int] = {
         p["symbol"].upper(): i for i, p in enumerate(merged)
     }
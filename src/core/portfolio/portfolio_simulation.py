@@ -2,26 +2,24 @@
 
 Temporarily adds/removes stocks from the portfolio and compares
 before/after metrics (snapshot, concentration, forecast, health).
-Uses a temp CSV approach to leverage existing csv_path-based functions.
+Analyses run on the in-memory merged positions; the CSV is read once.
 
 KIK-451: Added swap simulation support via --remove argument.
 """
 
-import copy
-import os
-import tempfile
-
 from src.core.portfolio.fx_utils import get_fx_rates  # KIK-511
 from src.core.portfolio.portfolio_manager import (
     get_snapshot,
     get_structure_analysis,
     load_portfolio,
     merge_positions,
-    save_portfolio,
 )
 from src.core.return_estimate import estimate_portfolio_return
 from src.core.ticker_utils import infer_currency, validate_lot_size
 
+# Whitespace is never meaningful inside SYMBOL:SHARES[:PRICE] entries
+_STRIP_WS = str.maketrans("", "", " \t\r\n")
+
 
 def parse_add_arg(add_str: str) -> list[dict]:
     """Parse --add argument into a list of proposed positions.
@@ -43,11 +41,12 @@ def parse_add_arg(add_str: str) -> list[dict]:
     ValueError
         If format is invalid.
     """
-    if not add_str or not add_str.strip():
+    cleaned = add_str.translate(_STRIP_WS) if add_str else ""
+    if not cleaned:
         raise ValueError("--add の値が空です。形式: SYMBOL:SHARES:PRICE")
 
     results: list[dict] = []
-    entries = [e.strip() for e in add_str.split(",") if e.strip()]
+    entries = [e for e in cleaned.split(",") if e]
 
     for entry in entries:
         parts = entry.split(":")
@@ -56,15 +55,15 @@ def parse_add_arg(add_str: str) -> list[dict]:
                 f"不正な形式: '{entry}' — SYMBOL:SHARES:PRICE の形式で指定してください"
             )
 
-        symbol = parts[0].strip()
+        symbol = parts[0]
         if not symbol:
             raise ValueError(f"銘柄シンボルが空です: '{entry}'")
 
         try:
-            shares = int(parts[1].strip())
+            shares = int(parts[1])
         except ValueError:
             raise ValueError(
-                f"株数が不正です: '{parts[1].strip()}' in '{entry}'"
+                f"株数が不正です: '{parts[1]}' in '{entry}'"
             )
         if shares <= 0:
             raise ValueError(
@@ -74,10 +73,10 @@ def parse_add_arg(add_str: str) -> list[dict]:
         validate_lot_size(shares, symbol)
 
         try:
-            price = float(parts[2].strip())
+            price = float(parts[2])
         except ValueError:
             raise ValueError(
-                f"価格が不正です: '{parts[2].strip()}' in '{entry}'"
+                f"価格が不正です: '{parts[2]}' in '{entry}'"
             )
         if price <= 0:
             raise ValueError(
@@ -117,11 +116,12 @@ def parse_remove_arg(remove_str: str) -> list[dict]:
     ValueError
         If format is invalid, symbol is empty, or shares is not a positive integer.
     """
-    if not remove_str or not remove_str.strip():
+    cleaned = remove_str.translate(_STRIP_WS) if remove_str else ""
+    if not cleaned:
         raise ValueError("--remove の値が空です。形式: SYMBOL:SHARES")
 
     results: list[dict] = []
-    entries = [e.strip() for e in remove_str.split(",") if e.strip()]
+    entries = [e for e in cleaned.split(",") if e]
 
     for entry in entries:
         parts = entry.split(":")
@@ -130,15 +130,15 @@ def parse_remove_arg(remove_str: str) -> list[dict]:
                 f"不正な形式: '{entry}' — SYMBOL:SHARES の形式で指定してください（価格不要）"
             )
 
-        symbol = parts[0].strip()
+        symbol = parts[0]
         if not symbol:
             raise ValueError(f"銘柄シンボルが空です: '{entry}'")
 
         try:
-            shares = int(parts[1].strip())
+            shares = int(parts[1])
         except ValueError:
             raise ValueError(
-                f"株数が不正です: '{parts[1].strip()}' in '{entry}'"
+                f"株数が不正です: '{parts[1]}' in '{entry}'"
             )
         if shares <= 0:
             raise ValueError(
@@ -156,7 +156,7 @@ def remove_positions(current: list[dict], removals: list[dict]) -> list[dict]:
     """Remove specified shares from the current portfolio (simulation only).
 
     Does not modify the original portfolio CSV.
-    Input lists are not mutated (deep copy).
+    Input lists are not mutated (each position dict is copied).
 
     Parameters
     ----------
@@ -176,7 +176,7 @@ def remove_positions(current: list[dict], removals: list[dict]) -> list[dict]:
         If a removal symbol is not found in current, or if removal shares
         exceed held shares.
     """
-    merged = copy.deepcopy(current)
+    merged = [dict(p) for p in current]
     symbol_map: dict[str, int] = {
         p["symbol"].upper(): i for i, p in enumerate(merged)
     }
@@ -194,7 +194,6 @@ def remove_positions(current: list[dict], removals: list[dict]) -> list[dict]:
                 f"保有数を超えています: {removal['symbol']} 保有 {held} 株に対して "
                 f"{removal['shares']} 株の売却を指定"
             )
-        merged[idx] = dict(merged[idx])
         merged[idx]["shares"] = held - removal["shares"]
 
     return [p for p in merged if p["shares"] > 0]
@@ -403,8 +402,8 @@ def run_what_if_simulation(
 ) -> dict:
     """Run What-If simulation comparing before/after portfolio metrics.
 
-    Uses a temp CSV file to leverage existing csv_path-based analysis
-    functions without modifying the original portfolio.
+    The merged portfolio is handed to the analysis functions in memory,
+    so the original CSV is never modified.
 
     Parameters
     ----------
@@ -432,9 +431,9 @@ def run_what_if_simulation(
     current = load_portfolio(csv_path)
 
     # 2. Before analysis (uses cache for subsequent calls)
-    before_snapshot = get_snapshot(csv_path, client)
-    before_structure = get_structure_analysis(csv_path, client)
-    before_forecast = estimate_portfolio_return(csv_path, client)
+    before_snapshot = get_snapshot(csv_path, client, portfolio=current)
+    before_structure = get_structure_analysis(csv_path, client, portfolio=current)
+    before_forecast = estimate_portfolio_return(csv_path, client, portfolio=current)
     before_metrics = _extract_metrics(
         before_snapshot, before_structure, before_forecast
     )
@@ -448,102 +447,83 @@ def run_what_if_simulation(
     # 4. Merge proposed into after_current
     merged = merge_positions(after_current, proposed)
 
-    # 5. Write to temp CSV
-    temp_fd, temp_path = tempfile.mkstemp(suffix=".csv", prefix="whatif_")
-    os.close(temp_fd)
+    # 5. After analysis on the in-memory merge (new stocks will need API
+    #    calls, existing stocks hit yahoo_client's 24h cache)
+    after_snapshot = get_snapshot(csv_path, client, portfolio=merged)
+    after_structure = get_structure_analysis(csv_path, client, portfolio=merged)
+    after_forecast = estimate_portfolio_return(csv_path, client, portfolio=merged)
+    after_metrics = _extract_metrics(
+        after_snapshot, after_structure, after_forecast
+    )
 
+    # 6. Health check on proposed stocks only
+    proposed_health: list[dict] = []
     try:
-        save_portfolio(merged, temp_path)
-
-        # 6. After analysis (new stocks will need API calls,
-        #    existing stocks hit yahoo_client's 24h cache)
-        after_snapshot = get_snapshot(temp_path, client)
-        after_structure = get_structure_analysis(temp_path, client)
-        after_forecast = estimate_portfolio_return(temp_path, client)
-        after_metrics = _extract_metrics(
-            after_snapshot, after_structure, after_forecast
-        )
+        from src.core.health_check import run_health_check
+
+        health_data = run_health_check(csv_path, client, portfolio=merged)
+        proposed_symbols = {
+            p["symbol"].upper() for p in proposed
+        }
+        for pos in health_data.get("positions", []):
+            if pos.get("symbol", "").upper() in proposed_symbols:
+                proposed_health.append(pos)
+    except ImportError:
+        pass
+
+    # 7. FX rates and required cash
+    fx_rates = before_snapshot.get("fx_rates", {"JPY": 1.0})
+    required_cash = _compute_required_cash(proposed, fx_rates)
+
+    # 8. (KIK-451) Proceeds and removed-stock health check
+    removed_health: list[dict] = []
+    proceeds = 0.0
+    enriched_removals: list[dict] | None = None
 
-        # 7. Health check on proposed stocks only
-        proposed_health: list[dict] = []
-        try:
-            from src.core.health_check import run_health_check
-
-            health_data = run_health_check(temp_path, client)
-            proposed_symbols = {
-                p["symbol"].upper() for p in proposed
-            }
-            for pos in health_data.get("positions", []):
-                if pos.get("symbol", "").upper() in proposed_symbols:
-                    proposed_health.append(pos)
-        except ImportError:
-            pass
-
-        # 8. FX rates and required cash
-        fx_rates = before_snapshot.get("fx_rates", {"JPY": 1.0})
-        required_cash = _compute_required_cash(proposed, fx_rates)
-
-        # 9. (KIK-451) Proceeds and removed-stock health check
-        removed_health: list[dict] = []
-        proceeds = 0.0
-        enriched_removals: list[dict] | None = None
-
-        if removals:
-            snapshot_positions = before_snapshot.get("positions", [])
-            proceeds = _compute_proceeds(removals, snapshot_positions)
-
-            # Enrich each removal with its per-stock proceeds for the formatter
-            pos_map = {p["symbol"].upper(): p for p in snapshot_positions}
-            enriched_removals = []
-            for rem in removals:
-                rem_copy = dict(rem)
-                pos = pos_map.get(rem["symbol"].upper(), {})
-                held = pos.get("shares", 0)
-                if held > 0:
-                    ratio = min(rem["shares"] / held, 1.0)
-                    rem_copy["proceeds_jpy"] = ratio * pos.get("evaluation_jpy", 0.0)
-                else:
-                    rem_copy["proceeds_jpy"] = 0.0
-                enriched_removals.append(rem_copy)
-
-            # Health check for removed stocks via temporary CSV
-            removal_portfolio = [
-                p for p in current
-                if p["symbol"].upper() in {r["symbol"].upper() for r in removals}
-            ]
-            if removal_portfolio:
-                rem_fd, rem_path = tempfile.mkstemp(
-                    suffix=".csv", prefix="whatif_rem_"
+    if removals:
+        snapshot_positions = before_snapshot.get("positions", [])
+        proceeds = _compute_proceeds(removals, snapshot_positions)
+
+        # Enrich each removal with its per-stock proceeds for the formatter
+        pos_map = {p["symbol"].upper(): p for p in snapshot_positions}
+        enriched_removals = []
+        for rem in removals:
+            rem_copy = dict(rem)
+            pos = pos_map.get(rem["symbol"].upper(), {})
+            held = pos.get("shares", 0)
+            if held > 0:
+                ratio = min(rem["shares"] / held, 1.0)
+                rem_copy["proceeds_jpy"] = ratio * pos.get("evaluation_jpy", 0.0)
+            else:
+                rem_copy["proceeds_jpy"] = 0.0
+            enriched_removals.append(rem_copy)
+
+        # Health check for removed stocks only
+        removal_portfolio = [
+            p for p in current
+            if p["symbol"].upper() in {r["symbol"].upper() for r in removals}
+        ]
+        if removal_portfolio:
+            try:
+                from src.core.health_check import run_health_check
+
+                rem_health_data = run_health_check(
+                    csv_path, client, portfolio=removal_portfolio
                 )
-                os.close(rem_fd)
-                try:
-                    save_portfolio(removal_portfolio, rem_path)
-                    try:
-                        from src.core.health_check import run_health_check
-
-                        rem_health_data = run_health_check(rem_path, client)
-                        removal_symbols = {
-                            r["symbol"].upper() for r in removals
-                        }
-                        for pos in rem_health_data.get("positions", []):
-                            if pos.get("symbol", "").upper() in removal_symbols:
-                                removed_health.append(pos)
-                    except ImportError:
-                        pass
-                finally:
-                    if os.path.exists(rem_path):
-                        os.remove(rem_path)
-
-        # 10. Judgment
-        judgment = _compute_judgment(
-            before_metrics, after_metrics, proposed_health,
-            removed_health=removed_health if removals else None,
-        )
-
-    finally:
-        # 11. Cleanup main temp CSV
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
+                removal_symbols = {
+                    r["symbol"].upper() for r in removals
+                }
+                for pos in rem_health_data.get("positions", []):
+                    if pos.get("symbol", "").upper() in removal_symbols:
+                        removed_health.append(pos)
+            except ImportError:
+                pass
+
+    # 9. Judgment
+    judgment = _compute_judgment(
+        before_metrics, after_metrics, proposed_health,
+        removed_health=removed_health if removals else None,
+    )
 
     result: dict = {
         "proposed": proposed,
@@ -10,6 +10,8 @@ but portfolio-level estimation does not call Grok API (KIK-369).
 """
 
 import math
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from src.core.common import is_etf as _is_etf_base
@@ -25,6 +27,9 @@ except ImportError:
 RETURN_CAP = th("estimate", "return_cap", 0.30)
 MIN_SPREAD = th("estimate", "min_spread", 0.05)
 
+# Concurrent per-symbol Yahoo fetches (same cap as the screeners)
+_MAX_WORKERS = int(os.environ.get("SCREEN_MAX_WORKERS", "5"))
+
 
 
 def _use_historical_method(stock_detail: dict) -> bool:
@@ -311,7 +316,9 @@ def estimate_stock_return(
     }
 
 
-def estimate_portfolio_return(csv_path: str, yahoo_client_module) -> dict:
+def estimate_portfolio_return(
+    csv_path: str, yahoo_client_module, portfolio: list[dict] | None = None
+) -> dict:
     """Estimate returns for the entire portfolio.
 
     Fetches detailed data for each position, computes per-stock estimates,
@@ -323,6 +330,8 @@ def estimate_portfolio_return(csv_path: str, yahoo_client_module) -> dict:
         Path to portfolio CSV.
     yahoo_client_module
         The yahoo_client module (for get_stock_detail, get_stock_news).
+    portfolio : list[dict] | None
+        Already-loaded positions; when given, *csv_path* is not read.
 
     Returns
     -------
@@ -342,7 +351,8 @@ def estimate_portfolio_return(csv_path: str, yahoo_client_module) -> dict:
     from src.core.portfolio.fx_utils import get_fx_rates  # KIK-511
     from src.core.ticker_utils import infer_currency as _infer_currency
 
-    portfolio = load_portfolio(csv_path)
+    if portfolio is None:
+        portfolio = load_portfolio(csv_path)
     if not portfolio:
         return {
             "positions": [],
@@ -354,6 +364,17 @@ def estimate_portfolio_return(csv_path: str, yahoo_client_module) -> dict:
     # Fetch FX rates
     fx_rates = get_fx_rates(yahoo_client_module)
 
+    # Fetch detail, then news for symbols with a price, in parallel; the
+    # per-symbol Yahoo calls are network-bound and have no batch endpoint
+    symbols = list(dict.fromkeys(
+        pos["symbol"] for pos in portfolio
+        if not pos["symbol"].upper().endswith(".CASH")
+    ))
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        details = dict(zip(symbols, executor.map(yahoo_client_module.get_stock_detail, symbols)))
+        priced = [s for s in symbols if details[s] is not None and details[s].get("price")]
+        news_by_symbol = dict(zip(priced, executor.map(yahoo_client_module.get_stock_news, priced)))
+
     # Process each position
     position_estimates = []
     for pos in portfolio:
@@ -390,7 +411,7 @@ def estimate_portfolio_return(csv_path: str, yahoo_client_module) -> dict:
             continue
 
         # Get detailed stock data (includes analyst fields)
-        stock_detail = yahoo_client_module.get_stock_detail(symbol)
+        stock_detail = details[symbol]
         if stock_detail is None or not stock_detail.get("price"):
             position_estimates.append({
                 "symbol": symbol,
@@ -418,7 +439,7 @@ def estimate_portfolio_return(csv_path: str, yahoo_client_module) -> dict:
             continue
 
         # Get news
-        news = yahoo_client_module.get_stock_news(symbol)
+        news = news_by_symbol[symbol]
 
         # X sentiment: always None in portfolio context (KIK-369).
         # Grok API is reserved for /market-research individual deep-dives.
@@ -19,14 +19,20 @@ from src.core.common import safe_float as _safe_float
 # ---------------------------------------------------------------------------
 
 def _compute_daily_returns(prices: list[float]) -> list[float]:
-    """Compute daily returns from a list of closing prices."""
+    """Compute daily returns from a list of closing prices.
+
+    Single vectorized pass; days whose previous close is zero are skipped.
+    """
     if len(prices) < 2:
         return []
-    returns = []
-    for i in range(1, len(prices)):
-        if prices[i - 1] != 0:
-            returns.append((prices[i] - prices[i - 1]) / prices[i - 1])
-    return returns
+    arr = np.asarray(prices, dtype=np.float64)
+    prev = arr[:-1]
+    # Common case: no zero closes. ndarray.all() reduces in place without
+    # materializing a boolean mask, so the masked path only runs when needed.
+    if prev.all():
+        return ((arr[1:] - prev) / prev).tolist()
+    valid = prev != 0
+    return ((arr[1:][valid] - prev[valid]) / prev[valid]).tolist()
 
 
 # ---------------------------------------------------------------------------
@@ -52,25 +58,27 @@ def compute_correlation_matrix(portfolio_data: list[dict]) -> dict:
     symbols = [s.get("symbol", "?") for s in portfolio_data]
     n = len(symbols)
 
-    # Compute daily returns for each stock
-    returns_map: dict[str, list[float]] = {}
+    # Compute daily returns for each stock (converted to an array once, not per pair)
+    returns_map: dict[str, np.ndarray] = {}
     for stock in portfolio_data:
         sym = stock.get("symbol", "?")
         prices = stock.get("price_history", [])
-        returns_map[sym] = _compute_daily_returns(prices)
+        returns_map[sym] = np.asarray(_compute_daily_returns(prices), dtype=np.float64)
+
+    empty = np.empty(0, dtype=np.float64)
 
     # Build correlation matrix
     matrix = [[0.0] * n for _ in range(n)]
     for i in range(n):
         matrix[i][i] = 1.0
         for j in range(i + 1, n):
-            r_i = returns_map.get(symbols[i], [])
-            r_j = returns_map.get(symbols[j], [])
+            r_i = returns_map.get(symbols[i], empty)
+            r_j = returns_map.get(symbols[j], empty)
 
             min_len = min(len(r_i), len(r_j))
             if min_len >= 30:
-                arr_i = np.array(r_i[-min_len:])
-                arr_j = np.array(r_j[-min_len:])
+                arr_i = r_i[-min_len:]
+                arr_j = r_j[-min_len:]
                 if np.std(arr_i) == 0 or np.std(arr_j) == 0:
                     corr = 0.0
                 else:
@@ -1,11 +1,18 @@
 """AlphaScreener: value + change quality + pullback multi-axis screening."""
 
+import heapq
+import os
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Optional
+
 from src.core.screening.alpha import compute_change_score
-from src.core.screening.indicators import calculate_value_score
 from src.core.screening.query_builder import build_query, load_preset
 from src.core.screening.query_screener import QueryScreener
 from src.core.screening.technicals import detect_pullback_in_uptrend
 
+_MAX_WORKERS = int(os.environ.get("SCREEN_MAX_WORKERS", "5"))
+
 
 class AlphaScreener:
     """Alpha signal screener: value + change quality + pullback.
@@ -15,11 +22,103 @@ class AlphaScreener:
       Step 2: Change quality check (alpha.py) - 3/4 conditions must pass
       Step 3: Pullback-in-uptrend technical filter (optional enrichment)
       Step 4: 2-axis scoring (value_score + change_score = 200pt max)
+
+    Steps 2-4 run fused per stock in a thread pool (see _score_one_stock),
+    highest value_score first; stocks that cannot reach top_n are skipped.
     """
 
+    # Upper bounds used to skip stocks that cannot reach top_n
+    _MAX_CHANGE_SCORE = 100.0
+    _MAX_PULLBACK_BONUS = 10.0
+
     def __init__(self, yahoo_client):
         self.yahoo_client = yahoo_client
 
+    def _check_change_quality(self, stock: dict) -> Optional[dict]:
+        """Fetch detail and attach change score fields (Step 2, one stock).
+
+        Returns the stock dict when quality_pass (3/4 conditions), else None.
+        """
+        detail = self.yahoo_client.get_stock_detail(stock["symbol"])
+        if detail is None:
+            return None
+
+        change_result = compute_change_score(detail)
+
+        # 3/4 conditions must pass (quality_pass)
+        if not change_result.get("quality_pass"):
+            return None
+
+        # Attach change score data
+        stock["change_score"] = change_result["change_score"]
+        stock["accruals_score"] = change_result["accruals"]["score"]
+        stock["accruals_raw"] = change_result["accruals"]["raw"]
+        stock["rev_accel_score"] = change_result["revenue_acceleration"]["score"]
+        stock["rev_accel_raw"] = change_result["revenue_acceleration"]["raw"]
+        stock["fcf_yield_score"] = change_result["fcf_yield"]["score"]
+        stock["fcf_yield_raw"] = change_result["fcf_yield"]["raw"]
+        stock["roe_trend_score"] = change_result["roe_trend"]["score"]
+        stock["roe_trend_raw"] = change_result["roe_trend"]["raw"]
+        stock["quality_passed_count"] = change_result["passed_count"]
+        return stock
+
+    def _attach_pullback(self, stock: dict) -> None:
+        """Attach pullback_match and technical fields to a stock (Step 3, one stock)."""
+        symbol = stock["symbol"]
+        try:
+            hist = self.yahoo_client.get_price_history(symbol)
+            if hist is not None and not hist.empty:
+                tech_result = detect_pullback_in_uptrend(hist)
+                if tech_result is not None:
+                    all_conditions = tech_result.get("all_conditions")
+                    bounce_score = tech_result.get("bounce_score", 0)
+
+                    if all_conditions:
+                        stock["pullback_match"] = "full"
+                    elif (
+                        bounce_score >= 30
+                        and tech_result.get("uptrend")
+                        and tech_result.get("is_pullback")
+                    ):
+                        stock["pullback_match"] = "partial"
+                    else:
+                        stock["pullback_match"] = "none"
+
+                    stock["pullback_pct"] = tech_result.get("pullback_pct")
+                    stock["rsi"] = tech_result.get("rsi")
+                    stock["bounce_score"] = bounce_score
+                else:
+                    stock["pullback_match"] = "none"
+            else:
+                stock["pullback_match"] = "none"
+        except Exception:
+            stock["pullback_match"] = "none"
+
+    def _score_one_stock(self, stock: dict) -> Optional[dict]:
+        """Run Steps 2-4 for a single stock in one pass.
+
+        Returns the scored stock dict, or None when the change quality
+        gate rejects it (the price history is then never fetched).
+        """
+        if self._check_change_quality(stock) is None:
+            return None
+
+        # Step 3: Pullback check (optional enrichment, not a hard filter)
+        self._attach_pullback(stock)
+
+        # Step 4: 2-axis scoring
+        total_score = stock.get("value_score", 0) + stock.get("change_score", 0)  # 200pt max
+
+        # Pullback bonus: full=+10, partial=+5
+        pullback_match = stock.get("pullback_match", "none")
+        if pullback_match == "full":
+            total_score += 10
+        elif pullback_match == "partial":
+            total_score += 5
+
+        stock["total_score"] = total_score
+        return stock
+
     def screen(
         self,
         region: str = "jp",
@@ -41,94 +140,48 @@ class AlphaScreener:
             return []
 
         # Normalize and score
-        fundamentals = []
-        for quote in raw_quotes:
-            normalized = QueryScreener._normalize_quote(quote)
-            normalized["value_score"] = calculate_value_score(normalized)
-            fundamentals.append(normalized)
-
-        # Step 2: Change quality check (requires get_stock_detail)
-        quality_passed = []
-        for stock in fundamentals:
-            symbol = stock.get("symbol")
-            if not symbol:
-                continue
-
-            detail = self.yahoo_client.get_stock_detail(symbol)
-            if detail is None:
-                continue
-
-            change_result = compute_change_score(detail)
-
-            # 3/4 conditions must pass (quality_pass)
-            if not change_result.get("quality_pass"):
-                continue
-
-            # Attach change score data
-            stock["change_score"] = change_result["change_score"]
-            stock["accruals_score"] = change_result["accruals"]["score"]
-            stock["accruals_raw"] = change_result["accruals"]["raw"]
-            stock["rev_accel_score"] = change_result["revenue_acceleration"]["score"]
-            stock["rev_accel_raw"] = change_result["revenue_acceleration"]["raw"]
-            stock["fcf_yield_score"] = change_result["fcf_yield"]["score"]
-            stock["fcf_yield_raw"] = change_result["fcf_yield"]["raw"]
-            stock["roe_trend_score"] = change_result["roe_trend"]["score"]
-            stock["roe_trend_raw"] = change_result["roe_trend"]["raw"]
-            stock["quality_passed_count"] = change_result["passed_count"]
-            quality_passed.append(stock)
-
-        if not quality_passed:
-            return []
-
-        # Step 3: Pullback check (optional enrichment, not a hard filter)
-        for stock in quality_passed:
-            symbol = stock["symbol"]
-            try:
-                hist = self.yahoo_client.get_price_history(symbol)
-                if hist is not None and not hist.empty:
-                    tech_result = detect_pullback_in_uptrend(hist)
-                    if tech_result is not None:
-                        all_conditions = tech_result.get("all_conditions")
-                        bounce_score = tech_result.get("bounce_score", 0)
-
-                        if all_conditions:
-                            stock["pullback_match"] = "full"
-                        elif (
-                            bounce_score >= 30
-                            and tech_result.get("uptrend")
-                            and tech_result.get("is_pullback")
-                        ):
-                            stock["pullback_match"] = "partial"
-                        else:
-                            stock["pullback_match"] = "none"
-
-                        stock["pullback_pct"] = tech_result.get("pullback_pct")
-                        stock["rsi"] = tech_result.get("rsi")
-                        stock["bounce_score"] = bounce_score
-                    else:
-                        stock["pullback_match"] = "none"
-                else:
-                    stock["pullback_match"] = "none"
-            except Exception:
-                stock["pullback_match"] = "none"
-
-        # Step 4: 2-axis scoring
-        results = []
-        for stock in quality_passed:
-            value_score = stock.get("value_score", 0)
-            change_score = stock.get("change_score", 0)
-            total_score = value_score + change_score  # 200pt max
-
-            # Pullback bonus: full=+10, partial=+5
-            pullback_match = stock.get("pullback_match", "none")
-            if pullback_match == "full":
-                total_score += 10
-            elif pullback_match == "partial":
-                total_score += 5
-
-            stock["total_score"] = total_score
-            results.append(stock)
-
-        # Sort by total_score descending
-        results.sort(key=lambda r: r.get("total_score", 0), reverse=True)
-        return results[:top_n]
+        fundamentals = QueryScreener._normalize_quotes(raw_quotes)
+
+        # Steps 2-4 fused per stock (parallel), in waves ordered by value_score.
+        # total_score <= value_score + max change + max pullback bonus, so once
+        # that bound drops below the current top_n floor no later stock can
+        # rank and its detail/history fetches are skipped.
+        candidates = [stock for stock in fundamentals if stock.get("symbol")]
+        order = sorted(
+            range(len(candidates)),
+            key=lambda i: candidates[i]["value_score"],
+            reverse=True,
+        )
+        max_bonus = self._MAX_CHANGE_SCORE + self._MAX_PULLBACK_BONUS
+        wave = _MAX_WORKERS * 2
+        kept: list[tuple[int, dict]] = []
+        top_scores: list[float] = []  # min-heap of the best top_n total_scores
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+            for start in range(0, len(order), wave):
+                if top_n > 0 and len(top_scores) >= top_n:
+                    bound = candidates[order[start]]["value_score"] + max_bonus
+                    if bound < top_scores[0]:
+                        break
+                futures = [
+                    (i, executor.submit(self._score_one_stock, candidates[i]))
+                    for i in order[start:start + wave]
+                ]
+                for i, future in futures:
+                    try:
+                        result = future.result()
+                    except Exception:
+                        continue  # skip failed stocks
+                    if result is None:
+                        continue
+                    kept.append((i, result))
+                    if len(top_scores) < top_n:
+                        heapq.heappush(top_scores, result["total_score"])
+                    elif top_n > 0 and result["total_score"] > top_scores[0]:
+                        heapq.heapreplace(top_scores, result["total_score"])
+
+        # Restore screen_stocks order first so ties rank as before
+        kept.sort(key=itemgetter(0))
+        results = [stock for _, stock in kept]
+
+        # Top N by total_score descending (same order as a full stable sort)
+        return heapq.nlargest(top_n, results, key=itemgetter("total_score"))
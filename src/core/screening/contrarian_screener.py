@@ -2,11 +2,11 @@
 
 import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
 from typing import Optional
 
 from src.core._thresholds import th
 from src.core.screening.contrarian import compute_contrarian_score
-from src.core.screening.indicators import calculate_value_score
 from src.core.screening.query_builder import build_query
 from src.core.screening.query_screener import QueryScreener
 
@@ -138,11 +138,7 @@ class ContrarianScreener:
             return []
 
         # Normalize
-        fundamentals: list[dict] = []
-        for quote in raw_quotes:
-            normalized = QueryScreener._normalize_quote(quote)
-            normalized["value_score"] = calculate_value_score(normalized)
-            fundamentals.append(normalized)
+        fundamentals: list[dict] = QueryScreener._normalize_quotes(raw_quotes)
 
         # Step 2: Contrarian score calculation (parallel)
         scored: list[dict] = []
@@ -164,5 +160,5 @@ class ContrarianScreener:
             return []
 
         # Step 3: Sort by contrarian_score descending
-        scored.sort(key=lambda r: r.get("contrarian_score", 0), reverse=True)
+        scored.sort(key=itemgetter("contrarian_score"), reverse=True)
         return scored[:top_n]
@@ -1,17 +1,22 @@
 """GrowthScreener: growth-oriented screening (growth/high-growth/small-cap-growth)."""
 
+import heapq
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from src.core.screening.query_builder import build_query, load_preset
 from src.core.screening.query_screener import QueryScreener
 
+_MAX_WORKERS = int(os.environ.get("SCREEN_MAX_WORKERS", "5"))
+
 
 class GrowthScreener:
     """Screen stocks for growth characteristics.
 
     Two-step pipeline:
       Step 1: EquityQuery for growth filtering (criteria from preset)
-      Step 2: Fetch stock detail for EPS/revenue growth, sort by sort_by field
+      Step 2: Fetch stock detail for EPS/revenue growth (parallel), sort by sort_by field
 
     Supports three modes via constructor parameters:
       - growth (default): EPS growth > 0 required, sorted by eps_growth
@@ -46,6 +51,37 @@ class GrowthScreener:
         self.sort_by = sort_by
         self.require_positive_eps = require_positive_eps
 
+    def _enrich_one_stock(self, stock: dict) -> Optional[dict]:
+        """Fetch detail for a single stock and build its result row.
+
+        Returns None when detail is unavailable or EPS growth is required
+        but not positive.
+        """
+        detail = self.yahoo_client.get_stock_detail(stock["symbol"])
+        if detail is None:
+            return None
+
+        eps_growth = detail.get("eps_growth")
+        if self.require_positive_eps:
+            if eps_growth is None or eps_growth <= 0:
+                return None
+
+        rev_growth = stock.get("revenue_growth") or detail.get("revenue_growth")
+
+        return {
+            "symbol": stock["symbol"],
+            "name": stock.get("name"),
+            "sector": stock.get("sector"),
+            "price": stock.get("price"),
+            "per": stock.get("per"),
+            "forward_per": stock.get("forward_per"),
+            "pbr": stock.get("pbr"),
+            "roe": stock.get("roe"),
+            "eps_growth": eps_growth,
+            "revenue_growth": rev_growth,
+            "market_cap": stock.get("market_cap"),
+        }
+
     def screen(
         self,
         region: str = "jp",
@@ -95,43 +131,23 @@ class GrowthScreener:
             return []
 
         # Normalize quotes
-        fundamentals: list[dict] = []
-        for quote in raw_quotes:
-            normalized = QueryScreener._normalize_quote(quote)
-            fundamentals.append(normalized)
+        fundamentals = QueryScreener._normalize_quotes(raw_quotes, with_value_score=False)
 
-        # Step 2: Fetch stock detail for EPS growth, sort by growth
+        # Step 2: Fetch stock detail for EPS growth (parallel), sort by growth
         results: list[dict] = []
-        for stock in fundamentals:
-            symbol = stock.get("symbol")
-            if not symbol:
-                continue
-
-            detail = self.yahoo_client.get_stock_detail(symbol)
-            if detail is None:
-                continue
-
-            eps_growth = detail.get("eps_growth")
-            if self.require_positive_eps:
-                if eps_growth is None or eps_growth <= 0:
-                    continue
-
-            rev_growth = stock.get("revenue_growth") or detail.get("revenue_growth")
-
-            results.append({
-                "symbol": symbol,
-                "name": stock.get("name"),
-                "sector": stock.get("sector"),
-                "price": stock.get("price"),
-                "per": stock.get("per"),
-                "forward_per": stock.get("forward_per"),
-                "pbr": stock.get("pbr"),
-                "roe": stock.get("roe"),
-                "eps_growth": eps_growth,
-                "revenue_growth": rev_growth,
-                "market_cap": stock.get("market_cap"),
-            })
-
-        # Sort by configured field descending
-        results.sort(key=lambda r: r.get(self.sort_by, 0) or 0, reverse=True)
-        return results[:top_n]
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(self._enrich_one_stock, stock)
+                for stock in fundamentals
+                if stock.get("symbol")
+            ]
+            for future in futures:
+                try:
+                    result = future.result()
+                    if result is not None:
+                        results.append(result)
+                except Exception:
+                    pass  # skip failed stocks
+
+        # Top N by configured field descending (same order as a full stable sort)
+        return heapq.nlargest(top_n, results, key=lambda r: r.get(self.sort_by, 0) or 0)
@@ -1,5 +1,6 @@
 """Financial indicators and value-score calculation."""
 
+from functools import lru_cache
 from typing import Optional
 
 
@@ -123,6 +124,20 @@ def calculate_value_score(stock_data: dict, thresholds: Optional[dict] = None) -
     roe = stock_data.get("returnOnEquity") or stock_data.get("roe")
     growth = stock_data.get("revenueGrowth") or stock_data.get("revenue_growth")
 
+    return _value_score_from_inputs(
+        per, pbr, div_yield, roe, growth, per_max, pbr_max, div_min, roe_min,
+    )
+
+
+@lru_cache(maxsize=8192)
+def _value_score_from_inputs(
+    per, pbr, div_yield, roe, growth, per_max, pbr_max, div_min, roe_min,
+) -> float:
+    """Pure scoring core of calculate_value_score, memoized on its inputs.
+
+    Re-screens over overlapping universes (regions, presets) repeat the
+    same fundamentals, so identical inputs are scored once per process.
+    """
     total = (
         _score_per(per, per_max)
         + _score_pbr(pbr, pbr_max)
@@ -2,6 +2,7 @@
 
 import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
 from typing import Optional
 
 from src.core.screening.query_builder import build_query
@@ -146,5 +147,5 @@ class MomentumScreener:
             return []
 
         # Step 3: Sort by surge_score descending
-        scored.sort(key=lambda r: r.get("surge_score", 0), reverse=True)
+        scored.sort(key=itemgetter("surge_score"), reverse=True)
         return scored[:top_n]
@@ -1,10 +1,11 @@
 """PullbackScreener: pullback-in-uptrend entry opportunity screening (KIK-530: parallel)."""
 
+import heapq
 import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
 from typing import Optional
 
-from src.core.screening.indicators import calculate_value_score
 from src.core.screening.query_builder import build_query
 from src.core.screening.query_screener import QueryScreener
 from src.core.screening.technicals import detect_pullback_in_uptrend
@@ -128,13 +129,10 @@ class PullbackScreener:
             return []
 
         # Normalize quotes using QueryScreener's static method
-        fundamentals: list[dict] = []
-        for quote in raw_quotes:
-            normalized = QueryScreener._normalize_quote(quote)
-            normalized["value_score"] = calculate_value_score(normalized)
-            # KIK-506: preserve 52-week high change for post-filter (no extra API call)
+        fundamentals: list[dict] = QueryScreener._normalize_quotes(raw_quotes)
+        # KIK-506: preserve 52-week high change for post-filter (no extra API call)
+        for normalized, quote in zip(fundamentals, raw_quotes):
             normalized["fifty_two_week_high_change_pct"] = quote.get("fiftyTwoWeekHighChangePercent")
-            fundamentals.append(normalized)
 
         # ---------------------------------------------------------------
         # Step 2: Technical filter - pullback in uptrend (parallel)
@@ -160,9 +158,12 @@ class PullbackScreener:
         # ---------------------------------------------------------------
         # Step 3: Scoring (value_score from Step 1)
         # ---------------------------------------------------------------
-        results: list[dict] = []
+        # Sort key (match rank, -final_score) is fixed at insertion time
+        keyed: list[tuple[tuple[int, float], dict]] = []
         for stock in technical_passed:
-            results.append({
+            match_type = stock.get("match_type", "full")
+            final_score = stock.get("value_score", 0.0)
+            keyed.append(((0 if match_type == "full" else 1, -final_score), {
                 "symbol": stock["symbol"],
                 "name": stock.get("name"),
                 "price": stock.get("price"),
@@ -179,16 +180,10 @@ class PullbackScreener:
                 "sma200": stock.get("sma200"),
                 # Bounce / match info
                 "bounce_score": stock.get("bounce_score"),
-                "match_type": stock.get("match_type", "full"),
+                "match_type": match_type,
                 # Score
-                "final_score": stock.get("value_score", 0.0),
-            })
-
-        # Sort: "full" matches first, then "partial"; within each group by final_score descending
-        results.sort(
-            key=lambda r: (
-                0 if r.get("match_type") == "full" else 1,
-                -(r.get("final_score") or 0.0),
-            ),
-        )
-        return results[:top_n]
+                "final_score": final_score,
+            }))
+
+        # Top N: "full" matches first, then "partial"; within each group by final_score descending
+        return [row for _, row in heapq.nsmallest(top_n, keyed, key=itemgetter(0))]
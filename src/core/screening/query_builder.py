@@ -1,5 +1,6 @@
 """Build yfinance EquityQuery objects from screening criteria dicts."""
 
+import copy
 from pathlib import Path
 from typing import Optional
 
@@ -9,6 +10,19 @@ from yfinance import EquityQuery
 _CONFIG_PATH = Path(__file__).resolve().parent.parent.parent.parent / "config" / "screening_presets.yaml"
 _THEMES_PATH = Path(__file__).resolve().parent.parent.parent.parent / "config" / "themes.yaml"
 
+# Parsed presets YAML, loaded once per process
+_PRESETS: dict | None = None
+
+
+def _get_presets() -> dict:
+    """Return the ``presets`` mapping, parsing the YAML file on first call."""
+    global _PRESETS
+    if _PRESETS is None:
+        with open(_CONFIG_PATH, "r", encoding="utf-8") as f:
+            config = yaml.safe_load(f)
+        _PRESETS = config.get("presets", {})
+    return _PRESETS
+
 
 def load_preset(preset_name: str) -> dict:
     """Load screening criteria from the presets YAML file.
@@ -28,12 +42,11 @@ def load_preset(preset_name: str) -> dict:
     ValueError
         If the preset is not found.
     """
-    with open(_CONFIG_PATH, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
-    presets = config.get("presets", {})
+    presets = _get_presets()
     if preset_name not in presets:
         raise ValueError(f"Unknown preset: '{preset_name}'. Available: {list(presets.keys())}")
-    return presets[preset_name].get("criteria", {})
+    # Callers update() the criteria in place; never hand out the cached dict
+    return copy.deepcopy(presets[preset_name].get("criteria", {}))
 
 
 # ---------------------------------------------------------------------------
@@ -1,5 +1,9 @@
 """QueryScreener: EquityQuery-based value screening across 60+ regions."""
 
+import heapq
+import os
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from typing import Optional
 
 from src.core.ports.market_data import ScreeningProvider
@@ -13,6 +17,11 @@ from src.core.screening.indicators import (
 from src.core.screening.query_builder import build_query, load_preset
 from src.core.screening.technicals import detect_pullback_in_uptrend
 
+_MAX_WORKERS = int(os.environ.get("SCREEN_MAX_WORKERS", "5"))
+
+# Pullback sort rank: "full" matches before "partial"
+_MATCH_RANK = {"full": 0, "partial": 1}
+
 
 class QueryScreener:
     """Screen stocks using yfinance EquityQuery + yf.screen().
@@ -44,27 +53,29 @@ class QueryScreener:
         (e.g. 'per', 'pbr') so that ``calculate_value_score`` and other
         downstream code works seamlessly.
         """
+        get = quote.get  # bound once; ~20 lookups per quote
+
         # dividendYield from yfinance is always a percentage (e.g. 3.5 for 3.5%)
-        raw_div = quote.get("dividendYield")
+        raw_div = get("dividendYield")
         if raw_div is not None:
             raw_div = raw_div / 100.0
 
         # returnOnEquity similarly may need normalisation
-        raw_roe = quote.get("returnOnEquity")
+        raw_roe = get("returnOnEquity")
         if raw_roe is not None and raw_roe > 1:
             raw_roe = raw_roe / 100.0
 
         # revenueGrowth / earningsGrowth may be percentages
-        raw_rev_growth = quote.get("revenueGrowth")
+        raw_rev_growth = get("revenueGrowth")
         if raw_rev_growth is not None and abs(raw_rev_growth) > 5:
             raw_rev_growth = raw_rev_growth / 100.0
 
         # --- Anomaly guard: sanitize extreme values ---
-        raw_per = quote.get("trailingPE")
+        raw_per = get("trailingPE")
         if raw_per is not None and 0 < raw_per < 1.0:
             raw_per = None
 
-        raw_pbr = quote.get("priceToBook")
+        raw_pbr = get("priceToBook")
         if raw_pbr is not None and raw_pbr < 0.05:
             raw_pbr = None
 
@@ -72,7 +83,7 @@ class QueryScreener:
             raw_div = None
 
         # Trailing dividend yield (actual, ratio form from yfinance)
-        raw_div_trailing = quote.get("trailingAnnualDividendYield")
+        raw_div_trailing = get("trailingAnnualDividendYield")
         if raw_div_trailing is not None and raw_div_trailing > 0.15:
             raw_div_trailing = None
 
@@ -80,17 +91,17 @@ class QueryScreener:
             raw_roe = None
 
         return {
-            "symbol": quote.get("symbol", ""),
-            "name": quote.get("shortName") or quote.get("longName"),
-            "sector": quote.get("sector"),
-            "industry": quote.get("industry"),
-            "currency": quote.get("currency"),
+            "symbol": get("symbol", ""),
+            "name": get("shortName") or get("longName"),
+            "sector": get("sector"),
+            "industry": get("industry"),
+            "currency": get("currency"),
             # Price
-            "price": quote.get("regularMarketPrice"),
-            "market_cap": quote.get("marketCap"),
+            "price": get("regularMarketPrice"),
+            "market_cap": get("marketCap"),
             # Valuation
             "per": raw_per,
-            "forward_per": quote.get("forwardPE"),
+            "forward_per": get("forwardPE"),
             "pbr": raw_pbr,
             # Profitability
             "roe": raw_roe,
@@ -99,11 +110,98 @@ class QueryScreener:
             "dividend_yield_trailing": raw_div_trailing,
             # Growth
             "revenue_growth": raw_rev_growth,
-            "earnings_growth": quote.get("earningsGrowth"),
+            "earnings_growth": get("earningsGrowth"),
             # Exchange info
-            "exchange": quote.get("exchange"),
+            "exchange": get("exchange"),
         }
 
+    @staticmethod
+    def _normalize_quotes(raw_quotes: list[dict], with_value_score: bool = True) -> list[dict]:
+        """Normalize a batch of raw quotes, optionally attaching value_score.
+
+        Shared by every EquityQuery-based screener so the per-quote
+        normalize + score work happens in one pass over ``raw_quotes``.
+        """
+        normalize = QueryScreener._normalize_quote
+        normalized = [normalize(quote) for quote in raw_quotes]
+        # calculate_value_score always returns a float, so sort keys can
+        # read stock["value_score"] directly
+        if with_value_score:
+            for stock in normalized:
+                stock["value_score"] = calculate_value_score(stock)
+        return normalized
+
+    def _attach_shareholder_return(self, stock: dict, min_rate: float) -> Optional[dict]:
+        """Fetch detail and attach shareholder return fields (KIK-378/383, one stock).
+
+        Returns the stock dict when it passes min_total_shareholder_return, else None.
+        """
+        detail = self.yahoo_client.get_stock_detail(stock["symbol"])
+        if detail is None:
+            return None
+        sr = calculate_shareholder_return(detail)
+        stock["total_shareholder_return"] = sr.get("total_return_rate")
+        stock["buyback_yield"] = sr.get("buyback_yield")
+        # KIK-383: Return stability assessment
+        sr_hist = calculate_shareholder_return_history(detail)
+        stability = assess_return_stability(sr_hist)
+        stock["return_stability"] = stability.get("stability")
+        stock["return_stability_label"] = stability.get("label")
+        stock["return_avg_rate"] = stability.get("avg_rate")
+        stock["return_stability_reason"] = stability.get("reason")
+        if not apply_filters(stock, {"min_total_shareholder_return": min_rate}):
+            return None
+        return stock
+
+    def _attach_pullback(self, stock: dict) -> Optional[dict]:
+        """Fetch price history and attach pullback indicators (one stock).
+
+        Returns the stock dict with match_type 'full' or 'partial', else None.
+        """
+        hist = self.yahoo_client.get_price_history(stock["symbol"])
+        if hist is None or hist.empty:
+            return None
+
+        tech_result = detect_pullback_in_uptrend(hist)
+        if tech_result is None:
+            return None
+
+        all_conditions = tech_result.get("all_conditions")
+        bounce_score = tech_result.get("bounce_score", 0)
+
+        if all_conditions:
+            match_type = "full"
+        elif (
+            bounce_score >= 30
+            and tech_result.get("uptrend")
+            and tech_result.get("is_pullback")
+        ):
+            match_type = "partial"
+        else:
+            return None
+
+        # Attach technical indicators to the stock dict
+        stock["pullback_pct"] = tech_result.get("pullback_pct")
+        stock["rsi"] = tech_result.get("rsi")
+        stock["volume_ratio"] = tech_result.get("volume_ratio")
+        stock["sma50"] = tech_result.get("sma50")
+        stock["sma200"] = tech_result.get("sma200")
+        stock["bounce_score"] = bounce_score
+        stock["match_type"] = match_type
+        return stock
+
+    def _enrich_one_stock(
+        self, stock: dict, criteria: dict, with_pullback: bool,
+    ) -> Optional[dict]:
+        """Run the optional shareholder-return and pullback filters for one stock."""
+        if "min_total_shareholder_return" in criteria:
+            min_rate = criteria["min_total_shareholder_return"]
+            if self._attach_shareholder_return(stock, min_rate) is None:
+                return None
+        if with_pullback:
+            return self._attach_pullback(stock)
+        return stock
+
     def screen(
         self,
         region: str,
@@ -195,94 +293,39 @@ class QueryScreener:
             return []
 
         # Normalize quotes and calculate value scores
-        results: list[dict] = []
-        for quote in raw_quotes:
-            normalized = self._normalize_quote(quote)
-
-            # calculate_value_score works with our standard keys
-            score = calculate_value_score(normalized)
-
-            normalized["value_score"] = score
-            results.append(normalized)
+        results: list[dict] = self._normalize_quotes(raw_quotes)
 
         # -----------------------------------------------------------
-        # Optional shareholder return filter (KIK-378)
-        # Requires get_stock_detail() for cashflow data
+        # Optional per-stock filters (parallel):
+        #   shareholder return (KIK-378, get_stock_detail) -> pullback-in-uptrend
+        # Both run back-to-back per stock, so a stock's price history fetch
+        # starts as soon as its own detail check passes instead of after
+        # every detail fetch has finished.
         # -----------------------------------------------------------
-        if "min_total_shareholder_return" in criteria:
-            enriched = []
-            for stock in results:
-                symbol = stock.get("symbol")
-                if not symbol:
-                    continue
-                detail = self.yahoo_client.get_stock_detail(symbol)
-                if detail is None:
-                    continue
-                sr = calculate_shareholder_return(detail)
-                stock["total_shareholder_return"] = sr.get("total_return_rate")
-                stock["buyback_yield"] = sr.get("buyback_yield")
-                # KIK-383: Return stability assessment
-                sr_hist = calculate_shareholder_return_history(detail)
-                stability = assess_return_stability(sr_hist)
-                stock["return_stability"] = stability.get("stability")
-                stock["return_stability_label"] = stability.get("label")
-                stock["return_avg_rate"] = stability.get("avg_rate")
-                stock["return_stability_reason"] = stability.get("reason")
-                if apply_filters(stock, {"min_total_shareholder_return": criteria["min_total_shareholder_return"]}):
-                    enriched.append(stock)
+        if "min_total_shareholder_return" in criteria or with_pullback:
+            enriched: list[dict] = []
+            with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+                futures = [
+                    executor.submit(self._enrich_one_stock, stock, criteria, with_pullback)
+                    for stock in results
+                    if stock.get("symbol")
+                ]
+                for future in futures:
+                    try:
+                        result = future.result()
+                        if result is not None:
+                            enriched.append(result)
+                    except Exception:
+                        pass  # skip failed stocks
             results = enriched
 
-        # -----------------------------------------------------------
-        # Optional pullback-in-uptrend filter
-        # -----------------------------------------------------------
         if with_pullback:
-            pullback_results: list[dict] = []
-            for stock in results:
-                symbol = stock.get("symbol")
-                if not symbol:
-                    continue
-
-                hist = self.yahoo_client.get_price_history(symbol)
-                if hist is None or hist.empty:
-                    continue
-
-                tech_result = detect_pullback_in_uptrend(hist)
-                if tech_result is None:
-                    continue
-
-                all_conditions = tech_result.get("all_conditions")
-                bounce_score = tech_result.get("bounce_score", 0)
-
-                if all_conditions:
-                    match_type = "full"
-                elif (
-                    bounce_score >= 30
-                    and tech_result.get("uptrend")
-                    and tech_result.get("is_pullback")
-                ):
-                    match_type = "partial"
-                else:
-                    continue
-
-                # Attach technical indicators to the stock dict
-                stock["pullback_pct"] = tech_result.get("pullback_pct")
-                stock["rsi"] = tech_result.get("rsi")
-                stock["volume_ratio"] = tech_result.get("volume_ratio")
-                stock["sma50"] = tech_result.get("sma50")
-                stock["sma200"] = tech_result.get("sma200")
-                stock["bounce_score"] = bounce_score
-                stock["match_type"] = match_type
-                pullback_results.append(stock)
-
-            # Sort: "full" first, then "partial"; within each group by value_score desc
-            pullback_results.sort(
-                key=lambda r: (
-                    0 if r.get("match_type") == "full" else 1,
-                    -(r.get("value_score") or 0),
-                ),
+            # "full" first, then "partial"; within each group by value_score desc
+            return heapq.nsmallest(
+                top_n,
+                results,
+                key=lambda r: (_MATCH_RANK[r["match_type"]], -r["value_score"]),
             )
-            return pullback_results[:top_n]
 
-        # Sort by value_score descending, take top N
-        results.sort(key=lambda r: r["value_score"], reverse=True)
-        return results[:top_n]
+        # Top N by value_score descending (same order as a full stable sort)
+        return heapq.nlargest(top_n, results, key=itemgetter("value_score"))
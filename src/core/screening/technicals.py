@@ -141,24 +141,30 @@ def detect_pullback_in_uptrend(hist: pd.DataFrame) -> dict:
         "lookback_day": 0,
     }
 
+    # Plain ndarrays for the lookback loop: scalar .iloc access on a Series
+    # costs far more than the comparisons it feeds
+    close_arr = close.to_numpy(dtype=float)
+    rsi_arr = rsi_series.to_numpy(dtype=float)
+    lower_arr = lower_band.to_numpy(dtype=float)
+    # min_periods=1 keeps the per-day means NaN-skipping, like a slice .mean()
+    vol5_arr = volume.rolling(window=5, min_periods=1).mean().to_numpy(dtype=float)
+    vol20_arr = volume.rolling(window=20, min_periods=1).mean().to_numpy(dtype=float)
+    n = len(close_arr)
+
     for offset in range(lookback):
-        idx = -1 - offset
-        if abs(idx) >= len(close) or abs(idx) >= len(rsi_series):
+        i = n - 1 - offset
+        if i < 1:
             break
 
-        day_rsi = float(rsi_series.iloc[idx])
-        day_prev_rsi = float(rsi_series.iloc[idx - 1]) if abs(idx - 1) < len(rsi_series) else float("nan")
-        day_close = float(close.iloc[idx])
-        day_prev_close = float(close.iloc[idx - 1]) if abs(idx - 1) < len(close) else float("nan")
-        day_lower = float(lower_band.iloc[idx]) if abs(idx) < len(lower_band) and not np.isnan(lower_band.iloc[idx]) else float("nan")
+        day_rsi = rsi_arr[i]
+        day_prev_rsi = rsi_arr[i - 1]
+        day_close = close_arr[i]
+        day_prev_close = close_arr[i - 1]
+        day_lower = lower_arr[i]
 
         # Volume ratio for this specific day
-        if abs(idx) < len(volume):
-            day_vol_5 = volume.iloc[max(0, len(volume) + idx - 4) : len(volume) + idx + 1].mean()
-            day_vol_20 = volume.iloc[max(0, len(volume) + idx - 19) : len(volume) + idx + 1].mean()
-            day_volume_ratio = float(day_vol_5 / day_vol_20) if day_vol_20 > 0 else float("nan")
-        else:
-            day_volume_ratio = float("nan")
+        day_vol_20 = vol20_arr[i]
+        day_volume_ratio = float(vol5_arr[i] / day_vol_20) if day_vol_20 > 0 else float("nan")
 
         day_score = 0.0
         day_details: dict = {
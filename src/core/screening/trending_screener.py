@@ -1,16 +1,25 @@
 """TrendingScreener: X (Twitter) trending stocks with fundamental enrichment."""
 
+import heapq
+import os
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from typing import Optional
 
 from src.core.screening.indicators import calculate_value_score
 
+_MAX_WORKERS = int(os.environ.get("SCREEN_MAX_WORKERS", "5"))
+
+# Result ordering by classification (unknown labels rank with 割高)
+_CLASS_ORDER = {"話題×割安": 0, "話題×適正": 1, "話題×割高": 2, "話題×データ不足": 3}
+
 
 class TrendingScreener:
     """Screen stocks trending on X (Twitter) with fundamental enrichment.
 
     Pipeline:
       Step 1: Grok API x_search to discover trending tickers
-      Step 2: yahoo_client.get_stock_info() for fundamentals
+      Step 2: yahoo_client.get_stock_info() for fundamentals (parallel)
       Step 3: calculate_value_score() + classify
       Step 4: Sort by classification then score
 
@@ -62,15 +71,20 @@ class TrendingScreener:
         if not trending_stocks:
             return [], market_context
 
-        results: list[dict] = []
-        for item in trending_stocks:
-            ticker = item.get("ticker", "")
-            if not ticker:
-                continue
-
-            info = self.yahoo_client.get_stock_info(ticker)
+        # Step 2: fetch fundamentals for every ticker concurrently (IO-bound)
+        items = [item for item in trending_stocks if item.get("ticker", "")]
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+            infos = list(executor.map(
+                self.yahoo_client.get_stock_info,
+                [item["ticker"] for item in items],
+            ))
+
+        # Sort key (class rank, -value_score) is fixed at insertion time
+        keyed: list[tuple[tuple[int, float], dict]] = []
+        for item, info in zip(items, infos):
+            ticker = item["ticker"]
             if info is None:
-                results.append({
+                keyed.append(((_CLASS_ORDER[self.CLASSIFICATION_NO_DATA], 0.0), {
                     "symbol": ticker,
                     "name": item.get("name", ""),
                     "trending_reason": item.get("reason", ""),
@@ -83,13 +97,13 @@ class TrendingScreener:
                     "value_score": 0.0,
                     "classification": self.CLASSIFICATION_NO_DATA,
                     "sector": None,
-                })
+                }))
                 continue
 
             score = calculate_value_score(info)
             classification = self.classify(score)
 
-            results.append({
+            keyed.append(((_CLASS_ORDER.get(classification, 2), -score), {
                 "symbol": info.get("symbol", ticker),
                 "name": info.get("name") or item.get("name", ""),
                 "trending_reason": item.get("reason", ""),
@@ -102,14 +116,8 @@ class TrendingScreener:
                 "value_score": score,
                 "classification": classification,
                 "sector": info.get("sector"),
-            })
-
-        _CLASS_ORDER = {"話題×割安": 0, "話題×適正": 1, "話題×割高": 2, "話題×データ不足": 3}
-        results.sort(
-            key=lambda r: (
-                _CLASS_ORDER.get(r.get("classification", ""), 2),
-                -(r.get("value_score") or 0),
-            ),
-        )
+            }))
+
+        top = [row for _, row in heapq.nsmallest(top_n, keyed, key=itemgetter(0))]
 
-        return results[:top_n], market_context
+        return top, market_context
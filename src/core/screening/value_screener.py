@@ -1,12 +1,18 @@
 """ValueScreener: legacy symbol-list-based value screening."""
 
+import heapq
+import os
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from typing import Optional
 
 from src.core.screening.filters import apply_filters
 from src.core.screening.indicators import calculate_value_score
 from src.core.screening.query_builder import load_preset
 
+_MAX_WORKERS = int(os.environ.get("SCREEN_MAX_WORKERS", "5"))
+
 
 class ValueScreener:
     """Screen stocks for value investment opportunities.
@@ -35,6 +41,9 @@ class ValueScreener:
         )
         self.yahoo_client = yahoo_client
         self.market = market
+        # Market defaults are static; resolved on first screen() and reused
+        self._thresholds: Optional[dict] = None
+        self._default_symbols: Optional[list[str]] = None
 
     def screen(
         self,
@@ -65,7 +74,9 @@ class ValueScreener:
         """
         # Resolve symbols
         if symbols is None:
-            symbols = self.market.get_default_symbols()
+            if self._default_symbols is None:
+                self._default_symbols = self.market.get_default_symbols()
+            symbols = self._default_symbols
 
         # Resolve criteria (explicit criteria takes priority over preset)
         if criteria is None:
@@ -74,12 +85,17 @@ class ValueScreener:
             else:
                 criteria = {}
 
-        thresholds = self.market.get_thresholds()
+        if self._thresholds is None:
+            self._thresholds = self.market.get_thresholds()
+        thresholds = self._thresholds
+
+        # Fetch every symbol concurrently (IO-bound), then filter/score in order
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+            data_list = list(executor.map(self.yahoo_client.get_stock_info, symbols))
 
         results: list[dict] = []
 
-        for symbol in symbols:
-            data = self.yahoo_client.get_stock_info(symbol)
+        for symbol, data in zip(symbols, data_list):
             if data is None:
                 continue
 
@@ -102,6 +118,5 @@ class ValueScreener:
                 "value_score": score,
             })
 
-        # Sort by value_score descending, take top N
-        results.sort(key=lambda r: r["value_score"], reverse=True)
-        return results[:top_n]
+        # Top N by value_score descending (same order as a full stable sort)
+        return heapq.nlargest(top_n, results, key=itemgetter("value_score"))
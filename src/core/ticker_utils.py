@@ -111,6 +111,17 @@ SUFFIX_TO_LOT_SIZE: dict[str, int] = {
 }
 
 
+def _suffix_of(symbol: str) -> str:
+    """Return the upper-cased ``.XX`` exchange suffix of *symbol* ('' if none).
+
+    Every key in the SUFFIX_TO_* maps is a single dot-led segment, so a
+    symbol can only match the segment after its last dot.  A dict lookup on
+    that segment is equivalent to testing ``endswith`` against each key.
+    """
+    dot = symbol.rfind(".")
+    return symbol[dot:].upper() if dot >= 0 else ""
+
+
 def get_lot_size(symbol: str) -> int:
     """Get minimum tradable lot size for a symbol.
 
@@ -118,11 +129,8 @@ def get_lot_size(symbol: str) -> int:
     """
     if is_cash(symbol):
         return 1
-    for suffix, lot in SUFFIX_TO_LOT_SIZE.items():
-        if symbol.upper().endswith(suffix.upper()):
-            return lot
     # No suffix = US stock = 1 share
-    return 1
+    return SUFFIX_TO_LOT_SIZE.get(_suffix_of(symbol), 1)
 
 
 def lot_cost(symbol: str, price: float) -> float:
@@ -180,13 +188,8 @@ def infer_currency(symbol: str, info: dict | None = None) -> str:
             return currency_from_info
     if is_cash(symbol):
         return cash_currency(symbol)
-    for suffix, currency in SUFFIX_TO_CURRENCY.items():
-        if symbol.upper().endswith(suffix.upper()):
-            return currency
     # No suffix typically means USD
-    if "." not in symbol:
-        return "USD"
-    return "USD"
+    return SUFFIX_TO_CURRENCY.get(_suffix_of(symbol), "USD")
 
 
 # Suffix -> lowercase region code mapping (KIK-438)
@@ -214,12 +217,7 @@ def infer_region_code(symbol: str) -> str:
             if c == cur:
                 return SUFFIX_TO_REGION_CODE.get(suffix, "us")
         return "us"
-    for suffix, code in SUFFIX_TO_REGION_CODE.items():
-        if symbol.upper().endswith(suffix.upper()):
-            return code
-    if "." not in symbol:
-        return "us"
-    return "us"
+    return SUFFIX_TO_REGION_CODE.get(_suffix_of(symbol), "us")
 
 
 def infer_country(symbol: str, info: dict | None = None) -> str:
@@ -244,9 +242,9 @@ def infer_country(symbol: str, info: dict | None = None) -> str:
         if cur == "JPY":
             return "Japan"
         return "Unknown"
-    for suffix, country in SUFFIX_TO_REGION.items():
-        if symbol.upper().endswith(suffix.upper()):
-            return country
+    country = SUFFIX_TO_REGION.get(_suffix_of(symbol))
+    if country is not None:
+        return country
     # No suffix typically means US stock
     if "." not in symbol:
         return "United States"
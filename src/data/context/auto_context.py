@@ -9,7 +9,9 @@ KIK-577: Split into sub-modules (freshness, skill_recommender, vector_search,
 Returns None when no context available or Neo4j unavailable (graceful degradation).
 """
 
+import contextlib
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional
 
 from src.core.ticker_utils import extract_symbol
@@ -53,15 +55,16 @@ from src.data.context.context_formatter import (  # noqa: F401
     _format_context,
     _format_market_context,
 )
+from src.data.graph_store._common import _read_session
 
 
-def _check_bookmarked(symbol: str) -> bool:
+def _check_bookmarked(symbol: str, session=None) -> bool:
     """Check if symbol is in any watchlist via Neo4j.
 
     Wraps skill_recommender._check_bookmarked with this module's graph_store
     reference so that ``@patch("src.data.context.auto_context.graph_store")`` works.
     """
-    return _check_bookmarked_impl(symbol, _graph_store=graph_store)
+    return _check_bookmarked_impl(symbol, _graph_store=graph_store, session=session)
 
 
 def _vector_search(user_input: str) -> list[dict]:
@@ -76,30 +79,77 @@ def _vector_search(user_input: str) -> list[dict]:
 _extract_symbol = extract_symbol
 
 
-def _lookup_symbol_by_name(text: str) -> Optional[str]:
-    """Reverse-lookup symbol from company name via Neo4j Stock.name field."""
-    driver = graph_store._get_driver()
-    if driver is None:
+# Company name -> symbol: fulltext index seek, with the CONTAINS check kept
+# as a guard. A phrase query only matches whole tokens, so substrings inside a
+# token ("Appl", "ソニー" in "ソニーグループ") miss it; the label scan below then
+# runs as the fallback, keeping the scan's recall
+_NAME_FULLTEXT_QUERY = (
+    "CALL db.index.fulltext.queryNodes('stock_name_ft', $phrase) YIELD node "
+    "WHERE toLower(node.name) CONTAINS toLower($name) "
+    "RETURN node.symbol AS symbol LIMIT 1"
+)
+_NAME_SCAN_QUERY = (
+    "MATCH (s:Stock) WHERE toLower(s.name) CONTAINS toLower($name) "
+    "RETURN s.symbol AS symbol LIMIT 1"
+)
+
+
+def _lucene_phrase(text: str) -> str:
+    """Quote *text* as a Lucene phrase so query syntax in it is literal."""
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _lookup_symbol_by_name(text: str, session=None) -> Optional[str]:
+    """Reverse-lookup symbol from company name via Neo4j Stock.name field.
+
+    Tries the ``stock_name_ft`` fulltext index first; falls back to a Stock
+    label scan when the index or procedure is unavailable or finds nothing.
+    """
+    driver = graph_store._get_driver() if session is None else None
+    if driver is None and session is None:
         return None
+    name = text.strip()
     try:
-        with driver.session() as session:
-            result = session.run(
-                "MATCH (s:Stock) WHERE toLower(s.name) CONTAINS toLower($name) "
-                "RETURN s.symbol AS symbol LIMIT 1",
-                name=text.strip(),
-            )
-            record = result.single()
+        with _read_session(driver, session) as session:
+            try:
+                record = session.run(
+                    _NAME_FULLTEXT_QUERY, phrase=_lucene_phrase(name), name=name,
+                ).single()
+            except Exception:
+                record = None
+            if record is None:
+                record = session.run(_NAME_SCAN_QUERY, name=name).single()
             return record["symbol"] if record else None
     except Exception:
         return None
 
 
-def _resolve_symbol(user_input: str) -> Optional[str]:
+def _resolve_symbol(user_input: str, session=None) -> Optional[str]:
     """Extract or resolve a ticker symbol from user input."""
     symbol = _extract_symbol(user_input)
     if symbol:
         return symbol
-    return _lookup_symbol_by_name(user_input)
+    return _lookup_symbol_by_name(user_input, session=session)
+
+
+@contextlib.contextmanager
+def _request_session():
+    """Yield one read session shared by a request's graph lookups.
+
+    Yields None when Neo4j is not configured or the session cannot be
+    opened; the helpers then open their own sessions as before.
+    """
+    driver = graph_store._get_driver()
+    if driver is None:
+        yield None
+        return
+    try:
+        session = driver.session(default_access_mode="READ")
+    except Exception:
+        yield None
+        return
+    with session as shared:
+        yield shared
 
 
 # ---------------------------------------------------------------------------
@@ -108,6 +158,11 @@ def _resolve_symbol(user_input: str) -> Optional[str]:
 
 _MARKET_KEYWORDS = re.compile(r"(相場|市況|マーケット|market)", re.IGNORECASE)
 _PF_KEYWORDS = re.compile(r"(PF|ポートフォリオ|portfolio)", re.IGNORECASE)
+# Both keyword sets in one alternation so routing scans the input once
+_ROUTE_KEYWORDS = re.compile(
+    r"(?P<market>相場|市況|マーケット|market)|(?P<pf>PF|ポートフォリオ|portfolio)",
+    re.IGNORECASE,
+)
 
 
 def _is_market_query(text: str) -> bool:
@@ -118,6 +173,20 @@ def _is_portfolio_query(text: str) -> bool:
     return bool(_PF_KEYWORDS.search(text))
 
 
+def _classify_query(text: str) -> Optional[str]:
+    """Route non-symbol queries in a single regex pass.
+
+    Returns "market" if any market keyword appears (market wins, as in
+    get_context), "pf" if only portfolio keywords appear, else None.
+    """
+    route = None
+    for m in _ROUTE_KEYWORDS.finditer(text):
+        if m.lastgroup == "market":
+            return "market"
+        route = "pf"
+    return route
+
+
 # ---------------------------------------------------------------------------
 # Placeholder (kept for backward compatibility)
 # ---------------------------------------------------------------------------
@@ -347,11 +416,20 @@ def get_context(user_input: str) -> Optional[dict]:
         }
         or None if no context available.
     """
-    # KIK-420: Always attempt vector search (TEI unavailable -> empty list)
-    vector_results = _vector_search(user_input)
+    # KIK-420: Always attempt vector search (TEI unavailable -> empty list).
+    # The TEI embedding + ANN query is independent of the graph lookups
+    # below, so it runs in a worker thread while they proceed.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        vector_future = executor.submit(_vector_search, user_input)
+        return _build_context(user_input, vector_future)
+
+
+def _build_context(user_input: str, vector_future: Future) -> Optional[dict]:
+    """Body of get_context; waits for the vector search only when merging."""
+    route = _classify_query(user_input)
 
     # Market context query (no symbol needed)
-    if _is_market_query(user_input):
+    if route == "market":
         mc = graph_query.get_recent_market_context()
         if mc:
             market_ctx = {
@@ -361,13 +439,13 @@ def get_context(user_input: str) -> Optional[dict]:
                 "recommendation_reason": "市況照会",
                 "relationship": "市況",
             }
-            result = _merge_context(market_ctx, vector_results) or market_ctx
+            result = _merge_context(market_ctx, vector_future.result()) or market_ctx
         else:
-            result = _merge_context(None, vector_results)
+            result = _merge_context(None, vector_future.result())
         return _append_lessons(result, user_input=user_input)
 
     # Portfolio query (no specific symbol)
-    if _is_portfolio_query(user_input):
+    if route == "pf":
         mc = graph_query.get_recent_market_context()
         ctx_lines = ["## ポートフォリオコンテキスト"]
         if mc:
@@ -398,18 +476,40 @@ def get_context(user_input: str) -> Optional[dict]:
             "recommendation_reason": "ポートフォリオ照会",
             "relationship": "PF",
         }
-        result = _merge_context(pf_ctx, vector_results) or pf_ctx
+        result = _merge_context(pf_ctx, vector_future.result()) or pf_ctx
         return _append_lessons(result, user_input=user_input)
 
-    # Symbol-based query
-    symbol = _resolve_symbol(user_input)
+    # Symbol-based query: name lookup, history and fallbacks share a session
+    with _request_session() as session:
+        symbol, symbol_context = _build_symbol_context(user_input, session)
+
+    # KIK-420: Merge symbol context + vector results
+    merged = _merge_context(symbol_context, vector_future.result())
+
+    # KIK-534: Append investment lesson section
+    return _append_lessons(merged, symbol=symbol, user_input=user_input)
+
+
+def _build_symbol_context(
+    user_input: str, session,
+) -> tuple[Optional[str], Optional[dict]]:
+    """Resolve the symbol and build its graph context on *session*."""
+    symbol = _resolve_symbol(user_input, session=session)
     symbol_context = None
 
     if symbol and graph_store.is_available():
-        history = graph_store.get_stock_history(symbol)
-        is_bookmarked = _check_bookmarked(symbol)
+        # History, watchlist and HOLDS flags in one round-trip; the flags are
+        # absent only when that query failed, then fall back to lookups
+        history = graph_store.get_stock_history(
+            symbol, include_flags=True, session=session,
+        )
+        is_bookmarked = history.pop("bookmarked", None)
+        if is_bookmarked is None:
+            is_bookmarked = _check_bookmarked(symbol, session=session)
         # KIK-414: HOLDS relationship for authoritative held-stock detection
-        held = graph_store.is_held(symbol)
+        held = history.pop("held", None)
+        if held is None:
+            held = graph_store.is_held(symbol, session=session)
         skill, reason, relationship = _recommend_skill(history, is_bookmarked,
                                                        is_held=held)
         context_md = _format_context(symbol, history, skill, reason, relationship)
@@ -420,9 +520,4 @@ def get_context(user_input: str) -> Optional[dict]:
             "recommendation_reason": reason,
             "relationship": relationship,
         }
-
-    # KIK-420: Merge symbol context + vector results
-    merged = _merge_context(symbol_context, vector_results)
-
-    # KIK-534: Append investment lesson section
-    return _append_lessons(merged, symbol=symbol, user_input=user_input)
+    return symbol, symbol_context
@@ -4,9 +4,12 @@ Converts raw graph history dicts into human-readable markdown with
 freshness labels, community info, and action directives.
 """
 
+from itertools import accumulate
+
 from src.data.context.freshness import (
     _action_directive,
     _best_freshness,
+    _bulk_freshness,
     freshness_action,
     freshness_label,
 )
@@ -20,38 +23,50 @@ def _format_context(symbol: str, history: dict, skill: str, reason: str,
     # Track freshness by data type for summary
     freshness_map: dict[str, str] = {}  # data_type -> label
 
+    screens = history.get("screens", [])[:3]
+    reports = history.get("reports", [])[:2]
+    trades = history.get("trades", [])[:3]
+    health_checks = history.get("health_checks", [])[:1]
+    researches = history.get("researches", [])[:2]
+
+    # Label every dated row in one vectorized pass, then split per section
+    sections = (screens, reports, trades, health_checks, researches)
+    labels = _bulk_freshness([row.get("date", "?") for rows in sections for row in rows])
+    bounds = list(accumulate(map(len, sections), initial=0))
+    screen_fl, report_fl, trade_fl, health_fl, research_fl = (
+        labels[lo:hi] for lo, hi in zip(bounds, bounds[1:])
+    )
+    # Each section's first (newest) row sets its summary label
+    for dtype, section_fl in (("スクリーニング", screen_fl), ("レポート", report_fl),
+                              ("取引", trade_fl), ("ヘルスチェック", health_fl),
+                              ("リサーチ", research_fl)):
+        if section_fl:
+            freshness_map[dtype] = section_fl[0]
+
     # Screens
-    for s in history.get("screens", [])[:3]:
+    for s, fl in zip(screens, screen_fl):
         d = s.get("date", "?")
-        fl = freshness_label(d)
         lines.append(f"- [{fl}] {d} {s.get('preset', '')} "
                      f"スクリーニング ({s.get('region', '')})")
-        freshness_map.setdefault("スクリーニング", fl)
 
     # Reports
-    for r in history.get("reports", [])[:2]:
+    for r, fl in zip(reports, report_fl):
         d = r.get("date", "?")
-        fl = freshness_label(d)
         verdict = r.get("verdict", "")
         score = r.get("score", "")
         lines.append(f"- [{fl}] {d} レポート: スコア {score}, {verdict}")
-        freshness_map.setdefault("レポート", fl)
 
     # Trades
-    for t in history.get("trades", [])[:3]:
+    for t, fl in zip(trades, trade_fl):
         d = t.get("date", "?")
-        fl = freshness_label(d)
         action = "購入" if t.get("type") == "buy" else "売却"
         lines.append(f"- [{fl}] {d} {action}: "
                      f"{t.get('shares', '')}株 @ {t.get('price', '')}")
-        freshness_map.setdefault("取引", fl)
 
     # Health checks
-    for h in history.get("health_checks", [])[:1]:
+    for h, fl in zip(health_checks, health_fl):
         d = h.get("date", "?")
-        fl = freshness_label(d)
         lines.append(f"- [{fl}] {d} ヘルスチェック実施")
-        freshness_map.setdefault("ヘルスチェック", fl)
 
     # Notes
     for n in history.get("notes", [])[:3]:
@@ -76,13 +91,11 @@ def _format_context(symbol: str, history: dict, skill: str, reason: str,
         pass
 
     # Researches
-    for r in history.get("researches", [])[:2]:
+    for r, fl in zip(researches, research_fl):
         d = r.get("date", "?")
-        fl = freshness_label(d)
         summary = (r.get("summary", "") or "")[:50]
         lines.append(f"- [{fl}] {d} リサーチ({r.get('research_type', '')}): "
                      f"{summary}")
-        freshness_map.setdefault("リサーチ", fl)
 
     if len(lines) == 1:
         lines.append("- (過去データなし)")
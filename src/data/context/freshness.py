@@ -6,50 +6,58 @@ Determines how stale cached context is, and what action the LLM should take
 
 import os
 from datetime import date, datetime
+from typing import Optional
+
+
+def _int_env(name: str, default: int) -> int:
+    """Read an integer env var, returning *default* when unset or invalid."""
+    raw = (os.environ.get(name) or "").strip()
+    digits = raw[1:] if raw[:1] in "+-" else raw
+    return int(raw) if digits.isdecimal() else default
 
 
 def _fresh_hours() -> int:
     """Return CONTEXT_FRESH_HOURS threshold (default 24)."""
-    try:
-        return int(os.environ.get("CONTEXT_FRESH_HOURS", "24"))
-    except (ValueError, TypeError):
-        return 24
+    return _int_env("CONTEXT_FRESH_HOURS", 24)
 
 
 def _recent_hours() -> int:
     """Return CONTEXT_RECENT_HOURS threshold (default 168 = 7 days)."""
-    try:
-        return int(os.environ.get("CONTEXT_RECENT_HOURS", "168"))
-    except (ValueError, TypeError):
-        return 168
+    return _int_env("CONTEXT_RECENT_HOURS", 168)
+
 
+def _days_since(date_str: str, today: Optional[date] = None) -> int:
+    """Return days between date_str and today. Returns 9999 on parse error.
 
-def _days_since(date_str: str) -> int:
-    """Return days between date_str and today. Returns 9999 on parse error."""
+    Pass *today* to reuse one clock read across many dates.
+    """
     try:
-        d = datetime.strptime(date_str[:10], "%Y-%m-%d").date()
-        return (date.today() - d).days
+        d = date.fromisoformat(date_str[:10])
+        return ((today or date.today()) - d).days
     except (ValueError, TypeError):
         return 9999
 
 
-def _hours_since(date_str: str) -> float:
-    """Return hours between date_str and now. Returns 999999 on parse error."""
+def _hours_since(date_str: str, now: Optional[datetime] = None) -> float:
+    """Return hours between date_str and now. Returns 999999 on parse error.
+
+    Pass *now* to reuse one clock read across many dates.
+    """
     try:
-        d = datetime.strptime(date_str[:10], "%Y-%m-%d")
-        return (datetime.now() - d).total_seconds() / 3600
+        d = datetime.fromisoformat(date_str[:10])
+        return ((now or datetime.now()) - d).total_seconds() / 3600
     except (ValueError, TypeError):
         return 999999
 
 
-def freshness_label(date_str: str) -> str:
+def freshness_label(date_str: str, now: Optional[datetime] = None) -> str:
     """Return freshness label for a date string.
 
     Returns one of: FRESH, RECENT, STALE, NONE.
     """
     if not date_str:
         return "NONE"
-    h = _hours_since(date_str)
+    h = _hours_since(date_str, now)
     if h <= _fresh_hours():
         return "FRESH"
     if h <= _recent_hours():
@@ -57,14 +65,31 @@ def freshness_label(date_str: str) -> str:
     return "STALE"
 
 
+def _bulk_freshness(date_strs: list, now: Optional[datetime] = None) -> list[str]:
+    """Return freshness_label for many dates against a single clock read."""
+    now = now or datetime.now()
+    return [freshness_label(d, now) for d in date_strs]
+
+
+# Label -> action / directive / rank tables, built once at import
+_ACTIONS = {
+    "FRESH": "コンテキスト利用",
+    "RECENT": "差分モード推奨",
+    "STALE": "フル再取得推奨",
+    "NONE": "新規取得",
+}
+_DIRECTIVES = {
+    "FRESH": "⛔ FRESH — スキル実行不要。このコンテキストのみで回答。",
+    "RECENT": "⚡ RECENT — 差分モードで軽量更新。",
+    "STALE": "🔄 STALE — フル再取得。スキルを実行。",
+    "NONE": "🆕 NONE — データなし。スキルを実行。",
+}
+_PRIORITY = {"FRESH": 0, "RECENT": 1, "STALE": 2, "NONE": 3}
+
+
 def freshness_action(label: str) -> str:
     """Return recommended action for a freshness label."""
-    return {
-        "FRESH": "コンテキスト利用",
-        "RECENT": "差分モード推奨",
-        "STALE": "フル再取得推奨",
-        "NONE": "新規取得",
-    }.get(label, "新規取得")
+    return _ACTIONS.get(label, "新規取得")
 
 
 def _action_directive(label: str) -> str:
@@ -73,17 +98,11 @@ def _action_directive(label: str) -> str:
     Placed at the top of context output so LLM immediately knows
     whether to run a skill or use existing context (KIK-428).
     """
-    return {
-        "FRESH": "⛔ FRESH — スキル実行不要。このコンテキストのみで回答。",
-        "RECENT": "⚡ RECENT — 差分モードで軽量更新。",
-        "STALE": "🔄 STALE — フル再取得。スキルを実行。",
-        "NONE": "🆕 NONE — データなし。スキルを実行。",
-    }.get(label, "🆕 NONE — データなし。スキルを実行。")
+    return _DIRECTIVES.get(label, _DIRECTIVES["NONE"])
 
 
 def _best_freshness(labels: list[str]) -> str:
     """Return the freshest (best) label from a list."""
-    priority = {"FRESH": 0, "RECENT": 1, "STALE": 2, "NONE": 3}
     if not labels:
         return "NONE"
-    return min(labels, key=lambda l: priority.get(l, 3))
+    return min(labels, key=lambda l: _PRIORITY.get(l, 3))
@@ -4,15 +4,17 @@ Examines a stock's history in the knowledge graph (trades, screens, notes,
 health checks, researches) and recommends the best skill to run next.
 """
 
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
 from src.data.context.freshness import _days_since
+from src.data.graph_store._common import _read_session
 
 
 def _has_bought_not_sold(history: dict) -> bool:
     """Check if there are BOUGHT trades but no matching SOLD trades."""
-    trades = history.get("trades", [])
-    bought = [t for t in trades if t.get("type") == "buy"]
-    sold = [t for t in trades if t.get("type") == "sell"]
-    return len(bought) > 0 and len(sold) < len(bought)
+    return _summarize_history(history).bought_not_sold
 
 
 def _screening_count(history: dict) -> int:
@@ -55,32 +57,89 @@ def _has_concern_notes(history: dict) -> bool:
     return any(n.get("type") == "concern" for n in notes)
 
 
+@dataclass(slots=True)
+class HistoryFlags:
+    """Everything _recommend_skill needs from a history, gathered in one pass."""
+
+    bought_not_sold: bool
+    thesis_stale: bool      # thesis note older than 90 days
+    exit_alert: bool        # health check + lesson note within 30 days
+    screen_count: int
+    recent_research: bool   # research within 7 days
+    has_concern: bool
+
+
+def _summarize_history(history: dict, today: Optional[date] = None) -> HistoryFlags:
+    """Walk trades/notes/researches once each and derive the skill flags.
+
+    Equivalent to the individual _has_* / _thesis_needs_review helpers with
+    the thresholds _recommend_skill uses, sharing one clock read.
+    """
+    today = today or date.today()
+
+    bought = sold = 0
+    for t in history.get("trades", []):
+        ttype = t.get("type")
+        if ttype == "buy":
+            bought += 1
+        elif ttype == "sell":
+            sold += 1
+
+    thesis_stale = recent_lesson = has_concern = False
+    for n in history.get("notes", []):
+        ntype = n.get("type")
+        if ntype == "thesis":
+            if not thesis_stale and _days_since(n.get("date", ""), today) >= 90:
+                thesis_stale = True
+        elif ntype == "lesson":
+            if not recent_lesson and _days_since(n.get("date", ""), today) <= 30:
+                recent_lesson = True
+        elif ntype == "concern":
+            has_concern = True
+
+    recent_research = any(
+        _days_since(r.get("date", ""), today) <= 7
+        for r in history.get("researches", [])
+    )
+
+    return HistoryFlags(
+        bought_not_sold=bought > 0 and sold < bought,
+        thesis_stale=thesis_stale,
+        exit_alert=bool(history.get("health_checks")) and recent_lesson,
+        screen_count=len(history.get("screens", [])),
+        recent_research=recent_research,
+        has_concern=has_concern,
+    )
+
+
 def _recommend_skill(history: dict, is_bookmarked: bool,
                      is_held: bool = False) -> tuple[str, str, str]:
     """Determine recommended skill based on graph state.
 
     Returns (skill, reason, relationship).
     """
+    flags = _summarize_history(history)
+
     # Priority order: higher = checked first
     # KIK-414: HOLDS relationship is authoritative for current holdings
-    if is_held or _has_bought_not_sold(history):
-        if _thesis_needs_review(history, 90):
+    if is_held or flags.bought_not_sold:
+        if flags.thesis_stale:
             return ("health", "テーゼ3ヶ月経過 → レビュー促し", "保有(要レビュー)")
         return ("health", "保有銘柄 → ヘルスチェック優先", "保有")
 
-    if _has_exit_alert(history):
+    if flags.exit_alert:
         return ("screen_alternative", "EXIT判定 → 代替候補検索", "EXIT判定")
 
     if is_bookmarked:
         return ("report", "ウォッチ中 → レポート + 前回差分", "ウォッチ中")
 
-    if _screening_count(history) >= 3:
+    if flags.screen_count >= 3:
         return ("report", "3回以上スクリーニング出現 → 注目銘柄", "注目")
 
-    if _has_recent_research(history, 7):
+    if flags.recent_research:
         return ("report_diff", "直近リサーチあり → 差分モード", "リサーチ済")
 
-    if _has_concern_notes(history):
+    if flags.has_concern:
         return ("report", "懸念メモあり → 再検証", "懸念あり")
 
     if history.get("screens") or history.get("reports") or history.get("trades"):
@@ -89,21 +148,22 @@ def _recommend_skill(history: dict, is_bookmarked: bool,
     return ("report", "未知の銘柄 → ゼロから調査", "未知")
 
 
-def _check_bookmarked(symbol: str, _graph_store=None) -> bool:
+def _check_bookmarked(symbol: str, _graph_store=None, session=None) -> bool:
     """Check if symbol is in any watchlist via Neo4j.
 
     Args:
         symbol: Ticker symbol to check.
         _graph_store: graph_store module (dependency injection for testability).
             When None, imports from src.data at call time.
+        session: Open Neo4j session to reuse. When None, a new one is opened.
     """
     if _graph_store is None:
         from src.data import graph_store as _graph_store
-    driver = _graph_store._get_driver()
-    if driver is None:
+    driver = _graph_store._get_driver() if session is None else None
+    if driver is None and session is None:
         return False
     try:
-        with driver.session() as session:
+        with _read_session(driver, session) as session:
             result = session.run(
                 "MATCH (w:Watchlist)-[:BOOKMARKED]->(s:Stock {symbol: $symbol}) "
                 "RETURN count(w) AS cnt",
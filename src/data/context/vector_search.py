@@ -4,14 +4,60 @@ Embeds user input via TEI, runs vector similarity search on Neo4j,
 and merges results with symbol-based context.
 """
 
+import threading
+import time
+from collections import Counter, OrderedDict
 from typing import Optional
 
 from src.data.context.freshness import (
     _action_directive,
     _best_freshness,
-    freshness_label,
+    _bulk_freshness,
 )
 
+# Node label of the dominant vector hit -> skill to recommend
+_LABEL_SKILL_MAP = {
+    "Screen": "screen-stocks",
+    "Report": "report",
+    "Trade": "health",
+    "Research": "market-research",
+    "HealthCheck": "health",
+    "MarketContext": "market-research",
+    "Note": "report",
+}
+
+# Query embeddings keyed by stripped prompt text: repeat prompts in an agent
+# loop skip the TEI round-trip. Failed embeddings (None) are not cached.
+_EMBED_CACHE_TTL = 600.0
+_EMBED_CACHE_MAXSIZE = 1024
+_embed_cache: OrderedDict[str, tuple[list[float], float]] = OrderedDict()
+_embed_lock = threading.Lock()
+
+
+def _cached_embedding(text: str, get_embedding) -> Optional[list[float]]:
+    """Return the TEI embedding of *text*, reusing it for _EMBED_CACHE_TTL seconds."""
+    key = text.strip()
+    now = time.monotonic()
+    with _embed_lock:
+        entry = _embed_cache.get(key)
+        if entry is not None and entry[1] > now:
+            _embed_cache.move_to_end(key)
+            return entry[0]
+    emb = get_embedding(key)
+    if emb is not None:
+        with _embed_lock:
+            _embed_cache[key] = (emb, now + _EMBED_CACHE_TTL)
+            _embed_cache.move_to_end(key)
+            if len(_embed_cache) > _EMBED_CACHE_MAXSIZE:
+                _embed_cache.popitem(last=False)
+    return emb
+
+
+def clear_embedding_cache() -> None:
+    """Drop cached query embeddings (useful for tests)."""
+    with _embed_lock:
+        _embed_cache.clear()
+
 
 def _vector_search(user_input: str, _graph_query=None) -> list[dict]:
     """Embed user input via TEI and run vector similarity search on Neo4j.
@@ -28,7 +74,7 @@ def _vector_search(user_input: str, _graph_query=None) -> list[dict]:
         from src.data.embedding_client import get_embedding, is_available
         if not is_available():
             return []
-        emb = get_embedding(user_input)
+        emb = _cached_embedding(user_input, get_embedding)
         if emb is None:
             return []
         if _graph_query is None:
@@ -38,38 +84,34 @@ def _vector_search(user_input: str, _graph_query=None) -> list[dict]:
         return []
 
 
-def _format_vector_results(results: list[dict]) -> str:
-    """Format vector search results as markdown with freshness labels (KIK-427)."""
+def _vector_freshness(results: list[dict]) -> list[str]:
+    """Freshness labels for the top-5 results, from one clock read."""
+    return _bulk_freshness([r.get("date", "") for r in results[:5]])
+
+
+def _format_vector_results(results: list[dict],
+                           labels: Optional[list[str]] = None) -> str:
+    """Format vector search results as markdown with freshness labels (KIK-427).
+
+    *labels* are the results' freshness labels when already computed.
+    """
     lines = ["## 関連する過去の記録"]
-    for r in results[:5]:
+    if labels is None:
+        labels = _vector_freshness(results)
+    for r, fl in zip(results[:5], labels):
         score_pct = f"{r['score'] * 100:.0f}%"
         summary = r.get("summary") or "(要約なし)"
-        fl = freshness_label(r.get("date", ""))
         lines.append(f"- [{r['label']}][{fl}] {summary} (類似度{score_pct})")
     return "\n".join(lines)
 
 
 def _infer_skill_from_vectors(results: list[dict]) -> str:
     """Infer a recommended skill from vector search result labels."""
-    if not results:
-        return "report"
-    label_counts: dict[str, int] = {}
-    for r in results[:5]:
-        label = r.get("label", "")
-        label_counts[label] = label_counts.get(label, 0) + 1
-    if not label_counts:
+    # most_common keeps first-seen order on ties, like max() over a dict
+    top = Counter(r.get("label", "") for r in results[:5]).most_common(1)
+    if not top:
         return "report"
-    top_label = max(label_counts, key=label_counts.get)  # type: ignore[arg-type]
-    mapping = {
-        "Screen": "screen-stocks",
-        "Report": "report",
-        "Trade": "health",
-        "Research": "market-research",
-        "HealthCheck": "health",
-        "MarketContext": "market-research",
-        "Note": "report",
-    }
-    return mapping.get(top_label, "report")
+    return _LABEL_SKILL_MAP.get(top[0][0], "report")
 
 
 def _merge_context(
@@ -85,12 +127,12 @@ def _merge_context(
 
     if not symbol_context and vector_results:
         # KIK-428: Prepend action directive based on best freshness
-        labels = [freshness_label(r.get("date", "")) for r in vector_results[:5]]
+        labels = _vector_freshness(vector_results)
         overall = _best_freshness(labels) if labels else "NONE"
         return {
             "symbol": "",
             "context_markdown": (_action_directive(overall) + "\n\n"
-                                 + _format_vector_results(vector_results)),
+                                 + _format_vector_results(vector_results, labels)),
             "recommended_skill": _infer_skill_from_vectors(vector_results),
             "recommendation_reason": "ベクトル類似検索",
             "relationship": "関連",
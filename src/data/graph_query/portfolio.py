@@ -213,7 +213,9 @@ def vector_search(
 ) -> list[dict]:
     """Cross-type vector similarity search across Neo4j nodes.
 
-    Queries each node type's vector index and merges results by score.
+    Queries each node type's vector index in one UNION statement and
+    merges results by score; falls back to one query per index when a
+    statement over all indexes fails (e.g. an index not yet created).
 
     Parameters
     ----------
@@ -235,35 +237,77 @@ def vector_search(
         return []
 
     labels = node_labels or _VECTOR_LABELS
-    results: list[dict] = []
 
     # KIK-573: Use single session for all queries (was 10 separate sessions)
     try:
         with driver.session() as session:
-            for label in labels:
-                index_name = f"{label.lower()}_embedding"
+            if all(label.isidentifier() for label in labels):
                 try:
-                    records = session.run(
-                        "CALL db.index.vector.queryNodes($index, $k, $emb) "
-                        "YIELD node, score "
-                        "RETURN node.semantic_summary AS summary, "
-                        "node.date AS date, node.id AS id, "
-                        "node.symbol AS symbol, score",
-                        index=index_name, k=top_k, emb=query_embedding,
-                    )
-                    for r in records:
-                        results.append({
-                            "label": label,
-                            "summary": r["summary"],
-                            "date": r["date"],
-                            "id": r["id"],
-                            "symbol": r.get("symbol"),
-                            "score": r["score"],
-                        })
+                    return _vector_search_union(session, labels, top_k, query_embedding)
                 except Exception:
-                    continue  # index not yet created or label has no embeddings
+                    pass  # some index missing: query the indexes one by one
+            return _vector_search_each(session, labels, top_k, query_embedding)
     except Exception:
-        pass
+        return []
+
+
+def _vector_search_union(session, labels, top_k, query_embedding) -> list[dict]:
+    """Query every label's vector index in one statement, merged server-side.
+
+    The embedding is sent once and Neo4j does the score sort and top_k cut.
+    Fails as a whole if any index does not exist yet.
+    """
+    branches = " UNION ALL ".join(
+        f"CALL db.index.vector.queryNodes('{label.lower()}_embedding', $k, $emb) "
+        f"YIELD node, score RETURN '{label}' AS label, node, score"
+        for label in labels
+    )
+    records = session.run(
+        "CALL { " + branches + " } "
+        "RETURN label, node.semantic_summary AS summary, "
+        "node.date AS date, node.id AS id, "
+        "node.symbol AS symbol, score "
+        "ORDER BY score DESC LIMIT $k",
+        k=top_k, emb=query_embedding,
+    )
+    return [
+        {
+            "label": r["label"],
+            "summary": r["summary"],
+            "date": r["date"],
+            "id": r["id"],
+            "symbol": r.get("symbol"),
+            "score": r["score"],
+        }
+        for r in records
+    ]
+
+
+def _vector_search_each(session, labels, top_k, query_embedding) -> list[dict]:
+    """Query each label's vector index separately and merge by score."""
+    results: list[dict] = []
+    for label in labels:
+        index_name = f"{label.lower()}_embedding"
+        try:
+            records = session.run(
+                "CALL db.index.vector.queryNodes($index, $k, $emb) "
+                "YIELD node, score "
+                "RETURN node.semantic_summary AS summary, "
+                "node.date AS date, node.id AS id, "
+                "node.symbol AS symbol, score",
+                index=index_name, k=top_k, emb=query_embedding,
+            )
+            for r in records:
+                results.append({
+                    "label": label,
+                    "summary": r["summary"],
+                    "date": r["date"],
+                    "id": r["id"],
+                    "symbol": r.get("symbol"),
+                    "score": r["score"],
+                })
+        except Exception:
+            continue  # index not yet created or label has no embeddings
 
     results.sort(key=lambda x: x["score"], reverse=True)
     return results[:top_k]
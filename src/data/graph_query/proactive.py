@@ -86,9 +86,9 @@ def get_concern_notes(limit: int = 1) -> list[dict]:
     from datetime import date
     try:
         from src.data.note_manager import load_notes
-        notes = load_notes(note_type="concern")
+        notes = load_notes(note_type="concern", limit=limit)
         out = []
-        for n in notes[:limit]:
+        for n in notes:
             note_date = n.get("date", "")
             days_old = (
                 (date.today() - date.fromisoformat(note_date)).days
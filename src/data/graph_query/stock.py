@@ -77,22 +77,25 @@ def get_trade_context(symbol: str) -> dict:
         return empty
     try:
         with driver.session() as session:
-            trades = session.run(
-                "MATCH (t:Trade)-[:BOUGHT|SOLD]->(s:Stock {symbol: $symbol}) "
-                "RETURN t.date AS date, t.type AS type, "
-                "t.shares AS shares, t.price AS price "
-                "ORDER BY t.date DESC",
+            # Both lists in one round-trip; collect() skips the nulls that
+            # OPTIONAL MATCH yields when a stock has no trades or notes
+            record = session.run(
+                "MATCH (s:Stock {symbol: $symbol}) "
+                "OPTIONAL MATCH (t:Trade)-[:BOUGHT|SOLD]->(s) "
+                "WITH s, t ORDER BY t.date DESC "
+                "WITH s, collect(CASE WHEN t IS NOT NULL THEN "
+                "{date: t.date, type: t.type, shares: t.shares, price: t.price} END) AS trades "
+                "OPTIONAL MATCH (n:Note)-[:ABOUT]->(s) "
+                "WITH trades, n ORDER BY n.date DESC "
+                "RETURN trades, collect(CASE WHEN n IS NOT NULL THEN "
+                "{date: n.date, type: n.type, content: n.content} END) AS notes",
                 symbol=symbol,
-            )
-            notes = session.run(
-                "MATCH (n:Note)-[:ABOUT]->(s:Stock {symbol: $symbol}) "
-                "RETURN n.date AS date, n.type AS type, n.content AS content "
-                "ORDER BY n.date DESC",
-                symbol=symbol,
-            )
+            ).single()
+            if record is None:
+                return empty
             return {
-                "trades": [dict(r) for r in trades],
-                "notes": [dict(r) for r in notes],
+                "trades": [dict(t) for t in record["trades"]],
+                "notes": [dict(n) for n in record["notes"]],
             }
     except Exception:
         return empty
@@ -33,13 +33,18 @@ from src.data.graph_store._common import (  # noqa: F401
     clear_all,
     close,
     create_ai_relationship,
+    flush_background,
     get_mode,
     init_schema,
     is_available,
+    list_constraints,
+    submit_background,
+    write_batch,
 )
 
 # --- stock.py: Stock, Screen, Report, Watchlist, Theme ---
 from src.data.graph_store.stock import (  # noqa: F401
+    bulk_merge_stocks,
     get_stock_history,
     merge_report,
     merge_report_full,
@@ -4,10 +4,14 @@ Contains connection management, mode detection, error handling decorator,
 and shared helper functions used across all graph_store submodules.
 """
 
+import atexit
+import contextlib
 import functools
 import os
+import queue
 import re
 import sys
+import threading
 import time
 from datetime import datetime
 from typing import Optional
@@ -20,6 +24,27 @@ from typing import Optional
 _NEO4J_URI = os.environ.get("NEO4J_URI", "bolt://localhost:7688")
 _NEO4J_USER = os.environ.get("NEO4J_USER", "neo4j")
 _NEO4J_PASSWORD = os.environ.get("NEO4J_PASSWORD", "password")
+_NEO4J_DATABASE = os.environ.get("NEO4J_DATABASE", "neo4j")
+
+
+def _pool_size_env(default: int = 32) -> int:
+    """Read NEO4J_POOL_SIZE, returning *default* when unset or invalid."""
+    try:
+        size = int(os.environ.get("NEO4J_POOL_SIZE", default))
+    except ValueError:
+        return default
+    return size if size > 0 else default
+
+
+# Pool / timeout tuning: fail fast when Neo4j is down or the pool is
+# exhausted so callers degrade gracefully instead of blocking for 30-60s
+_DRIVER_CONFIG = {
+    "max_connection_pool_size": _pool_size_env(),
+    "connection_acquisition_timeout": 5.0,
+    "connection_timeout": 2.0,
+    "max_connection_lifetime": 3600,
+    "keep_alive": True,
+}
 
 _driver = None
 _unavailable_warned = False  # KIK-443: warn once on connection failure
@@ -57,6 +82,30 @@ def get_mode() -> str:
     return _get_mode()
 
 
+class _DatabaseDriver:
+    """Driver wrapper whose sessions name the database explicitly.
+
+    Without a database the driver resolves the user's home database with an
+    extra server round-trip per session; every ``driver.session()`` call in
+    the codebase gets NEO4J_DATABASE by default instead.
+    """
+
+    def __init__(self, driver, database: str):
+        self._driver = driver
+        self._database = database
+
+    def session(self, **config):
+        config.setdefault("database", self._database)
+        return self._driver.session(**config)
+
+    def execute_query(self, query, parameters=None, **kwargs):
+        kwargs.setdefault("database_", self._database)
+        return self._driver.execute_query(query, parameters, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+
 def _get_driver():
     """Lazy-init Neo4j driver. Returns None if neo4j package not installed."""
     global _driver
@@ -64,7 +113,12 @@ def _get_driver():
         return _driver
     try:
         from neo4j import GraphDatabase
-        _driver = GraphDatabase.driver(_NEO4J_URI, auth=(_NEO4J_USER, _NEO4J_PASSWORD))
+        _driver = _DatabaseDriver(
+            GraphDatabase.driver(
+                _NEO4J_URI, auth=(_NEO4J_USER, _NEO4J_PASSWORD), **_DRIVER_CONFIG,
+            ),
+            _NEO4J_DATABASE,
+        )
         return _driver
     except Exception:
         return None
@@ -110,6 +164,248 @@ def close():
         _driver = None
 
 
+# ---------------------------------------------------------------------------
+# Batched writes
+# ---------------------------------------------------------------------------
+
+_WRITE_BATCH_SIZE = 1000
+_batch_local = threading.local()
+
+
+class _WriteBuffer:
+    """Session stand-in that queues statements for batched transactions.
+
+    merge_* helpers only call ``session.run`` for its side effect, so inside
+    write_batch() they receive this buffer instead of a real session.
+    Statements that could not be committed are counted in ``failed``.
+    """
+
+    def __init__(self, driver, batch_size: int):
+        self._driver = driver
+        self._batch_size = batch_size
+        self._pending: list[tuple[str, dict]] = []
+        self.total = 0
+        self.failed = 0
+        self.last_error: Optional[Exception] = None
+
+    def run(self, query: str, parameters: Optional[dict] = None, **kwargs) -> None:
+        self._pending.append((query, {**(parameters or {}), **kwargs}))
+        self.total += 1
+        if len(self._pending) >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Commit the queue; never raises, failures are counted instead.
+
+        When the batch is rejected because of one of its statements, the
+        statements are replayed one per transaction so only the bad ones are
+        lost.  Connection-level failures fail the whole batch.
+        """
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        done = 0  # replayed statements, committed or counted as failed
+        try:
+            with self._driver.session() as session:
+                try:
+                    session.execute_write(_run_statements, pending)
+                    return
+                except Exception as exc:
+                    if not _is_statement_error(exc):
+                        raise
+                for statement in pending:
+                    try:
+                        session.execute_write(_run_statements, [statement])
+                    except Exception as exc:
+                        if not _is_statement_error(exc):
+                            raise
+                        self._record_failure(exc)
+                    done += 1
+        except Exception as exc:
+            self._record_failure(exc, len(pending) - done)
+
+    def _record_failure(self, exc: Exception, count: int = 1) -> None:
+        self.failed += count
+        self.last_error = exc
+
+
+def _is_statement_error(exc: Exception) -> bool:
+    """True when *exc* was caused by the statement itself, not the connection."""
+    if isinstance(exc, (TypeError, ValueError)):
+        return True
+    return str(getattr(exc, "code", "") or "").startswith("Neo.ClientError")
+
+
+def _run_statements(tx, statements: list[tuple[str, dict]]) -> None:
+    for query, params in statements:
+        tx.run(query, params)
+
+
+@contextlib.contextmanager
+def _session(driver):
+    """Yield a session for a write helper, or this thread's write_batch buffer."""
+    buffer = getattr(_batch_local, "buffer", None)
+    if buffer is not None:
+        yield buffer
+        return
+    with driver.session() as session:
+        yield session
+
+
+def _execute_write(driver, query: str, **params) -> None:
+    """Run one write statement, or queue it in this thread's write_batch buffer.
+
+    Outside a batch this goes through ``driver.execute_query`` (routed to the
+    writer by default), which opens the session, runs the statement in a
+    retried managed transaction and closes it in one call.
+    """
+    buffer = getattr(_batch_local, "buffer", None)
+    if buffer is not None:
+        buffer.run(query, **params)
+        return
+    driver.execute_query(query, params)
+
+
+@contextlib.contextmanager
+def _read_session(driver, session=None):
+    """Yield the caller's *session* when given, else a fresh one from *driver*.
+
+    Fresh sessions use READ access mode so a cluster can route them to a
+    read replica instead of the leader.
+    """
+    if session is not None:
+        yield session
+        return
+    with driver.session(default_access_mode="READ") as own:
+        yield own
+
+
+@contextlib.contextmanager
+def write_batch(batch_size: int = _WRITE_BATCH_SIZE):
+    """Group graph_store writes on the current thread into batched transactions.
+
+    Inside the block, merge_* helpers queue their statements instead of
+    opening an auto-commit session per call.  The queue is committed through
+    ``execute_write`` (retried on transient errors such as deadlocks) every
+    ``batch_size`` statements and on exit.  A batch rejected by one bad
+    statement is replayed statement by statement, so only that write is lost.
+    Nested blocks join the outer one; no-op when Neo4j is off or unavailable.
+
+    Because merge_* helpers return True as soon as their statements are
+    queued, lost writes are reported on exit instead: RuntimeError is raised
+    (chained to the last driver error) when any queued statement failed.
+    The block receives the buffer (None when writes are not batched), whose
+    ``failed`` / ``total`` counts tell how many of its statements were lost.
+    """
+    outer = getattr(_batch_local, "buffer", None)
+    if outer is not None or _get_mode() == "off":
+        yield outer
+        return
+    driver = _get_driver()
+    if driver is None:
+        yield None
+        return
+    buffer = _WriteBuffer(driver, batch_size)
+    _batch_local.buffer = buffer
+    try:
+        yield buffer
+    finally:
+        _batch_local.buffer = None
+        buffer.flush()
+    if buffer.failed:
+        print(
+            f"⚠️  Neo4j batched write failed: {buffer.failed}/{buffer.total} statements"
+            f" ({buffer.last_error})",
+            file=sys.stderr,
+        )
+        raise RuntimeError(
+            f"{buffer.failed} of {buffer.total} batched graph writes failed"
+        ) from buffer.last_error
+
+
+# ---------------------------------------------------------------------------
+# Background writes
+# ---------------------------------------------------------------------------
+
+_BACKGROUND_QUEUE_SIZE = 256
+_BACKGROUND_EXIT_TIMEOUT = 10.0
+_bg_queue: "queue.Queue | None" = None
+_bg_lock = threading.Lock()
+
+
+def _background_worker(q: "queue.Queue") -> None:
+    while True:
+        fn, args, kwargs = q.get()
+        try:
+            fn(*args, **kwargs)
+        except Exception:
+            pass  # graph writes are a view; the caller already has its master copy
+
+
+def _background_queue() -> "queue.Queue":
+    global _bg_queue
+    with _bg_lock:
+        if _bg_queue is None:
+            _bg_queue = queue.Queue(maxsize=_BACKGROUND_QUEUE_SIZE)
+            threading.Thread(
+                target=_background_worker, args=(_bg_queue,),
+                name="graph-store-writer", daemon=True,
+            ).start()
+            atexit.register(_drain_background_at_exit)
+        return _bg_queue
+
+
+def submit_background(fn, *args, **kwargs) -> bool:
+    """Run ``fn(*args, **kwargs)`` on the graph writer thread.
+
+    Jobs run one at a time in submission order, so a later job can rely on
+    nodes written by an earlier one.  When Neo4j is off the job runs inline
+    (every graph call in it is then a no-op).  A full queue drops the job
+    with a warning and returns False.  Pending jobs are drained at exit.
+    """
+    if _get_mode() == "off":
+        try:
+            fn(*args, **kwargs)
+        except Exception:
+            pass
+        return True
+    try:
+        _background_queue().put_nowait((fn, args, kwargs))
+    except queue.Full:
+        print("⚠️  Neo4j background queue full; graph write dropped", file=sys.stderr)
+        return False
+    return True
+
+
+def flush_background(timeout: Optional[float] = None) -> bool:
+    """Block until every job queued so far has run; False on timeout."""
+    q = _bg_queue
+    if q is None:
+        return True
+    done = threading.Event()
+    try:
+        q.put((done.set, (), {}), timeout=timeout)
+    except queue.Full:
+        return False
+    return done.wait(timeout)
+
+
+def _drain_background_at_exit() -> None:
+    """atexit hook: wait for every queued job so no write is cut off.
+
+    The writer is a daemon thread, so returning early would kill it
+    mid-write.  A slow drain is announced on stderr, then waited out.
+    """
+    if flush_background(_BACKGROUND_EXIT_TIMEOUT):
+        return
+    pending = _bg_queue.qsize() if _bg_queue is not None else 0
+    print(
+        f"⚠️  Waiting for {pending} pending Neo4j background writes...",
+        file=sys.stderr,
+    )
+    flush_background()
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -194,6 +490,7 @@ _SCHEMA_INDEXES = [
     "CREATE INDEX report_date IF NOT EXISTS FOR (r:Report) ON (r.date)",
     "CREATE INDEX trade_date IF NOT EXISTS FOR (t:Trade) ON (t.date)",
     "CREATE INDEX note_type IF NOT EXISTS FOR (n:Note) ON (n.type)",
+    "CREATE INDEX note_date IF NOT EXISTS FOR (n:Note) ON (n.date)",
     "CREATE INDEX research_date IF NOT EXISTS FOR (r:Research) ON (r.date)",
     "CREATE INDEX research_type IF NOT EXISTS FOR (r:Research) ON (r.research_type)",
     "CREATE INDEX market_context_date IF NOT EXISTS FOR (m:MarketContext) ON (m.date)",
@@ -241,27 +538,68 @@ _VECTOR_INDEXES = [
     "OPTIONS {indexConfig: {`vector.dimensions`: 384, `vector.similarity_function`: 'cosine'}}",
 ]
 
+# Fulltext index for company-name -> symbol lookups (auto_context)
+_FULLTEXT_INDEXES = [
+    "CREATE FULLTEXT INDEX stock_name_ft IF NOT EXISTS FOR (s:Stock) ON EACH [s.name]",
+]
+
+
+# Driver whose schema init_schema() already created (skip re-issuing DDL)
+_schema_driver = None
+
 
 def init_schema() -> bool:
-    """Create constraints and indexes. Returns True on success."""
+    """Create constraints and indexes. Returns True on success.
+
+    Constraints and plain indexes are created in one transaction; repeat
+    calls on the same driver return True without touching the database.
+    """
+    global _schema_driver
     driver = _get_driver()
     if driver is None:
         return False
+    if driver is _schema_driver:
+        return True
     try:
         with driver.session() as session:
-            for stmt in _SCHEMA_CONSTRAINTS + _SCHEMA_INDEXES:
-                session.run(stmt)
+            session.execute_write(
+                _run_statements,
+                [(stmt, {}) for stmt in _SCHEMA_CONSTRAINTS + _SCHEMA_INDEXES],
+            )
             # KIK-420: Vector indexes (separate try/except -- older Neo4j may not support)
             for stmt in _VECTOR_INDEXES:
                 try:
                     session.run(stmt)
                 except Exception:
                     pass  # Skip if vector indexes not supported
+            for stmt in _FULLTEXT_INDEXES:
+                try:
+                    session.run(stmt)
+                except Exception:
+                    pass  # name lookups fall back to a label scan
+        _schema_driver = driver
         return True
     except Exception:
         return False
 
 
+def list_constraints() -> list[str]:
+    """Return names of existing schema constraints (via SHOW CONSTRAINTS).
+
+    Used after init_schema() to confirm bulk MERGEs will hit unique-index
+    seeks (e.g. ``stock_symbol``). Returns [] when Neo4j is unavailable.
+    """
+    driver = _get_driver()
+    if driver is None:
+        return []
+    try:
+        with driver.session() as session:
+            result = session.run("SHOW CONSTRAINTS YIELD name RETURN name")
+            return [r["name"] for r in result]
+    except Exception:
+        return []
+
+
 # ---------------------------------------------------------------------------
 # AI relationship cyphers (KIK-434)
 # ---------------------------------------------------------------------------
@@ -318,14 +656,14 @@ def create_ai_relationship(
         return False
     try:
         ts = datetime.now().isoformat(timespec="seconds")
-        with driver.session() as session:
-            session.run(
-                cypher,
-                fid=from_id, tid=to_id,
-                conf=float(confidence),
-                reason=str(reason)[:500],
-                ts=ts,
-            )
+        _execute_write(
+            driver,
+            cypher,
+            fid=from_id, tid=to_id,
+            conf=float(confidence),
+            reason=str(reason)[:500],
+            ts=ts,
+        )
         return True
     except Exception:
         return False
@@ -29,7 +29,7 @@ def merge_market_context(context_date: str, indices: list[dict],
         return False
     context_id = f"market_context_{context_date}"
     try:
-        with driver.session() as session:
+        with _common._session(driver) as session:
             session.run(
                 "MERGE (m:MarketContext {id: $id}) "
                 "SET m.date = $date, m.indices = $indices",
@@ -66,7 +66,7 @@ def merge_market_context_full(
         return False
     context_id = f"market_context_{context_date}"
     try:
-        with driver.session() as session:
+        with _common._session(driver) as session:
             # --- Indicator nodes (from indices) ---
             for i, idx in enumerate(indices[:20]):
                 iid = f"{context_id}_ind_{i}"
@@ -186,22 +186,22 @@ def merge_theme_trend(
         return False
     trend_id = f"theme_trend_{date}_{theme}_{region}"
     try:
-        with driver.session() as session:
-            session.run(
-                "MERGE (tt:ThemeTrend {id: $id}) "
-                "SET tt.date = $date, tt.theme = $theme, "
-                "    tt.confidence = $confidence, tt.reason = $reason, "
-                "    tt.rank = $rank, tt.region = $region "
-                "MERGE (t:Theme {name: $theme}) "
-                "MERGE (tt)-[:FOR_THEME]->(t)",
-                id=trend_id,
-                date=date,
-                theme=_common._truncate(theme, 100),
-                confidence=float(confidence),
-                reason=_common._truncate(reason, 500),
-                rank=int(rank),
-                region=_common._truncate(region, 50),
-            )
+        _common._execute_write(
+            driver,
+            "MERGE (tt:ThemeTrend {id: $id}) "
+            "SET tt.date = $date, tt.theme = $theme, "
+            "    tt.confidence = $confidence, tt.reason = $reason, "
+            "    tt.rank = $rank, tt.region = $region "
+            "MERGE (t:Theme {name: $theme}) "
+            "MERGE (tt)-[:FOR_THEME]->(t)",
+            id=trend_id,
+            date=date,
+            theme=_common._truncate(theme, 100),
+            confidence=float(confidence),
+            reason=_common._truncate(reason, 500),
+            rank=int(rank),
+            region=_common._truncate(region, 50),
+        )
         return True
     except Exception:
         return False
@@ -30,39 +30,40 @@ def merge_note(
     if driver is None:
         return False
     try:
-        with driver.session() as session:
-            session.run(
-                "MERGE (n:Note {id: $id}) "
-                "SET n.date = $date, n.type = $type, "
-                "n.content = $content, n.source = $source, "
-                "n.category = $category",
-                id=note_id, date=note_date, type=note_type,
-                content=content, source=source, category=category,
-            )
+        with _common._session(driver) as session:
+            # Node and its ABOUT link in one statement (one Bolt round-trip)
             if symbol:
-                session.run(
-                    "MATCH (n:Note {id: $note_id}) "
+                about = (
+                    "WITH n "
                     "MERGE (s:Stock {symbol: $symbol}) "
-                    "MERGE (n)-[:ABOUT]->(s)",
-                    note_id=note_id, symbol=symbol,
+                    "MERGE (n)-[:ABOUT]->(s)"
                 )
             elif category == "portfolio":
-                session.run(
-                    "MATCH (n:Note {id: $note_id}) "
+                about = (
+                    "WITH n "
                     "MERGE (p:Portfolio {name: 'default'}) "
-                    "MERGE (n)-[:ABOUT]->(p)",
-                    note_id=note_id,
+                    "MERGE (n)-[:ABOUT]->(p)"
                 )
             elif category == "market":
-                session.run(
-                    "MATCH (n:Note {id: $note_id}) "
+                about = (
                     "WITH n "
                     "OPTIONAL MATCH (mc:MarketContext) "
                     "WITH n, mc ORDER BY mc.date DESC LIMIT 1 "
                     "WHERE mc IS NOT NULL "
-                    "MERGE (n)-[:ABOUT]->(mc)",
-                    note_id=note_id,
+                    "MERGE (n)-[:ABOUT]->(mc)"
                 )
+            else:
+                about = ""
+            session.run(
+                "MERGE (n:Note {id: $id}) "
+                "SET n.date = $date, n.type = $type, "
+                "n.content = $content, n.source = $source, "
+                "n.category = $category "
+                + about,
+                id=note_id, date=note_date, type=note_type,
+                content=content, source=source, category=category,
+                symbol=symbol,
+            )
             _common._set_embedding(session, "Note", note_id, semantic_summary, embedding)
         return True
     except Exception:
@@ -92,7 +93,7 @@ def merge_action_item(
     if driver is None:
         return False
     try:
-        with driver.session() as session:
+        with _common._session(driver) as session:
             session.run(
                 "MERGE (a:ActionItem {id: $id}) "
                 "SET a.date = $date, a.trigger_type = $trigger_type, "
@@ -140,17 +141,17 @@ def update_action_item_linear(
     if driver is None:
         return False
     try:
-        with driver.session() as session:
-            session.run(
-                "MATCH (a:ActionItem {id: $id}) "
-                "SET a.linear_issue_id = $lid, "
-                "a.linear_issue_url = $lurl, "
-                "a.linear_identifier = $lident",
-                id=action_id,
-                lid=linear_issue_id,
-                lurl=linear_issue_url,
-                lident=linear_identifier,
-            )
+        _common._execute_write(
+            driver,
+            "MATCH (a:ActionItem {id: $id}) "
+            "SET a.linear_issue_id = $lid, "
+            "a.linear_issue_url = $lurl, "
+            "a.linear_identifier = $lident",
+            id=action_id,
+            lid=linear_issue_id,
+            lurl=linear_issue_url,
+            lident=linear_identifier,
+        )
         return True
     except Exception:
         return False
@@ -28,26 +28,23 @@ def merge_trade(
     trade_id = f"trade_{trade_date}_{trade_type}_{symbol}"
     rel_type = "BOUGHT" if trade_type == "buy" else "SOLD"
     try:
-        with driver.session() as session:
+        with _common._session(driver) as session:
             session.run(
                 "MERGE (t:Trade {id: $id}) "
                 "SET t.date = $date, t.type = $type, t.symbol = $symbol, "
                 "t.shares = $shares, t.price = $price, t.currency = $currency, "
                 "t.memo = $memo, "
                 "t.sell_price = $sell_price, t.realized_pnl = $realized_pnl, "
-                "t.hold_days = $hold_days",
+                "t.hold_days = $hold_days "
+                "WITH t "
+                "MERGE (s:Stock {symbol: $symbol}) "
+                f"MERGE (t)-[:{rel_type}]->(s)",
                 id=trade_id, date=trade_date, type=trade_type,
                 symbol=symbol, shares=shares, price=price,
                 currency=currency, memo=memo,
                 sell_price=sell_price, realized_pnl=realized_pnl,
                 hold_days=hold_days,
             )
-            session.run(
-                f"MATCH (t:Trade {{id: $trade_id}}) "
-                f"MERGE (s:Stock {{symbol: $symbol}}) "
-                f"MERGE (t)-[:{rel_type}]->(s)",
-                trade_id=trade_id, symbol=symbol,
-            )
             _common._set_embedding(session, "Trade", trade_id, semantic_summary, embedding)
         return True
     except Exception:
@@ -69,7 +66,7 @@ def merge_health(health_date: str, summary: dict, symbols: list[str],
         return False
     health_id = f"health_{health_date}"
     try:
-        with driver.session() as session:
+        with _common._session(driver) as session:
             session.run(
                 "MERGE (h:HealthCheck {id: $id}) "
                 "SET h.date = $date, h.total = $total, "
@@ -79,12 +76,14 @@ def merge_health(health_date: str, summary: dict, symbols: list[str],
                 healthy=summary.get("healthy", 0),
                 exit_count=summary.get("exit", 0),
             )
-            for sym in symbols:
+            if symbols:
+                # One UNWIND statement for all CHECKED relationships
                 session.run(
                     "MATCH (h:HealthCheck {id: $health_id}) "
-                    "MERGE (s:Stock {symbol: $symbol}) "
+                    "UNWIND $symbols AS symbol "
+                    "MERGE (s:Stock {symbol: symbol}) "
                     "MERGE (h)-[:CHECKED]->(s)",
-                    health_id=health_id, symbol=sym,
+                    health_id=health_id, symbols=list(symbols),
                 )
             _common._set_embedding(session, "HealthCheck", health_id, semantic_summary, embedding)
         return True
@@ -111,7 +110,7 @@ def sync_portfolio(holdings: list[dict]) -> bool:
     try:
         from src.core.common import is_cash
 
-        with driver.session() as session:
+        with _common._session(driver) as session:
             session.run("MERGE (p:Portfolio {name: 'default'})")
 
             current_symbols = []
@@ -155,13 +154,16 @@ def sync_portfolio(holdings: list[dict]) -> bool:
         return False
 
 
-def is_held(symbol: str) -> bool:
-    """Check if a symbol is currently held in the portfolio."""
-    driver = _common._get_driver()
-    if driver is None:
+def is_held(symbol: str, session=None) -> bool:
+    """Check if a symbol is currently held in the portfolio.
+
+    Pass *session* to run on a session the caller already holds.
+    """
+    driver = _common._get_driver() if session is None else None
+    if driver is None and session is None:
         return False
     try:
-        with driver.session() as session:
+        with _common._read_session(driver, session) as session:
             result = session.run(
                 "MATCH (p:Portfolio {name: 'default'})-[:HOLDS]->(s:Stock {symbol: $symbol}) "
                 "RETURN count(*) AS cnt",
@@ -206,7 +208,7 @@ def merge_stress_test(
         return False
     test_id = f"stress_test_{test_date}_{_common._safe_id(scenario)}"
     try:
-        with driver.session() as session:
+        with _common._session(driver) as session:
             session.run(
                 "MERGE (st:StressTest {id: $id}) "
                 "SET st.date = $date, st.scenario = $scenario, "
@@ -248,7 +250,7 @@ def merge_forecast(
         return False
     forecast_id = f"forecast_{forecast_date}"
     try:
-        with driver.session() as session:
+        with _common._session(driver) as session:
             session.run(
                 "MERGE (f:Forecast {id: $id}) "
                 "SET f.date = $date, f.optimistic = $opt, "
@@ -29,7 +29,7 @@ def merge_research(
         return False
     research_id = f"research_{research_date}_{research_type}_{_common._safe_id(target)}"
     try:
-        with driver.session() as session:
+        with _common._session(driver) as session:
             session.run(
                 "MERGE (r:Research {id: $id}) "
                 "SET r.date = $date, r.research_type = $rtype, "
@@ -79,16 +79,16 @@ def link_research_supersedes(research_type: str, target: str) -> bool:
     if driver is None:
         return False
     try:
-        with driver.session() as session:
-            session.run(
-                "MATCH (r:Research {research_type: $rtype, target: $target}) "
-                "WITH r ORDER BY r.date ASC "
-                "WITH collect(r) AS nodes "
-                "UNWIND range(0, size(nodes)-2) AS i "
-                "WITH nodes[i] AS a, nodes[i+1] AS b "
-                "MERGE (a)-[:SUPERSEDES]->(b)",
-                rtype=research_type, target=target,
-            )
+        _common._execute_write(
+            driver,
+            "MATCH (r:Research {research_type: $rtype, target: $target}) "
+            "WITH r ORDER BY r.date ASC "
+            "WITH collect(r) AS nodes "
+            "UNWIND range(0, size(nodes)-2) AS i "
+            "WITH nodes[i] AS a, nodes[i+1] AS b "
+            "MERGE (a)-[:SUPERSEDES]->(b)",
+            rtype=research_type, target=target,
+        )
         return True
     except Exception:
         return False
@@ -123,7 +123,7 @@ def merge_research_full(
         return False
     research_id = f"research_{research_date}_{research_type}_{_common._safe_id(target)}"
     try:
-        with driver.session() as session:
+        with _common._session(driver) as session:
             # --- News nodes (from grok recent_news + yahoo news) ---
             news_items: list[dict | str] = []
             if grok_research and isinstance(grok_research.get("recent_news"), list):
@@ -1,9 +1,11 @@
 """Stock, Screen, Report node operations (KIK-507).
 
-Handles merge_stock, merge_screen, merge_report, merge_report_full,
-tag_theme, merge_watchlist, and get_stock_history.
+Handles merge_stock, bulk_merge_stocks, merge_screen, merge_report,
+merge_report_full, tag_theme, merge_watchlist, and get_stock_history.
 """
 
+import functools
+
 from src.data.graph_store import _common
 
 
@@ -19,25 +21,72 @@ def merge_stock(symbol: str, name: str = "", sector: str = "", country: str = ""
     if driver is None:
         return False
     try:
-        with driver.session() as session:
-            session.run(
-                "MERGE (s:Stock {symbol: $symbol}) "
-                "SET s.name = $name, s.sector = $sector, s.country = $country",
-                symbol=symbol, name=name, sector=sector, country=country,
-            )
-            if sector:
-                session.run(
-                    "MERGE (sec:Sector {name: $sector}) "
-                    "WITH sec "
-                    "MATCH (s:Stock {symbol: $symbol}) "
-                    "MERGE (s)-[:IN_SECTOR]->(sec)",
-                    sector=sector, symbol=symbol,
-                )
+        # Node and sector link in one statement (one Bolt round-trip)
+        _common._execute_write(
+            driver,
+            "MERGE (s:Stock {symbol: $symbol}) "
+            "SET s.name = $name, s.sector = $sector, s.country = $country"
+            + (" WITH s "
+               "MERGE (sec:Sector {name: $sector}) "
+               "MERGE (s)-[:IN_SECTOR]->(sec)" if sector else ""),
+            symbol=symbol, name=name, sector=sector, country=country,
+        )
         return True
     except Exception:
         return False
 
 
+_BULK_BATCH_SIZE = 1000
+
+_BULK_MERGE_STOCKS_CYPHER = (
+    "UNWIND $rows AS r "
+    "MERGE (s:Stock {symbol: r.symbol}) "
+    "SET s.name = r.name, s.sector = r.sector, s.country = r.country "
+    "WITH s, r WHERE r.sector <> '' "
+    "MERGE (sec:Sector {name: r.sector}) "
+    "MERGE (s)-[:IN_SECTOR]->(sec)"
+)
+
+
+def _write_stock_batch(tx, rows: list[dict]) -> None:
+    tx.run(_BULK_MERGE_STOCKS_CYPHER, rows=rows)
+
+
+def bulk_merge_stocks(rows: list[dict], batch_size: int = _BULK_BATCH_SIZE) -> int:
+    """Create or update many Stock nodes with UNWIND batches.
+
+    Bulk equivalent of merge_stock() for imports: each row is a dict with
+    ``symbol`` and optional ``name``/``sector``/``country``. Each batch is
+    written in a single transaction. Returns the number of rows written.
+    """
+    if _common._get_mode() == "off":
+        return 0
+    driver = _common._get_driver()
+    if driver is None:
+        return 0
+    params = [
+        {
+            "symbol": r["symbol"],
+            "name": r.get("name") or "",
+            "sector": r.get("sector") or "",
+            "country": r.get("country") or "",
+        }
+        for r in rows if r.get("symbol")
+    ]
+    if not params:
+        return 0
+    written = 0
+    try:
+        with driver.session() as session:
+            for i in range(0, len(params), batch_size):
+                batch = params[i:i + batch_size]
+                session.execute_write(_write_stock_batch, batch)
+                written += len(batch)
+    except Exception:
+        pass
+    return written
+
+
 # ---------------------------------------------------------------------------
 # Screen node
 # ---------------------------------------------------------------------------
@@ -57,7 +106,7 @@ def merge_screen(
         return False
     screen_id = f"screen_{screen_date}_{region}_{preset}"
     try:
-        with driver.session() as session:
+        with _common._session(driver) as session:
             session.run(
                 "MERGE (sc:Screen {id: $id}) "
                 "SET sc.date = $date, sc.preset = $preset, "
@@ -66,13 +115,14 @@ def merge_screen(
                 region=region, count=count,
             )
             _common._set_embedding(session, "Screen", screen_id, semantic_summary, embedding)
-            for sym in symbols:
-                session.run(
-                    "MATCH (sc:Screen {id: $screen_id}) "
-                    "MERGE (s:Stock {symbol: $symbol}) "
-                    "MERGE (sc)-[:SURFACED]->(s)",
-                    screen_id=screen_id, symbol=sym,
-                )
+            # One UNWIND statement for all SURFACED relationships
+            session.run(
+                "MATCH (sc:Screen {id: $screen_id}) "
+                "UNWIND $symbols AS symbol "
+                "MERGE (s:Stock {symbol: symbol}) "
+                "MERGE (sc)-[:SURFACED]->(s)",
+                screen_id=screen_id, symbols=list(symbols),
+            )
         return True
     except Exception:
         return False
@@ -94,19 +144,16 @@ def merge_report(
         return False
     report_id = f"report_{report_date}_{symbol}"
     try:
-        with driver.session() as session:
+        with _common._session(driver) as session:
             session.run(
                 "MERGE (r:Report {id: $id}) "
                 "SET r.date = $date, r.symbol = $symbol, "
-                "r.score = $score, r.verdict = $verdict",
-                id=report_id, date=report_date, symbol=symbol,
-                score=score, verdict=verdict,
-            )
-            session.run(
-                "MATCH (r:Report {id: $report_id}) "
+                "r.score = $score, r.verdict = $verdict "
+                "WITH r "
                 "MERGE (s:Stock {symbol: $symbol}) "
                 "MERGE (r)-[:ANALYZED]->(s)",
-                report_id=report_id, symbol=symbol,
+                id=report_id, date=report_date, symbol=symbol,
+                score=score, verdict=verdict,
             )
             _common._set_embedding(session, "Report", report_id, semantic_summary, embedding)
         return True
@@ -136,16 +183,16 @@ def merge_report_full(
         return False
     report_id = f"report_{report_date}_{symbol}"
     try:
-        with driver.session() as session:
-            session.run(
-                "MATCH (r:Report {id: $id}) "
-                "SET r.price = $price, r.per = $per, r.pbr = $pbr, "
-                "r.dividend_yield = $div, r.roe = $roe, r.market_cap = $mcap",
-                id=report_id, price=float(price or 0),
-                per=float(per or 0), pbr=float(pbr or 0),
-                div=float(dividend_yield or 0), roe=float(roe or 0),
-                mcap=float(market_cap or 0),
-            )
+        _common._execute_write(
+            driver,
+            "MATCH (r:Report {id: $id}) "
+            "SET r.price = $price, r.per = $per, r.pbr = $pbr, "
+            "r.dividend_yield = $div, r.roe = $roe, r.market_cap = $mcap",
+            id=report_id, price=float(price or 0),
+            per=float(per or 0), pbr=float(pbr or 0),
+            div=float(dividend_yield or 0), roe=float(roe or 0),
+            mcap=float(market_cap or 0),
+        )
         return True
     except Exception:
         return False
@@ -163,14 +210,14 @@ def tag_theme(symbol: str, theme: str) -> bool:
     if driver is None:
         return False
     try:
-        with driver.session() as session:
-            session.run(
-                "MERGE (t:Theme {name: $theme}) "
-                "WITH t "
-                "MERGE (s:Stock {symbol: $symbol}) "
-                "MERGE (s)-[:HAS_THEME]->(t)",
-                theme=theme, symbol=symbol,
-            )
+        _common._execute_write(
+            driver,
+            "MERGE (t:Theme {name: $theme}) "
+            "WITH t "
+            "MERGE (s:Stock {symbol: $symbol}) "
+            "MERGE (s)-[:HAS_THEME]->(t)",
+            theme=theme, symbol=symbol,
+        )
         return True
     except Exception:
         return False
@@ -190,7 +237,7 @@ def merge_watchlist(name: str, symbols: list[str],
     if driver is None:
         return False
     try:
-        with driver.session() as session:
+        with _common._session(driver) as session:
             session.run(
                 "MERGE (w:Watchlist {name: $name})",
                 name=name,
@@ -226,48 +273,91 @@ def merge_watchlist(name: str, symbols: list[str],
 # Query helpers
 # ---------------------------------------------------------------------------
 
-def get_stock_history(symbol: str) -> dict:
+# (OPTIONAL MATCH, collected value, alias) per get_stock_history section
+_HISTORY_SECTIONS = (
+    ("(sc:Screen)-[:SURFACED]->(s)",
+     "{date: sc.date, preset: sc.preset, region: sc.region}", "screens"),
+    ("(rp:Report)-[:ANALYZED]->(s)",
+     "{date: rp.date, score: rp.score, verdict: rp.verdict}", "reports"),
+    ("(t:Trade)-[:BOUGHT|SOLD]->(s)",
+     "{date: t.date, type: t.type, shares: t.shares, price: t.price}", "trades"),
+    ("(h:HealthCheck)-[:CHECKED]->(s)", "{date: h.date}", "health_checks"),
+    ("(n:Note)-[:ABOUT]->(s)",
+     "{id: n.id, date: n.date, type: n.type, content: n.content}", "notes"),
+    ("(s)-[:HAS_THEME]->(th:Theme)", "th.name", "themes"),
+    ("(rs:Research)-[:RESEARCHED]->(s)",
+     "{date: rs.date, research_type: rs.research_type, summary: rs.summary}",
+     "researches"),
+)
+
+
+@functools.lru_cache(maxsize=2)
+def _history_query(include_flags: bool) -> str:
+    """Build the get_stock_history Cypher (built once per flag setting).
+
+    Each section is collected back to a single row before the next
+    OPTIONAL MATCH, so the work is the sum of the section sizes rather
+    than the cross product of all of them.
+    """
+    parts = ["MATCH (s:Stock {symbol: $symbol}) "]
+    carried = ["s"]
+    if include_flags:
+        parts.append(
+            "OPTIONAL MATCH (w:Watchlist)-[:BOOKMARKED]->(s) "
+            "WITH s, count(w) > 0 AS bookmarked "
+            "OPTIONAL MATCH (:Portfolio {name: 'default'})-[hd:HOLDS]->(s) "
+            "WITH s, bookmarked, count(hd) > 0 AS held "
+        )
+        carried += ["bookmarked", "held"]
+    for pattern, value, alias in _HISTORY_SECTIONS:
+        parts.append(
+            f"OPTIONAL MATCH {pattern} "
+            f"WITH {', '.join(carried)}, collect(DISTINCT {value}) AS {alias} "
+        )
+        carried.append(alias)
+    parts.append("RETURN " + ", ".join(carried[1:]))
+    return "".join(parts)
+
+
+def get_stock_history(
+    symbol: str, include_flags: bool = False, session=None,
+) -> dict:
     """Get all graph relationships for a stock (KIK-573: single query).
 
     Returns dict with keys: screens, reports, trades, health_checks,
     notes, themes, researches.
+
+    When *include_flags* is True the same query also resolves watchlist
+    membership and the HOLDS relationship, adding ``bookmarked`` and
+    ``held`` booleans. The flags are omitted when the query fails, so
+    callers can fall back to separate lookups.
+
+    Pass *session* to run on a session the caller already holds.
     """
     _empty = {"screens": [], "reports": [], "trades": [],
               "health_checks": [], "notes": [], "themes": [],
               "researches": []}
-    driver = _common._get_driver()
-    if driver is None:
+    driver = _common._get_driver() if session is None else None
+    if driver is None and session is None:
         return dict(_empty)
     try:
-        with driver.session() as session:
+        with _common._read_session(driver, session) as session:
             record = session.run(
-                "MATCH (s:Stock {symbol: $symbol}) "
-                "OPTIONAL MATCH (sc:Screen)-[:SURFACED]->(s) "
-                "OPTIONAL MATCH (rp:Report)-[:ANALYZED]->(s) "
-                "OPTIONAL MATCH (t:Trade)-[:BOUGHT|SOLD]->(s) "
-                "OPTIONAL MATCH (h:HealthCheck)-[:CHECKED]->(s) "
-                "OPTIONAL MATCH (n:Note)-[:ABOUT]->(s) "
-                "OPTIONAL MATCH (s)-[:HAS_THEME]->(th:Theme) "
-                "OPTIONAL MATCH (rs:Research)-[:RESEARCHED]->(s) "
-                "RETURN "
-                "collect(DISTINCT {date: sc.date, preset: sc.preset, region: sc.region}) AS screens, "
-                "collect(DISTINCT {date: rp.date, score: rp.score, verdict: rp.verdict}) AS reports, "
-                "collect(DISTINCT {date: t.date, type: t.type, shares: t.shares, price: t.price}) AS trades, "
-                "collect(DISTINCT {date: h.date}) AS health_checks, "
-                "collect(DISTINCT {id: n.id, date: n.date, type: n.type, content: n.content}) AS notes, "
-                "collect(DISTINCT th.name) AS themes, "
-                "collect(DISTINCT {date: rs.date, research_type: rs.research_type, summary: rs.summary}) AS researches",
+                _history_query(include_flags),
                 symbol=symbol,
             ).single()
 
             if record is None:
+                # No Stock node: it cannot be bookmarked or held either
+                if include_flags:
+                    return {**_empty, "bookmarked": False, "held": False}
                 return dict(_empty)
 
             # Filter out null entries from OPTIONAL MATCH
             def _clean(items):
                 return [d for d in items if d and any(v is not None for v in d.values())]
 
-            return {
+            history = {
                 "screens": sorted(_clean(record["screens"]), key=lambda x: x.get("date", ""), reverse=True),
                 "reports": sorted(_clean(record["reports"]), key=lambda x: x.get("date", ""), reverse=True),
                 "trades": sorted(_clean(record["trades"]), key=lambda x: x.get("date", ""), reverse=True),
@@ -276,5 +366,9 @@ def get_stock_history(symbol: str) -> dict:
                 "themes": [t for t in record["themes"] if t is not None],
                 "researches": sorted(_clean(record["researches"]), key=lambda x: x.get("date", ""), reverse=True),
             }
+            if include_flags:
+                history["bookmarked"] = bool(record["bookmarked"])
+                history["held"] = bool(record["held"])
+            return history
     except Exception:
         return dict(_empty)
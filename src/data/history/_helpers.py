@@ -144,9 +144,16 @@ def _dual_write_graph(graph_callable, embed_category: str, embed_kwargs: dict):
                        Called with (sem_summary, embedding) as arguments.
         embed_category: Category for _build_embedding()
         embed_kwargs: Keyword args for _build_embedding()
+
+    The callable's merge_* writes are grouped by write_batch() into one
+    transaction, so a screen with N stocks commits in one round-trip.  A
+    statement the server rejects is replayed on its own by write_batch, so
+    the other writes still land; the lost ones surface here as an exception.
     """
     try:
+        from src.data.graph_store import write_batch
         sem_summary, emb = _build_embedding(embed_category, **embed_kwargs)
-        graph_callable(sem_summary, emb)
+        with write_batch():
+            graph_callable(sem_summary, emb)
     except Exception:
         pass
@@ -3,13 +3,25 @@
 Notes are investment memos (thesis, observation, concern, review, target)
 attached to specific stocks or to categories (portfolio, market, general).
 The JSON file is the master; Neo4j is a view.
+
+New notes are appended as one JSON line to ``{date}.jsonl``; files in the
+older ``{date}_{symbol-or-category}_{type}.json`` layout are still read.
 """
 
+import heapq
 import json
 import uuid
 from datetime import date, datetime
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
 
 
 _NOTES_DIR = "data/notes"
@@ -17,12 +29,32 @@ _VALID_TYPES = {"thesis", "observation", "concern", "review", "target", "lesson"
 _VALID_CATEGORIES = {"stock", "portfolio", "market", "general"}
 
 
+# base_dir values already created by this process (mkdir once, not per save)
+_created_dirs: set[str] = set()
+
+
 def _notes_dir(base_dir: str = _NOTES_DIR) -> Path:
     d = Path(base_dir)
-    d.mkdir(parents=True, exist_ok=True)
+    if base_dir not in _created_dirs:
+        d.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(base_dir)
     return d
 
 
+def _loads(raw: bytes):
+    """Parse UTF-8 JSON bytes, using orjson when installed."""
+    if _HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dump_line(note: dict) -> bytes:
+    """Serialize one note as a UTF-8 JSONL line (non-ASCII kept as-is)."""
+    if _HAS_ORJSON:
+        return orjson.dumps(note) + b"\n"
+    return json.dumps(note, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
 def save_note(
     symbol: Optional[str] = None,
     note_type: str = "observation",
@@ -82,14 +114,11 @@ def save_note(
     today = date.today().isoformat()
     now = datetime.now().isoformat(timespec="seconds")
 
-    # Build ID and filename based on symbol or category
+    # Build ID based on symbol or category
     if symbol:
         note_id = f"note_{today}_{symbol}_{uuid.uuid4().hex[:8]}"
-        safe_symbol = symbol.replace(".", "_").replace("/", "_")
-        filename = f"{today}_{safe_symbol}_{note_type}.json"
     else:
         note_id = f"note_{today}_{resolved_category}_{uuid.uuid4().hex[:8]}"
-        filename = f"{today}_{resolved_category}_{note_type}.json"
 
     note = {
         "id": note_id,
@@ -135,41 +164,70 @@ def save_note(
         if detected_symbols:
             note["detected_symbols"] = detected_symbols
 
-    # 1. Write to JSON file (master)
-    d = _notes_dir(base_dir)
-    path = d / filename
-
-    # Append to existing file if same date/symbol-or-category/type, else create new
-    existing = []
-    if path.exists():
+    # 1. Append to the day's JSONL file (master) -- no read-modify-write
+    path = _notes_dir(base_dir) / f"{today}.jsonl"
+    try:
+        f = open(path, "ab")
+    except FileNotFoundError:
+        # Directory removed since it was first created; recreate it
+        _created_dirs.discard(base_dir)
+        f = open(_notes_dir(base_dir) / path.name, "ab")
+    with f:
+        f.write(_dump_line(note))
+
+    # KIK-571: Lesson community classification (keyword rules, no I/O)
+    community = None
+    if note_type == "lesson":
         try:
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
-            existing = data if isinstance(data, list) else [data]
-        except (json.JSONDecodeError, OSError):
-            existing = []
+            from src.data.lesson_community import classify_lesson
+            community = classify_lesson(content, trigger or "")
+            note["_lesson_community"] = community
+        except Exception:
+            pass  # graceful degradation
+
+    # 2. Write to Neo4j (view) on the graph writer thread -- JSON is the master
+    try:
+        from src.data.graph_store import submit_background
+        submit_background(_sync_note_to_graph, dict(note), detected_symbols, community)
+    except Exception:
+        pass
 
-    existing.append(note)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(existing, f, ensure_ascii=False, indent=2)
+    # KIK-564: Attach conflicts to return value
+    if lesson_conflicts:
+        note["_conflicts"] = lesson_conflicts
+
+    return note
 
-    # 2. Write to Neo4j (view) -- graceful degradation
+
+def _sync_note_to_graph(
+    note: dict,
+    detected_symbols: list[str],
+    community: Optional[str],
+) -> None:
+    """Mirror a saved note into Neo4j: node, ABOUT links, AI links, community.
+
+    Runs on the graph_store background writer; each step degrades gracefully.
+    """
+    note_id = note["id"]
+    symbol = note["symbol"]
+    note_type = note["type"]
+    content = note["content"]
     try:
         from src.data.graph_store import merge_note
         from src.data.history import _build_embedding
         sem_summary, emb = _build_embedding(
-            "note", symbol=symbol or "", note_type=note_type, content=content,
+            "note", symbol=symbol, note_type=note_type, content=content,
             trigger=note.get("trigger", ""),
             expected_action=note.get("expected_action", ""),
         )
         merge_note(
             note_id=note_id,
-            note_date=today,
+            note_date=note["date"],
             note_type=note_type,
             content=content,
             symbol=symbol or None,
-            source=source,
-            category=resolved_category,
+            source=note["source"],
+            category=note["category"],
             semantic_summary=sem_summary,
             embedding=emb,
         )
@@ -197,32 +255,25 @@ def save_note(
             for ds in detected_symbols:
                 link_note(note_id, ds, note_type, content)
         else:
-            link_note(note_id, symbol, note_type, content)
+            link_note(note_id, symbol or None, note_type, content)
     except Exception:
         pass
 
-    # KIK-571: Lesson community classification
-    if note_type == "lesson":
+    # KIK-571: Lesson community node
+    if community:
         try:
-            from src.data.lesson_community import classify_lesson, merge_lesson_community
-            community = classify_lesson(content, trigger or "")
+            from src.data.lesson_community import merge_lesson_community
             merge_lesson_community(note_id, community)
-            note["_lesson_community"] = community
         except Exception:
             pass  # graceful degradation
 
-    # KIK-564: Attach conflicts to return value
-    if lesson_conflicts:
-        note["_conflicts"] = lesson_conflicts
-
-    return note
-
 
 def load_notes(
     symbol: Optional[str] = None,
     note_type: Optional[str] = None,
     category: Optional[str] = None,
     base_dir: str = _NOTES_DIR,
+    limit: Optional[int] = None,
 ) -> list[dict]:
     """Load notes from JSON files.
 
@@ -236,37 +287,131 @@ def load_notes(
         Filter by category ("stock", "portfolio", "market", "general").
     base_dir : str
         Notes directory.
+    limit : int, optional
+        Return at most this many (newest) notes; stops merging early.
 
     Returns
     -------
     list[dict]
         Notes sorted by date descending.
     """
+    return list(islice(iter_notes(symbol, note_type, category, base_dir), limit))
+
+
+def iter_notes(
+    symbol: Optional[str] = None,
+    note_type: Optional[str] = None,
+    category: Optional[str] = None,
+    base_dir: str = _NOTES_DIR,
+) -> Iterator[dict]:
+    """Yield notes newest-first by k-way merging the per-file streams.
+
+    Each file is sorted on its own (usually a single date), then the files
+    are merged with heapq.merge, so stopping after K notes costs
+    O(K log files) instead of a full sort.  Filters match load_notes().
+    """
     d = Path(base_dir)
     if not d.exists():
+        return
+
+    # Newest filename first, so equal dates keep the same tie order as before
+    streams = [
+        _iter_note_file(fp, symbol, note_type, category)
+        for fp in sorted(_note_files(d), reverse=True)
+    ]
+    yield from heapq.merge(*streams, key=_note_date, reverse=True)
+
+
+def _note_date(note: dict) -> str:
+    return note.get("date", "")
+
+
+def _iter_note_file(
+    fp: Path,
+    symbol: Optional[str],
+    note_type: Optional[str],
+    category: Optional[str],
+) -> Iterator[dict]:
+    """Yield matching notes of one file, date descending.
+
+    Notes are copied as they are yielded so callers never mutate the
+    parsed-file cache.
+    """
+    notes = [n for n in _read_note_file(fp) if _note_matches(n, symbol, note_type, category)]
+    notes.sort(key=_note_date, reverse=True)
+    for n in notes:
+        yield dict(n)
+
+
+def _note_files(d: Path) -> list[Path]:
+    """Per-day ``*.jsonl`` files plus legacy per-note ``*.json`` files in *d*."""
+    return [*d.glob("*.jsonl"), *d.glob("*.json")]
+
+
+# Parsed note files keyed by path, reused while (mtime_ns, size) is unchanged
+_file_cache: dict[str, tuple[tuple[int, int], list[dict]]] = {}
+
+
+def _read_note_file(fp: Path) -> list[dict]:
+    """Read one note file; returns [] when unreadable.
+
+    Parsed files are cached by path and re-read only when their mtime or
+    size changes.  The returned list is the cached one: copy notes before
+    handing them out of this module.
+    """
+    try:
+        st = fp.stat()
+    except OSError:
         return []
+    key = str(fp)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _file_cache.get(key)
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, _parse_note_file(fp))
+        _file_cache[key] = cached
+    return cached[1]
 
-    all_notes = []
-    for fp in d.glob("*.json"):
-        try:
-            with open(fp, encoding="utf-8") as f:
-                data = json.load(f)
-            notes = data if isinstance(data, list) else [data]
-            all_notes.extend(notes)
-        except (json.JSONDecodeError, OSError):
-            continue
 
-    # Filter
-    if symbol:
-        all_notes = [n for n in all_notes if n.get("symbol") == symbol]
-    if note_type:
-        all_notes = [n for n in all_notes if n.get("type") == note_type]
-    if category:
-        all_notes = [n for n in all_notes if n.get("category") == category]
+def _parse_note_file(fp: Path) -> list[dict]:
+    """Parse one note file; JSONL lines that fail to parse are skipped.
 
-    # Sort by date descending
-    all_notes.sort(key=lambda n: n.get("date", ""), reverse=True)
-    return all_notes
+    Files are read as bytes so orjson can decode UTF-8 in C; both orjson and
+    stdlib decode errors (including bad UTF-8) are ValueErrors.
+    """
+    try:
+        raw = fp.read_bytes()
+    except OSError:
+        return []
+    if fp.suffix == ".jsonl":
+        notes = []
+        for line in raw.splitlines():
+            if not line.strip():
+                continue
+            try:
+                notes.append(_loads(line))
+            except ValueError:
+                continue
+        return notes
+    try:
+        data = _loads(raw)
+    except ValueError:
+        return []
+    return data if isinstance(data, list) else [data]
+
+
+def _note_matches(
+    note: dict,
+    symbol: Optional[str],
+    note_type: Optional[str],
+    category: Optional[str],
+) -> bool:
+    if symbol and note.get("symbol") != symbol:
+        return False
+    if note_type and note.get("type") != note_type:
+        return False
+    if category and note.get("category") != category:
+        return False
+    return True
 
 
 # ---------------------------------------------------------------------------
@@ -397,34 +542,42 @@ def delete_note(
         return False
 
     found = False
-    for fp in d.glob("*.json"):
+    for fp in _note_files(d):
+        notes = _read_note_file(fp)
+        filtered = [n for n in notes if n.get("id") != note_id]
+        if len(filtered) == len(notes):
+            continue
         try:
-            with open(fp, encoding="utf-8") as f:
-                data = json.load(f)
-            notes = data if isinstance(data, list) else [data]
-            filtered = [n for n in notes if n.get("id") != note_id]
-            if len(filtered) < len(notes):
-                if filtered:
-                    with open(fp, "w", encoding="utf-8") as f:
-                        json.dump(filtered, f, ensure_ascii=False, indent=2)
-                else:
-                    fp.unlink()
-                found = True
-                break
-        except (json.JSONDecodeError, OSError):
+            if not filtered:
+                fp.unlink()
+            elif fp.suffix == ".jsonl":
+                fp.write_bytes(b"".join(_dump_line(n) for n in filtered))
+            else:
+                with open(fp, "w", encoding="utf-8") as f:
+                    json.dump(filtered, f, ensure_ascii=False, indent=2)
+        except OSError:
             continue
+        found = True
+        break
 
-    # Delete from Neo4j (view) -- graceful degradation
+    # Delete from Neo4j (view) -- queued behind any pending save_note write
+    # for the same note, so the delete cannot be overtaken by a late MERGE.
     try:
-        from src.data.graph_store import _get_mode, _get_driver
-        if _get_mode() != "off":
-            driver = _get_driver()
-            if driver is not None:
-                driver.execute_query(
-                    "MATCH (n:Note {id: $nid}) DETACH DELETE n",
-                    nid=note_id, database_="neo4j",
-                )
+        from src.data.graph_store import submit_background
+        submit_background(_delete_note_from_graph, note_id)
     except Exception:
         pass
 
     return found
+
+
+def _delete_note_from_graph(note_id: str) -> None:
+    """Remove a note node and its relationships from Neo4j."""
+    from src.data.graph_store import _get_mode, _get_driver
+    if _get_mode() != "off":
+        driver = _get_driver()
+        if driver is not None:
+            driver.execute_query(
+                "MATCH (n:Note {id: $nid}) DETACH DELETE n",
+                nid=note_id,
+            )
@@ -23,6 +23,9 @@ from src.data.yahoo_client._cache import (  # noqa: F401
     _detail_cache_path,
     _read_detail_cache,
     _write_detail_cache,
+    _history_cache_path,
+    _read_history_cache,
+    _write_history_cache,
 )
 
 # -- Normalization utilities (internal, but imported by tests) --
@@ -5,6 +5,8 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Optional
 
+import pandas as pd
+
 
 CACHE_DIR = Path(__file__).resolve().parent.parent.parent.parent / "data" / "cache"
 CACHE_TTL_HOURS = 24
@@ -74,3 +76,39 @@ def _write_detail_cache(symbol: str, data: dict) -> None:
     path = _detail_cache_path(symbol)
     with open(path, "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+# ---------------------------------------------------------------------------
+# Price history cache helpers
+# ---------------------------------------------------------------------------
+
+def _history_cache_path(symbol: str, period: str) -> Path:
+    """Return the price-history cache file path for a symbol and period."""
+    safe_name = symbol.replace(".", "_").replace("/", "_")
+    return CACHE_DIR / f"{safe_name}_history_{period}.pkl"
+
+
+def _read_history_cache(symbol: str, period: str) -> Optional[pd.DataFrame]:
+    """Read cached price history if it exists and is still valid (24h TTL).
+
+    Stored as a pickle so the tz-aware index and float values round-trip
+    exactly; the file mtime is the cache timestamp.
+    """
+    path = _history_cache_path(symbol, period)
+    try:
+        age = datetime.now().timestamp() - path.stat().st_mtime
+    except OSError:
+        return None
+    if age > CACHE_TTL_HOURS * 3600:
+        return None
+    try:
+        data = pd.read_pickle(path)
+    except Exception:
+        return None
+    return data if isinstance(data, pd.DataFrame) else None
+
+
+def _write_history_cache(symbol: str, period: str, data: pd.DataFrame) -> None:
+    """Write price history to the cache."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    data.to_pickle(_history_cache_path(symbol, period))
@@ -8,6 +8,9 @@ within a single screening session.  Two module-level singletons are exposed:
 
 Environment variable ``MEMORY_CACHE_TTL`` (seconds) overrides the default TTL.
 Set it to ``0`` to disable in-memory caching entirely.
+``MEMORY_CACHE_MAXSIZE`` overrides the per-cache capacity (default 2048), which
+is sized so that back-to-back screeners over overlapping universes (e.g. alpha
+then growth/pullback, ~250 symbols each) reuse entries instead of evicting them.
 """
 
 import os
@@ -90,9 +93,10 @@ class MemoryCache:
 
 _env_ttl = os.environ.get("MEMORY_CACHE_TTL")
 _default_ttl = float(_env_ttl) if _env_ttl is not None else 300.0
+_default_maxsize = int(os.environ.get("MEMORY_CACHE_MAXSIZE", "2048"))
 
-price_history_cache = MemoryCache(maxsize=256, ttl_seconds=_default_ttl)
-stock_detail_cache = MemoryCache(maxsize=256, ttl_seconds=_default_ttl)
+price_history_cache = MemoryCache(maxsize=_default_maxsize, ttl_seconds=_default_ttl)
+stock_detail_cache = MemoryCache(maxsize=_default_maxsize, ttl_seconds=_default_ttl)
 
 
 def clear_memory_cache() -> None:
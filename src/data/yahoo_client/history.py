@@ -8,6 +8,7 @@ from typing import Optional
 import pandas as pd
 import yfinance as yf
 
+from src.data.yahoo_client._cache import _read_history_cache, _write_history_cache
 from src.data.yahoo_client._memory_cache import price_history_cache
 
 
@@ -18,13 +19,19 @@ def get_price_history(symbol: str, period: str = "1y") -> Optional[pd.DataFrame]
     Returns None on error.
 
     Uses in-memory cache (default 5 min TTL) to avoid redundant API calls
-    within a screening session (KIK-531).
+    within a screening session (KIK-531), backed by a 24h file cache so
+    re-runs (e.g. what-if simulations) skip the API as well.
     """
     cache_key = f"{symbol}:{period}"
     cached = price_history_cache.get(cache_key)
     if cached is not None:
         return cached.copy()
 
+    cached = _read_history_cache(symbol, period)
+    if cached is not None:
+        price_history_cache.set(cache_key, cached)
+        return cached.copy()
+
     try:
         time.sleep(1)  # rate-limit
         ticker = yf.Ticker(symbol)
@@ -40,6 +47,10 @@ def get_price_history(symbol: str, period: str = "1y") -> Optional[pd.DataFrame]
             return None
         result = hist[available_cols]
         price_history_cache.set(cache_key, result)
+        try:
+            _write_history_cache(symbol, period, result)
+        except OSError:
+            pass  # cache is best-effort
         return result
     except (TimeoutError, socket.timeout) as e:
         print(
@@ -0,0 +1,25 @@
+"""Market definitions for the legacy ValueScreener mode."""
+
+from .asean import ASEANMarket
+from .base import Market
+from .japan import JapanMarket
+from .us import USMarket
+
+MARKETS: dict[str, type[Market]] = {
+    "japan": JapanMarket,
+    "us": USMarket,
+    "asean": ASEANMarket,
+}
+
+# Shared instances; markets are stateless, so one per code is enough
+_instances: dict[str, Market] = {}
+
+
+def get_market(code: str) -> Market:
+    """Return the shared Market instance for *code* ('japan', 'us', 'asean')."""
+    market = _instances.get(code)
+    if market is None:
+        if code not in MARKETS:
+            raise ValueError(f"Unknown market: {code}")
+        market = _instances[code] = MARKETS[code]()
+    return market
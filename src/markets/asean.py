@@ -31,6 +31,64 @@ _EXCHANGE_CODE_MAP = {
 }
 
 
+# Major SGX-listed stocks
+_SGX_SYMBOLS = (
+    "D05.SI",   # DBS Group
+    "O39.SI",   # OCBC Bank
+    "U11.SI",   # United Overseas Bank
+    "Z74.SI",   # Singapore Telecommunications
+    "C6L.SI",   # Singapore Airlines
+    "A17U.SI",  # CapitaLand Ascendas REIT
+    "BN4.SI",   # Keppel Corporation
+)
+
+# Major SET-listed stocks
+_SET_SYMBOLS = (
+    "PTT.BK",    # PTT Public Company
+    "AOT.BK",    # Airports of Thailand
+    "SCC.BK",    # Siam Cement
+    "ADVANC.BK", # Advanced Info Service
+    "CPALL.BK",  # CP ALL
+    "KBANK.BK",  # Kasikornbank
+    "SCB.BK",    # SCB X
+)
+
+# Major KLSE-listed stocks
+_KLSE_SYMBOLS = (
+    "1155.KL",  # Malayan Banking (Maybank)
+    "1295.KL",  # Public Bank
+    "6888.KL",  # Axiata Group
+    "4707.KL",  # Nestle Malaysia
+    "5183.KL",  # Petronas Chemicals
+    "3182.KL",  # Genting
+)
+
+# Major IDX-listed stocks
+_IDX_SYMBOLS = (
+    "BBCA.JK",  # Bank Central Asia
+    "BBRI.JK",  # Bank Rakyat Indonesia
+    "TLKM.JK",  # Telkom Indonesia
+    "ASII.JK",  # Astra International
+    "UNVR.JK",  # Unilever Indonesia
+    "BMRI.JK",  # Bank Mandiri
+)
+
+# Major PSE-listed stocks
+_PSE_SYMBOLS = (
+    "SM.PS",    # SM Investments
+    "ALI.PS",   # Ayala Land
+    "BDO.PS",   # BDO Unibank
+    "TEL.PS",   # PLDT
+    "JFC.PS",   # Jollibee Foods
+    "AC.PS",    # Ayala Corporation
+)
+
+# All defaults, concatenated once at import
+_DEFAULT_SYMBOLS = (
+    _SGX_SYMBOLS + _SET_SYMBOLS + _KLSE_SYMBOLS + _IDX_SYMBOLS + _PSE_SYMBOLS
+)
+
+
 class ASEANMarket(Market):
     """ASEAN equities across multiple exchanges.
 
@@ -49,7 +107,7 @@ class ASEANMarket(Market):
         sg (Singapore), th (Thailand), my (Malaysia), id (Indonesia),
         ph (Philippines).
         """
-        return ["sg", "th", "my", "id", "ph"]
+        return list(_REGION_MAP.values())
 
     def get_exchanges(self) -> list[str]:
         """Return all ASEAN exchange codes for yfinance EquityQuery.
@@ -58,7 +116,7 @@ class ASEANMarket(Market):
         KLS = Bursa Malaysia, JKT = Indonesia Stock Exchange,
         PHP = Philippine Stock Exchange.
         """
-        return ["SES", "SET", "KLS", "JKT", "PHP"]
+        return list(_EXCHANGE_CODE_MAP.values())
 
     # ------------------------------------------------------------------
     # Default symbols per country (fallback)
@@ -67,74 +125,31 @@ class ASEANMarket(Market):
     @staticmethod
     def _singapore_symbols() -> list[str]:
         """Major SGX-listed stocks."""
-        return [
-            "D05.SI",   # DBS Group
-            "O39.SI",   # OCBC Bank
-            "U11.SI",   # United Overseas Bank
-            "Z74.SI",   # Singapore Telecommunications
-            "C6L.SI",   # Singapore Airlines
-            "A17U.SI",  # CapitaLand Ascendas REIT
-            "BN4.SI",   # Keppel Corporation
-        ]
+        return list(_SGX_SYMBOLS)
 
     @staticmethod
     def _thailand_symbols() -> list[str]:
         """Major SET-listed stocks."""
-        return [
-            "PTT.BK",    # PTT Public Company
-            "AOT.BK",    # Airports of Thailand
-            "SCC.BK",    # Siam Cement
-            "ADVANC.BK", # Advanced Info Service
-            "CPALL.BK",  # CP ALL
-            "KBANK.BK",  # Kasikornbank
-            "SCB.BK",    # SCB X
-        ]
+        return list(_SET_SYMBOLS)
 
     @staticmethod
     def _malaysia_symbols() -> list[str]:
         """Major KLSE-listed stocks."""
-        return [
-            "1155.KL",  # Malayan Banking (Maybank)
-            "1295.KL",  # Public Bank
-            "6888.KL",  # Axiata Group
-            "4707.KL",  # Nestle Malaysia
-            "5183.KL",  # Petronas Chemicals
-            "3182.KL",  # Genting
-        ]
+        return list(_KLSE_SYMBOLS)
 
     @staticmethod
     def _indonesia_symbols() -> list[str]:
         """Major IDX-listed stocks."""
-        return [
-            "BBCA.JK",  # Bank Central Asia
-            "BBRI.JK",  # Bank Rakyat Indonesia
-            "TLKM.JK",  # Telkom Indonesia
-            "ASII.JK",  # Astra International
-            "UNVR.JK",  # Unilever Indonesia
-            "BMRI.JK",  # Bank Mandiri
-        ]
+        return list(_IDX_SYMBOLS)
 
     @staticmethod
     def _philippines_symbols() -> list[str]:
         """Major PSE-listed stocks."""
-        return [
-            "SM.PS",    # SM Investments
-            "ALI.PS",   # Ayala Land
-            "BDO.PS",   # BDO Unibank
-            "TEL.PS",   # PLDT
-            "JFC.PS",   # Jollibee Foods
-            "AC.PS",    # Ayala Corporation
-        ]
+        return list(_PSE_SYMBOLS)
 
     def get_default_symbols(self) -> list[str]:
         """All default ASEAN symbols across the five exchanges."""
-        return (
-            self._singapore_symbols()
-            + self._thailand_symbols()
-            + self._malaysia_symbols()
-            + self._indonesia_symbols()
-            + self._philippines_symbols()
-        )
+        return list(_DEFAULT_SYMBOLS)
 
     # -- Thresholds --------------------------------------------------------
 
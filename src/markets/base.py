@@ -1,5 +1,6 @@
 """Base class for market definitions."""
 
+import copy
 from abc import ABC, abstractmethod
 from pathlib import Path
 
@@ -9,15 +10,22 @@ EXCHANGES_CONFIG_PATH = (
     Path(__file__).resolve().parent.parent.parent / "config" / "exchanges.yaml"
 )
 
+# Parsed ``regions`` mapping, loaded once per process
+_REGIONS: dict | None = None
+
 
 def load_exchanges_config() -> dict:
     """Load the exchanges.yaml configuration file.
 
     Returns the full ``regions`` dict keyed by region code (e.g. 'jp', 'us').
+    The YAML is parsed on first call; each call returns its own deep copy.
     """
-    with open(EXCHANGES_CONFIG_PATH, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
-    return config.get("regions", {})
+    global _REGIONS
+    if _REGIONS is None:
+        with open(EXCHANGES_CONFIG_PATH, "r", encoding="utf-8") as f:
+            config = yaml.safe_load(f)
+        _REGIONS = config.get("regions", {})
+    return copy.deepcopy(_REGIONS)
 
 
 class Market(ABC):
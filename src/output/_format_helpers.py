@@ -92,7 +92,7 @@ def hhi_bar(hhi: float, width: int = 10) -> str:
 # ---------------------------------------------------------------------------
 
 # Column type: (header_name, alignment, cell_fn)
-# cell_fn signature: (rank: int, row: dict) -> str
+# cell_fn signature: (rank: str, row: dict) -> str
 
 def render_screening_table(
     results: list[dict],
@@ -108,7 +108,8 @@ def render_screening_table(
         Screening result rows.
     columns : list[tuple]
         Each tuple: (header: str, align: str, cell_fn: callable)
-        cell_fn(rank, row) -> str
+        cell_fn(rank, row) -> str; rank is the 1-based position, already
+        converted to str
     empty_msg : str
         Message when results is empty.
     legends : list[str] | None
@@ -127,10 +128,14 @@ def render_screening_table(
     separator = "|" + "|".join(c[1] for c in columns) + "|"
     lines = [header, separator]
 
-    # Rows
-    for rank, row in enumerate(results, start=1):
-        cells = [c[2](rank, row) for c in columns]
-        lines.append("| " + " | ".join(cells) + " |")
+    # Rows: one join per row, with the cell functions bound once per table
+    # and rank labels stringified up front
+    cell_fns = [c[2] for c in columns]
+    ranks = map(str, range(1, len(results) + 1))
+    lines.extend([
+        "| " + " | ".join([fn(rank, row) for fn in cell_fns]) + " |"
+        for rank, row in zip(ranks, results)
+    ])
 
     # Legends
     if legends:
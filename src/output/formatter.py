@@ -1,8 +1,6 @@
 """Output formatters for screening results (KIK-575: unified renderer)."""
 
 from src.output._format_helpers import (
-    fmt_pct as _fmt_pct,
-    fmt_float as _fmt_float,
     fmt_currency_value as _fmt_currency_value,
     build_label as _build_label,
     render_screening_table,
@@ -14,8 +12,29 @@ from src.core.ticker_utils import lot_cost as _lot_cost, infer_currency as _infe
 # Common cell helpers
 # ---------------------------------------------------------------------------
 
-def _price_cell(rank, row):
-    return _fmt_float(row.get("price"), decimals=0) if row.get("price") is not None else "-"
+def _float_cell(key, decimals=2):
+    """Cell fn formatting ``row[key]`` like fmt_float, in a single call per row."""
+    def cell(rank, row):
+        v = row.get(key)
+        return "-" if v is None else f"{v:.{decimals}f}"
+    return cell
+
+
+def _pct_cell(key):
+    """Cell fn formatting ``row[key]`` like fmt_pct, in a single call per row."""
+    def cell(rank, row):
+        v = row.get(key)
+        return "-" if v is None else f"{v * 100:.2f}%"
+    return cell
+
+
+_price_cell = _float_cell("price", decimals=0)
+
+
+def _final_score_cell(rank, row):
+    """Format final_score, falling back to value_score."""
+    v = row.get("final_score") or row.get("value_score")
+    return "-" if v is None else f"{v:.2f}"
 
 
 def _lot_cost_cell(rank, row):
@@ -36,14 +55,14 @@ def _lot_cost_cell(rank, row):
 def format_markdown(results: list[dict]) -> str:
     """Format screening results as a Markdown table."""
     return render_screening_table(results, columns=[
-        ("順位", "---:", lambda r, row: str(r)),
+        ("順位", "---:", lambda r, row: r),
         ("銘柄", ":-----", lambda r, row: _build_label(row)),
         ("株価", "-----:", _price_cell),
-        ("PER", "----:", lambda r, row: _fmt_float(row.get("per"))),
-        ("PBR", "----:", lambda r, row: _fmt_float(row.get("pbr"))),
-        ("配当利回り", "---------:", lambda r, row: _fmt_pct(row.get("dividend_yield"))),
-        ("ROE", "----:", lambda r, row: _fmt_pct(row.get("roe"))),
-        ("スコア", "------:", lambda r, row: _fmt_float(row.get("value_score"))),
+        ("PER", "----:", _float_cell("per")),
+        ("PBR", "----:", _float_cell("pbr")),
+        ("配当利回り", "---------:", _pct_cell("dividend_yield")),
+        ("ROE", "----:", _pct_cell("roe")),
+        ("スコア", "------:", _float_cell("value_score")),
     ], empty_msg="該当する銘柄が見つかりませんでした。")
 
 
@@ -54,16 +73,16 @@ def format_markdown(results: list[dict]) -> str:
 def format_query_markdown(results: list[dict]) -> str:
     """Format EquityQuery screening results with sector column."""
     return render_screening_table(results, columns=[
-        ("順位", "---:", lambda r, row: str(r)),
+        ("順位", "---:", lambda r, row: r),
         ("銘柄", ":-----", lambda r, row: _build_label(row)),
         ("セクター", ":---------", lambda r, row: row.get("sector") or "-"),
         ("株価", "-----:", _price_cell),
         ("最低投資額", "---------:", _lot_cost_cell),
-        ("PER", "----:", lambda r, row: _fmt_float(row.get("per"))),
-        ("PBR", "----:", lambda r, row: _fmt_float(row.get("pbr"))),
-        ("配当利回り", "---------:", lambda r, row: _fmt_pct(row.get("dividend_yield"))),
-        ("ROE", "----:", lambda r, row: _fmt_pct(row.get("roe"))),
-        ("スコア", "------:", lambda r, row: _fmt_float(row.get("value_score"))),
+        ("PER", "----:", _float_cell("per")),
+        ("PBR", "----:", _float_cell("pbr")),
+        ("配当利回り", "---------:", _pct_cell("dividend_yield")),
+        ("ROE", "----:", _pct_cell("roe")),
+        ("スコア", "------:", _float_cell("value_score")),
     ], empty_msg="該当する銘柄が見つかりませんでした。")
 
 
@@ -81,18 +100,18 @@ def format_pullback_markdown(results: list[dict]) -> str:
         return "★完全一致" if row.get("match_type", "full") == "full" else "△部分一致"
 
     return render_screening_table(results, columns=[
-        ("順位", "---:", lambda r, row: str(r)),
+        ("順位", "---:", lambda r, row: r),
         ("銘柄", ":-----", lambda r, row: _build_label(row)),
         ("株価", "-----:", _price_cell),
-        ("PER", "----:", lambda r, row: _fmt_float(row.get("per"))),
-        ("押し目%", "------:", lambda r, row: _fmt_pct(row.get("pullback_pct"))),
-        ("RSI", "----:", lambda r, row: _fmt_float(row.get("rsi"), decimals=1)),
-        ("出来高比", "-------:", lambda r, row: _fmt_float(row.get("volume_ratio"))),
-        ("SMA50", "------:", lambda r, row: _fmt_float(row.get("sma50"), decimals=0) if row.get("sma50") is not None else "-"),
-        ("SMA200", "-------:", lambda r, row: _fmt_float(row.get("sma200"), decimals=0) if row.get("sma200") is not None else "-"),
+        ("PER", "----:", _float_cell("per")),
+        ("押し目%", "------:", _pct_cell("pullback_pct")),
+        ("RSI", "----:", _float_cell("rsi", decimals=1)),
+        ("出来高比", "-------:", _float_cell("volume_ratio")),
+        ("SMA50", "------:", _float_cell("sma50", decimals=0)),
+        ("SMA200", "-------:", _float_cell("sma200", decimals=0)),
         ("スコア", "------:", _bounce),
         ("一致度", ":------:", _match),
-        ("総合スコア", "------:", lambda r, row: _fmt_float(row.get("final_score") or row.get("value_score"))),
+        ("総合スコア", "------:", _final_score_cell),
     ], empty_msg="押し目条件に合致する銘柄が見つかりませんでした。（上昇トレンド中の押し目銘柄なし）")
 
 
@@ -103,15 +122,15 @@ def format_pullback_markdown(results: list[dict]) -> str:
 def format_growth_markdown(results: list[dict]) -> str:
     """Format growth screening results."""
     return render_screening_table(results, columns=[
-        ("順位", "---:", lambda r, row: str(r)),
+        ("順位", "---:", lambda r, row: r),
         ("銘柄", ":-----", lambda r, row: _build_label(row)),
         ("セクター", ":---------", lambda r, row: row.get("sector") or "-"),
         ("株価", "-----:", _price_cell),
-        ("PER", "----:", lambda r, row: _fmt_float(row.get("per"))),
-        ("PBR", "----:", lambda r, row: _fmt_float(row.get("pbr"))),
-        ("EPS成長", "-------:", lambda r, row: _fmt_pct(row.get("eps_growth"))),
-        ("売上成長", "--------:", lambda r, row: _fmt_pct(row.get("revenue_growth"))),
-        ("ROE", "----:", lambda r, row: _fmt_pct(row.get("roe"))),
+        ("PER", "----:", _float_cell("per")),
+        ("PBR", "----:", _float_cell("pbr")),
+        ("EPS成長", "-------:", _pct_cell("eps_growth")),
+        ("売上成長", "--------:", _pct_cell("revenue_growth")),
+        ("ROE", "----:", _pct_cell("roe")),
     ], empty_msg="成長条件に合致する銘柄が見つかりませんでした。")
 
 
@@ -139,14 +158,14 @@ def format_alpha_markdown(results: list[dict]) -> str:
         return "★" if pb == "full" else "△" if pb == "partial" else "-"
 
     return render_screening_table(results, columns=[
-        ("順位", "---:", lambda r, row: str(r)),
+        ("順位", "---:", lambda r, row: r),
         ("銘柄", ":-----", lambda r, row: _build_label(row)),
         ("株価", "-----:", _price_cell),
-        ("PER", "----:", lambda r, row: _fmt_float(row.get("per"))),
-        ("PBR", "----:", lambda r, row: _fmt_float(row.get("pbr"))),
-        ("割安", "----:", lambda r, row: _fmt_float(row.get("value_score"))),
-        ("変化", "----:", lambda r, row: _fmt_float(row.get("change_score"))),
-        ("総合", "----:", lambda r, row: _fmt_float(row.get("total_score"))),
+        ("PER", "----:", _float_cell("per")),
+        ("PBR", "----:", _float_cell("pbr")),
+        ("割安", "----:", _float_cell("value_score")),
+        ("変化", "----:", _float_cell("change_score")),
+        ("総合", "----:", _float_cell("total_score")),
         ("押し目", ":------:", _pullback),
         ("ア", ":--:", lambda r, row: _alpha_indicator(row.get("accruals_score"))),
         ("加速", ":---:", lambda r, row: _alpha_indicator(row.get("rev_accel_score"))),
@@ -175,20 +194,32 @@ def format_shareholder_return_markdown(results: list[dict]) -> str:
     def _pct_manual(val):
         return f"{val*100:.2f}%" if val else "-"
 
+    def _per(r, row):
+        per = row.get("per") or row.get("trailingPE")
+        return f"{per:.1f}" if per else "-"
+
+    def _roe(r, row):
+        roe = row.get("roe") or row.get("returnOnEquity")
+        return f"{roe*100:.1f}%" if roe else "-"
+
+    def _total_return(r, row):
+        tsr = row.get("total_shareholder_return")
+        return f"**{tsr*100:.2f}%**" if tsr else "-"
+
     def _stability(r, row):
         label = row.get("return_stability_label", "-")
         reason = row.get("return_stability_reason")
         return f"{label}（{reason}）" if reason else label
 
     return render_screening_table(results, columns=[
-        ("#", "--:", lambda r, row: str(r)),
+        ("#", "--:", lambda r, row: r),
         ("銘柄", ":-----", _sr_label),
         ("セクター", ":--------", lambda r, row: row.get("sector", "-")),
-        ("PER", "----:", lambda r, row: f"{(row.get('per') or row.get('trailingPE') or 0):.1f}" if (row.get('per') or row.get('trailingPE')) else "-"),
-        ("ROE", "----:", lambda r, row: f"{(row.get('roe') or row.get('returnOnEquity') or 0)*100:.1f}%" if (row.get('roe') or row.get('returnOnEquity')) else "-"),
+        ("PER", "----:", _per),
+        ("ROE", "----:", _roe),
         ("配当利回り", "----------:", lambda r, row: _pct_manual(row.get("dividend_yield_trailing") or row.get("dividend_yield"))),
         ("自社株買い", "---------:", lambda r, row: _pct_manual(row.get("buyback_yield"))),
-        ("総還元率", "--------:", lambda r, row: f"**{row.get('total_shareholder_return',0)*100:.2f}%**" if row.get("total_shareholder_return") else "-"),
+        ("総還元率", "--------:", _total_return),
         ("安定度", ":------", _stability),
     ], empty_msg="_該当銘柄なし_")
 
@@ -218,15 +249,15 @@ def format_trending_markdown(results: list[dict], market_context: str = "") -> s
         prefix = f"> **X市場センチメント**: {market_context}\n\n"
 
     table = render_screening_table(results, columns=[
-        ("順位", "---:", lambda r, row: str(r)),
+        ("順位", "---:", lambda r, row: r),
         ("銘柄", ":-----", lambda r, row: _build_label(row)),
         ("話題の理由", ":---------", _reason),
         ("株価", "-----:", _price_cell),
-        ("PER", "----:", lambda r, row: _fmt_float(row.get("per"))),
-        ("PBR", "----:", lambda r, row: _fmt_float(row.get("pbr"))),
-        ("配当利回り", "---------:", lambda r, row: _fmt_pct(row.get("dividend_yield"))),
-        ("ROE", "----:", lambda r, row: _fmt_pct(row.get("roe"))),
-        ("スコア", "------:", lambda r, row: _fmt_float(row.get("value_score"))),
+        ("PER", "----:", _float_cell("per")),
+        ("PBR", "----:", _float_cell("pbr")),
+        ("配当利回り", "---------:", _pct_cell("dividend_yield")),
+        ("ROE", "----:", _pct_cell("roe")),
+        ("スコア", "------:", _float_cell("value_score")),
         ("判定", ":----:", _cls),
     ], empty_msg="X上でトレンド中の銘柄が見つかりませんでした。", legends=[
         "**判定基準**: 🟢割安(スコア60+) / 🟡適正(スコア30-59) / 🔴割高(スコア30未満) / ⚪不足(データ取得失敗)",
@@ -249,17 +280,17 @@ def format_contrarian_markdown(results: list[dict]) -> str:
         return f"{_GRADE_ICON.get(g, '')}{g}"
 
     return render_screening_table(results, columns=[
-        ("順位", "---:", lambda r, row: str(r)),
+        ("順位", "---:", lambda r, row: r),
         ("銘柄", ":-----", lambda r, row: _build_label(row)),
         ("株価", "-----:", _price_cell),
-        ("PER", "----:", lambda r, row: _fmt_float(row.get("per"))),
-        ("PBR", "----:", lambda r, row: _fmt_float(row.get("pbr"))),
-        ("RSI", "----:", lambda r, row: _fmt_float(row.get("rsi"), decimals=1)),
-        ("SMA200乖離", "---------:", lambda r, row: _fmt_pct(row.get("sma200_deviation"))),
-        ("テク", "----:", lambda r, row: _fmt_float(row.get("tech_score"), decimals=0)),
-        ("バリュ", "-----:", lambda r, row: _fmt_float(row.get("val_score"), decimals=0)),
-        ("ファンダ", "------:", lambda r, row: _fmt_float(row.get("fund_score"), decimals=0)),
-        ("総合", "----:", lambda r, row: _fmt_float(row.get("contrarian_score"), decimals=0)),
+        ("PER", "----:", _float_cell("per")),
+        ("PBR", "----:", _float_cell("pbr")),
+        ("RSI", "----:", _float_cell("rsi", decimals=1)),
+        ("SMA200乖離", "---------:", _pct_cell("sma200_deviation")),
+        ("テク", "----:", _float_cell("tech_score", decimals=0)),
+        ("バリュ", "-----:", _float_cell("val_score", decimals=0)),
+        ("ファンダ", "------:", _float_cell("fund_score", decimals=0)),
+        ("総合", "----:", _float_cell("contrarian_score", decimals=0)),
         ("判定", ":----:", _grade),
     ], empty_msg="逆張り条件に合致する銘柄が見つかりませんでした。", legends=[
         "**凡例**: テク=テクニカル逆張り(40pt) / バリュ=バリュエーション逆張り(30pt) / ファンダ=ファンダ乖離(30pt)",
@@ -282,14 +313,14 @@ def format_momentum_markdown(results: list[dict]) -> str:
         return f"{_SURGE_ICONS.get(lv, '')}{_SURGE_LABELS.get(lv, '-')}"
 
     return render_screening_table(results, columns=[
-        ("順位", "---:", lambda r, row: str(r)),
+        ("順位", "---:", lambda r, row: r),
         ("銘柄", ":-----", lambda r, row: _build_label(row)),
         ("株価", "-----:", _price_cell),
-        ("50MA乖離", "-------:", lambda r, row: _fmt_pct(row.get("ma50_deviation"))),
-        ("出来高比", "-------:", lambda r, row: _fmt_float(row.get("volume_ratio"), decimals=2)),
-        ("RSI", "----:", lambda r, row: _fmt_float(row.get("rsi"), decimals=1)),
-        ("52w高値比", "--------:", lambda r, row: _fmt_pct(row.get("high_change_pct"))),
-        ("スコア", "------:", lambda r, row: _fmt_float(row.get("surge_score"), decimals=0)),
+        ("50MA乖離", "-------:", _pct_cell("ma50_deviation")),
+        ("出来高比", "-------:", _float_cell("volume_ratio", decimals=2)),
+        ("RSI", "----:", _float_cell("rsi", decimals=1)),
+        ("52w高値比", "--------:", _pct_cell("high_change_pct")),
+        ("スコア", "------:", _float_cell("surge_score", decimals=0)),
         ("レベル", ":------:", _level),
     ], empty_msg="モメンタム条件に合致する銘柄が見つかりませんでした。", legends=[
         "**レベル**: \U0001f7e2加速(+10~15%)=エントリー好機 / \U0001f7e1急騰(+15~30%)=勢い継続 / \U0001f534過熱(+30%超)=\u26a0\ufe0f利確注意",
@@ -128,3 +128,5 @@ def _block_external_io(request, monkeypatch):
     # In-memory cache: clear between tests to prevent cross-test leaks (KIK-531)
     from src.data.yahoo_client._memory_cache import clear_memory_cache
     clear_memory_cache()
+    from src.data.context.vector_search import clear_embedding_cache
+    clear_embedding_cache()
@@ -283,3 +283,36 @@ class TestAlphaScreenerScreen:
         screener.screen(region="us")
         # Verify screen_stocks was called (query was built)
         assert "query" in called_args
+
+    def test_skips_stocks_that_cannot_reach_top_n(self, monkeypatch):
+        """Low value_score stocks are never fetched once the top_n floor exceeds their bound."""
+        import src.core.screening.alpha_screener as mod
+
+        full_pass = {
+            "change_score": 100.0,
+            "accruals": {"score": 25.0, "raw": None},
+            "revenue_acceleration": {"score": 25.0, "raw": None},
+            "fcf_yield": {"score": 25.0, "raw": None},
+            "roe_trend": {"score": 25.0, "raw": None},
+            "passed_count": 4,
+            "quality_pass": True,
+        }
+        monkeypatch.setattr(mod, "compute_change_score", lambda detail: full_pass)
+
+        fetched: list[str] = []
+
+        def detail(symbol):
+            fetched.append(symbol)
+            return {}
+
+        # 30 weak quotes listed before the single strong one
+        quotes = [_make_quote(f"{1000 + i}.T", per=80, pbr=8.0, roe=0.01) for i in range(30)]
+        quotes[-1] = _make_quote("9999.T", per=5, pbr=0.3, roe=0.20)
+
+        screener = AlphaScreener(_MockYahooClient(
+            quotes=quotes, detail=detail, hist=_make_flat_hist(),
+        ))
+        results = screener.screen(region="jp", top_n=1)
+
+        assert [r["symbol"] for r in results] == ["9999.T"]
+        assert len(fetched) < len(quotes)
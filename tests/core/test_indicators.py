@@ -128,6 +128,17 @@ class TestCalculateValueScore:
         score = calculate_value_score(stock_info_data)
         assert score > 0, "Toyota fixture data should yield positive score"
 
+    def test_repeated_inputs_hit_memo(self):
+        """Identical fundamentals are scored once; thresholds are part of the key."""
+        from src.core.screening.indicators import _value_score_from_inputs
+
+        _value_score_from_inputs.cache_clear()
+        stock = {"per": 11.0, "pbr": 0.9, "dividend_yield": 0.031, "roe": 0.09}
+        first = calculate_value_score(stock)
+        assert calculate_value_score(dict(stock)) == first
+        assert _value_score_from_inputs.cache_info().hits == 1
+        assert calculate_value_score(stock, thresholds={"per_max": 5.0}) < first
+
 
 # ===================================================================
 # Boundary value tests for PER
@@ -1,4 +1,4 @@
-"""Tests for parallel execution in ContrarianScreener, PullbackScreener, MomentumScreener (KIK-530)."""
+"""Tests for parallel execution in Contrarian/Pullback/Momentum/Alpha/Growth/Trending screeners (KIK-530)."""
 
 import pandas as pd
 import numpy as np
@@ -7,6 +7,10 @@ import pytest
 from src.core.screening.contrarian_screener import ContrarianScreener
 from src.core.screening.pullback_screener import PullbackScreener
 from src.core.screening.momentum_screener import MomentumScreener
+from src.core.screening.alpha_screener import AlphaScreener
+from src.core.screening.growth_screener import GrowthScreener
+from src.core.screening.query_screener import QueryScreener
+from src.core.screening.trending_screener import TrendingScreener
 
 
 # ---------------------------------------------------------------------------
@@ -269,3 +273,143 @@ class TestPullbackParallel:
                 a_key = (0 if a.get("match_type") == "full" else 1, -(a.get("final_score") or 0.0))
                 b_key = (0 if b.get("match_type") == "full" else 1, -(b.get("final_score") or 0.0))
                 assert a_key <= b_key
+
+
+# ---------------------------------------------------------------------------
+# AlphaScreener / GrowthScreener parallel tests
+# ---------------------------------------------------------------------------
+
+class _DetailMockClient:
+    def __init__(self, quotes, detail, hist=None, fail_symbols=None):
+        self._quotes = quotes
+        self._detail = detail
+        self._hist = hist
+        self._fail_symbols = fail_symbols or set()
+
+    def screen_stocks(self, query, **kw):
+        return self._quotes
+
+    def get_stock_detail(self, symbol):
+        if symbol in self._fail_symbols:
+            raise RuntimeError(f"Simulated failure for {symbol}")
+        if callable(self._detail):
+            return self._detail(symbol)
+        return self._detail
+
+    def get_price_history(self, symbol, **kw):
+        return self._hist
+
+
+def _passing_change_result(detail: dict) -> dict:
+    """compute_change_score stand-in that always clears the 3/4 quality gate."""
+    component = {"score": 20.0, "raw": 0.1}
+    return {
+        "change_score": 60.0,
+        "accruals": component,
+        "revenue_acceleration": component,
+        "fcf_yield": component,
+        "roe_trend": component,
+        "passed_count": 3,
+        "quality_pass": True,
+    }
+
+
+class TestAlphaParallel:
+    @pytest.fixture(autouse=True)
+    def _pass_quality_gate(self, monkeypatch):
+        import src.core.screening.alpha_screener as alpha_mod
+        monkeypatch.setattr(alpha_mod, "compute_change_score", _passing_change_result)
+
+    def test_parallel_one_failure_others_succeed(self):
+        """One stock raising in get_stock_detail should not abort the screen."""
+        quotes = [
+            _make_contrarian_quote("1001.T"),
+            _make_contrarian_quote("FAIL.T"),
+            _make_contrarian_quote("1002.T"),
+        ]
+        screener = AlphaScreener(_DetailMockClient(
+            quotes=quotes,
+            detail=_make_contrarian_detail(),
+            hist=_make_uptrend_hist(300),
+            fail_symbols={"FAIL.T"},
+        ))
+        results = screener.screen(region="jp", top_n=10)
+        symbols = [r["symbol"] for r in results]
+        assert sorted(symbols) == ["1001.T", "1002.T"]
+        assert all(r["change_score"] == 60.0 for r in results)
+
+    def test_rejected_stock_skips_price_history(self):
+        """Stocks failing the change quality gate never fetch price history."""
+        fetched: list[str] = []
+
+        class _Client(_DetailMockClient):
+            def get_price_history(self, symbol, **kw):
+                fetched.append(symbol)
+                return super().get_price_history(symbol, **kw)
+
+        detail = _make_contrarian_detail()
+        quotes = [_make_contrarian_quote("1001.T"), _make_contrarian_quote("REJ.T")]
+        screener = AlphaScreener(_Client(
+            quotes=quotes,
+            detail=lambda sym: None if sym == "REJ.T" else detail,
+            hist=_make_uptrend_hist(300),
+        ))
+        results = screener.screen(region="jp", top_n=10)
+        assert fetched == ["1001.T"]
+        assert [r["symbol"] for r in results] == ["1001.T"]
+        assert "total_score" in results[0]
+        assert results[0]["pullback_match"] in ("full", "partial", "none")
+
+
+class TestGrowthParallel:
+    def test_parallel_one_failure_others_succeed(self):
+        """Failed detail fetch is skipped; other stocks keep sorted order."""
+        growth = {"G1": 0.10, "G2": 0.30, "G3": 0.20}
+        quotes = [_make_contrarian_quote(s) for s in ["G1", "FAIL", "G2", "G3"]]
+        screener = GrowthScreener(_DetailMockClient(
+            quotes=quotes,
+            detail=lambda sym: {"eps_growth": growth[sym]},
+            fail_symbols={"FAIL"},
+        ))
+        results = screener.screen(region="jp", top_n=10)
+        assert [r["symbol"] for r in results] == ["G2", "G3", "G1"]
+
+
+class TestQueryPullbackParallel:
+    def test_parallel_one_failure_others_succeed(self, monkeypatch):
+        """with_pullback: a failing history fetch is skipped; order stays deterministic."""
+        import src.core.screening.query_screener as qs
+
+        monkeypatch.setattr(qs, "detect_pullback_in_uptrend", lambda hist: {
+            "all_conditions": True, "bounce_score": 50.0, "rsi": 40.0,
+        })
+        quotes = [_make_contrarian_quote(s, per=per) for s, per in
+                  [("Q1", 14.0), ("FAIL", 5.0), ("Q2", 6.0), ("Q3", 10.0)]]
+        screener = QueryScreener(_PullbackMockClient(
+            quotes=quotes, hist=_make_uptrend_hist(300), fail_symbols={"FAIL"},
+        ))
+        results = screener.screen(region="jp", criteria={}, top_n=10, with_pullback=True)
+        assert [r["symbol"] for r in results] == ["Q2", "Q3", "Q1"]
+        assert all(r["match_type"] == "full" for r in results)
+
+
+class TestTrendingParallel:
+    def test_info_fetch_keeps_trending_order(self):
+        """Fundamentals are fetched concurrently but rows follow the Grok order."""
+        import time
+        from unittest.mock import MagicMock
+
+        delays = {"T1": 0.05, "T2": 0.0, "T3": 0.02}
+
+        class _Client:
+            def get_stock_info(self, symbol):
+                time.sleep(delays[symbol])
+                return {"symbol": symbol, "name": symbol, "per": 50.0, "pbr": 5.0}
+
+        grok = MagicMock()
+        grok.search_trending_stocks.return_value = {
+            "stocks": [{"ticker": t, "reason": "buzz"} for t in ["T1", "", "T2", "T3"]],
+            "market_context": "",
+        }
+        results, _ = TrendingScreener(_Client(), grok).screen(top_n=10)
+        assert [r["symbol"] for r in results] == ["T1", "T2", "T3"]
@@ -402,6 +402,21 @@ class TestRunWhatIfSimulation:
         whatif_files = [f for f in new_files if f.startswith("whatif_")]
         assert len(whatif_files) == 0
 
+    def test_after_analysis_does_not_reread_csv(self, portfolio_csv, mock_client):
+        """Analyzers receive positions in memory; only the initial load reads the CSV."""
+        from unittest.mock import patch
+
+        proposed = [
+            {"symbol": "9984.T", "shares": 100, "cost_price": 7500.0,
+             "cost_currency": "JPY"},
+        ]
+        fail = AssertionError("CSV re-read")
+        with patch("src.core.portfolio.portfolio_query.load_portfolio", side_effect=fail), \
+                patch("src.core.portfolio.portfolio_manager.load_portfolio", side_effect=fail):
+            result = run_what_if_simulation(portfolio_csv, proposed, mock_client)
+
+        assert result["after"]["total_value_jpy"] > result["before"]["total_value_jpy"]
+
     def test_original_csv_unchanged(self, portfolio_csv, mock_client):
         from src.core.portfolio.portfolio_manager import load_portfolio
 
@@ -433,6 +448,11 @@ class TestParseRemoveArg:
         assert result[0]["symbol"] == "7203.T"
         assert result[0]["shares"] == 100
 
+    def test_whitespace_ignored(self):
+        result = parse_remove_arg(" 7203.T : 100 ,\tAAPL:10\n")
+        assert [r["symbol"] for r in result] == ["7203.T", "AAPL"]
+        assert [r["shares"] for r in result] == [100, 10]
+
     def test_multiple_entries(self):
         result = parse_remove_arg("7203.T:100,AAPL:10")
         assert len(result) == 2
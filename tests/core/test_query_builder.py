@@ -473,3 +473,37 @@ class TestMaxMarketCapCriteria:
         conditions = _build_criteria_conditions({"max_market_cap": 1_000_000_000})
         assert len(conditions) == 1
         assert isinstance(conditions[0], EquityQuery)
+
+
+# ===================================================================
+# load_preset caching
+# ===================================================================
+
+
+class TestLoadPresetCache:
+    def test_yaml_parsed_once(self, monkeypatch):
+        """Repeated load_preset calls should parse the presets YAML only once."""
+        import src.core.screening.query_builder as qb
+        from src.core.screening.query_builder import load_preset
+
+        monkeypatch.setattr(qb, "_PRESETS", None)
+        calls = []
+        real_load = qb.yaml.safe_load
+
+        def counting_load(f):
+            calls.append(1)
+            return real_load(f)
+
+        monkeypatch.setattr(qb.yaml, "safe_load", counting_load)
+        load_preset("value")
+        load_preset("value")
+        load_preset("growth")
+        assert len(calls) == 1
+
+    def test_returned_criteria_is_a_copy(self):
+        """Mutating the returned criteria must not leak into later calls."""
+        from src.core.screening.query_builder import load_preset
+
+        criteria = load_preset("value")
+        criteria["max_per"] = -1
+        assert load_preset("value").get("max_per") != -1
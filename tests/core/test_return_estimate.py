@@ -476,6 +476,30 @@ class TestEstimatePortfolioReturn:
         assert result["positions"][0]["method"] == "no_data"
         assert result["positions"][0]["base"] is None
 
+    @patch("src.core.portfolio.portfolio_manager._infer_currency")
+    @patch("src.core.portfolio.fx_utils.get_fx_rates")
+    @patch("src.core.portfolio.portfolio_manager.load_portfolio")
+    def test_parallel_fetch_keeps_portfolio_order(self, mock_load, mock_fx, mock_infer):
+        """並列取得でもポジション順を保ち、価格なし銘柄のニュースは取得しないこと."""
+        symbols = ["A", "B", "NOPRICE", "C", "D", "E", "F"]
+        mock_load.return_value = [
+            {"symbol": s, "shares": 1, "cost_price": 10.0, "cost_currency": "USD"}
+            for s in symbols
+        ]
+        mock_fx.return_value = {"USD": 150.0}
+        mock_infer.return_value = "USD"
+        mock_client = MagicMock()
+        mock_client.get_stock_detail.side_effect = lambda s: {
+            "price": None if s == "NOPRICE" else 20.0, "name": s, "currency": "USD",
+        }
+        mock_client.get_stock_news.return_value = []
+        with patch("src.data.grok_client.is_available", return_value=False):
+            result = estimate_portfolio_return("/fake/path.csv", mock_client)
+        assert [p["symbol"] for p in result["positions"]] == symbols
+        assert mock_client.get_stock_detail.call_count == len(symbols)
+        news_symbols = {c.args[0] for c in mock_client.get_stock_news.call_args_list}
+        assert news_symbols == set(symbols) - {"NOPRICE"}
+
     @patch("src.core.portfolio.portfolio_manager._infer_currency")
     @patch("src.core.portfolio.fx_utils.get_fx_rates")
     @patch("src.core.portfolio.portfolio_manager.load_portfolio")
@@ -140,6 +140,25 @@ class TestNormalizeQuote:
         result = QueryScreener._normalize_quote(quote)
         assert result["revenue_growth"] == pytest.approx(-0.10)
 
+    def test_normalize_quotes_batch_matches_single(self):
+        """_normalize_quotes yields the same dicts as per-quote normalization plus value_score."""
+        from src.core.screening.indicators import calculate_value_score
+
+        quotes = [
+            {"symbol": "7203.T", "trailingPE": 10.0, "priceToBook": 0.8, "dividendYield": 3.0},
+            {"symbol": "AAPL", "trailingPE": 30.0, "returnOnEquity": 1.5},
+        ]
+        batch = QueryScreener._normalize_quotes(quotes)
+        for quote, result in zip(quotes, batch):
+            expected = QueryScreener._normalize_quote(quote)
+            expected["value_score"] = calculate_value_score(expected)
+            assert result == expected
+
+    def test_normalize_quotes_without_value_score(self):
+        result = QueryScreener._normalize_quotes([{"symbol": "AAPL"}], with_value_score=False)
+        assert result == [QueryScreener._normalize_quote({"symbol": "AAPL"})]
+        assert "value_score" not in result[0]
+
 
 # ===================================================================
 # PullbackScreener.DEFAULT_CRITERIA
@@ -636,3 +655,72 @@ class TestQueryScreenerCriteriaOverrides:
             criteria_overrides={"max_market_cap": 1_000_000_000},
         )
         assert result == []
+
+
+# ===================================================================
+# QueryScreener shareholder return filter (KIK-378)
+# ===================================================================
+
+
+class TestQueryScreenerShareholderReturn:
+    class _Client:
+        def __init__(self, quotes, details, fail=()):
+            self._quotes = quotes
+            self._details = details
+            self._fail = set(fail)
+
+        def screen_stocks(self, *a, **kw):
+            return self._quotes
+
+        def get_stock_detail(self, symbol):
+            if symbol in self._fail:
+                raise RuntimeError(symbol)
+            return self._details.get(symbol)
+
+    def test_filters_and_keeps_value_score_order(self):
+        """Parallel detail fetch keeps passing stocks, skips failures and None."""
+        quotes = [
+            {"symbol": s, "trailingPE": per, "priceToBook": 0.8}
+            for s, per in [("LOW", 30.0), ("HIGH", 8.0), ("NONE", 9.0), ("FAIL", 7.0), ("POOR", 6.0)]
+        ]
+        details = {
+            "LOW": {"market_cap": 1000, "dividend_paid": -60},
+            "HIGH": {"market_cap": 1000, "dividend_paid": -50, "stock_repurchase": -30},
+            "POOR": {"market_cap": 1000, "dividend_paid": -5},
+        }
+        screener = QueryScreener(self._Client(quotes, details, fail={"FAIL"}))
+        results = screener.screen(
+            region="jp", criteria={"min_total_shareholder_return": 0.05}, top_n=10,
+        )
+        assert [r["symbol"] for r in results] == ["HIGH", "LOW"]
+        assert results[0]["total_shareholder_return"] == pytest.approx(0.08)
+        assert results[0]["buyback_yield"] == pytest.approx(0.03)
+
+    def test_pullback_runs_only_for_passing_stocks(self, monkeypatch):
+        """Shareholder filter + with_pullback: history is fetched only for passing stocks."""
+        import src.core.screening.query_screener as qs
+
+        monkeypatch.setattr(qs, "detect_pullback_in_uptrend", lambda hist: {
+            "all_conditions": True, "bounce_score": 50.0,
+        })
+        fetched = []
+
+        class _Client(self._Client):
+            def get_price_history(self, symbol, **kw):
+                import pandas as pd
+                fetched.append(symbol)
+                return pd.DataFrame({"Close": [1.0], "Volume": [1.0]})
+
+        quotes = [{"symbol": "PASS"}, {"symbol": "DROP"}]
+        details = {
+            "PASS": {"market_cap": 1000, "dividend_paid": -80},
+            "DROP": {"market_cap": 1000, "dividend_paid": -1},
+        }
+        screener = QueryScreener(_Client(quotes, details))
+        results = screener.screen(
+            region="jp", criteria={"min_total_shareholder_return": 0.05},
+            top_n=10, with_pullback=True,
+        )
+        assert [r["symbol"] for r in results] == ["PASS"]
+        assert results[0]["match_type"] == "full"
+        assert fetched == ["PASS"]
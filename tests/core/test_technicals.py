@@ -275,6 +275,19 @@ class TestDetectPullbackInUptrend:
         # but the important thing is that it's a bool and the function runs
         assert isinstance(result["all_conditions"], bool)
 
+    def test_nan_volume_skipped_in_bounce_lookback(self):
+        """A missing Volume day must not blank out the lookback volume ratio."""
+        close = [1000.0 + i for i in range(250)]
+        volume = [1_000_000.0] * 245 + [3_000_000.0] * 5
+        volume[-3] = float("nan")
+        hist = pd.DataFrame({"Close": close, "Volume": volume})
+        result = detect_pullback_in_uptrend(hist)
+        # Day 0's 5/20-day means skip the NaN, so the surge fires on day 0
+        assert result["bounce_details"]["volume_surge"] is True
+        assert result["bounce_details"]["lookback_day"] == 0
+        # The headline ratio keeps its rolling-window semantics
+        assert math.isnan(result["volume_ratio"])
+
     def test_sma_values_reasonable(self, price_history_df):
         """SMA50 and SMA200 should be between min and max price."""
         result = detect_pullback_in_uptrend(price_history_df)
@@ -4,6 +4,10 @@ import pytest
 
 from src.core.ticker_utils import (
     extract_all_symbols,
+    get_lot_size,
+    infer_country,
+    infer_currency,
+    infer_region_code,
     round_to_lot_size,
     validate_lot_size,
 )
@@ -35,6 +39,28 @@ class TestExtractAllSymbols:
         assert result == []
 
 
+# ===================================================================
+# Suffix lookups
+# ===================================================================
+
+
+class TestSuffixLookups:
+    @pytest.mark.parametrize("symbol,lot,currency,region,country", [
+        ("7203.T", 100, "JPY", "jp", "Japan"),
+        ("7203.t", 100, "JPY", "jp", "Japan"),       # case-insensitive
+        ("2330.TW", 1000, "TWD", "tw", "Taiwan"),
+        ("6488.TWO", 1000, "TWD", "tw", "Taiwan"),  # not confused with .TW/.T
+        ("SHOP.TO", 1, "CAD", "ca", "Canada"),
+        ("AAPL", 1, "USD", "us", "United States"),
+        ("BRK.B", 1, "USD", "us", "Unknown"),        # unknown suffix
+    ])
+    def test_suffix_maps(self, symbol, lot, currency, region, country):
+        assert get_lot_size(symbol) == lot
+        assert infer_currency(symbol) == currency
+        assert infer_region_code(symbol) == region
+        assert infer_country(symbol) == country
+
+
 # ===================================================================
 # round_to_lot_size tests (KIK-597)
 # ===================================================================
@@ -212,3 +212,35 @@ class TestValueScreenerScreen:
         results = vs.screen()
         assert len(results) == 1
         assert "value_score" in results[0]
+
+    def test_concurrent_fetch_keeps_symbol_order_on_ties(self):
+        """Parallel get_stock_info must not reorder equal-score results."""
+        import time
+
+        def info_fn(symbol):
+            time.sleep(0.03 if symbol == "1001.T" else 0.0)
+            return _make_stock_info(symbol)
+
+        symbols = ["1001.T", "1002.T", "1003.T"]
+        market = _MockMarket(symbols=symbols)
+        vs = ValueScreener(_MockYahooClient(stock_info=info_fn), market)
+        results = vs.screen()
+        assert [r["symbol"] for r in results] == symbols
+
+    def test_market_defaults_resolved_once(self):
+        """Repeated screen() calls reuse the market's thresholds and symbols."""
+        calls = {"symbols": 0, "thresholds": 0}
+
+        class _CountingMarket(_MockMarket):
+            def get_default_symbols(self):
+                calls["symbols"] += 1
+                return super().get_default_symbols()
+
+            def get_thresholds(self):
+                calls["thresholds"] += 1
+                return super().get_thresholds()
+
+        vs = ValueScreener(_MockYahooClient(stock_info=_make_stock_info()), _CountingMarket())
+        vs.screen()
+        vs.screen()
+        assert calls == {"symbols": 1, "thresholds": 1}
@@ -6,7 +6,7 @@ KIK-427 additions: freshness label tests.
 """
 
 from datetime import date, datetime, timedelta
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 
@@ -29,6 +29,7 @@ from src.data.context.auto_context import (
     _infer_skill_from_vectors,
     _is_market_query,
     _is_portfolio_query,
+    _classify_query,
     _load_lessons,
     _merge_context,
     _recent_hours,
@@ -87,6 +88,13 @@ class TestKeywordDetection:
     def test_portfolio_query_negative(self):
         assert _is_portfolio_query("AAPLを調べて") is False
 
+    def test_classify_query_single_pass(self):
+        assert _classify_query("今日の相場は？") == "market"
+        assert _classify_query("PF確認して") == "pf"
+        # Market wins even when the portfolio keyword comes first
+        assert _classify_query("PFと市況") == "market"
+        assert _classify_query("AAPLを調べて") is None
+
 
 # ===================================================================
 # Graph state analysis helpers
@@ -330,6 +338,13 @@ class TestFreshHours:
         with patch.dict("os.environ", {"CONTEXT_FRESH_HOURS": ""}):
             assert _fresh_hours() == 24
 
+    def test_int_like_values(self):
+        """int() と同じく符号・前後空白は許容、不正値はデフォルト"""
+        for raw, expected in ((" 12 ", 12), ("+6", 6), ("-1", -1),
+                              ("-", 24), ("1.5", 24), ("²", 24)):
+            with patch.dict("os.environ", {"CONTEXT_FRESH_HOURS": raw}):
+                assert _fresh_hours() == expected, raw
+
 
 class TestRecentHours:
     def test_default(self):
@@ -401,6 +416,31 @@ class TestFreshnessLabel:
         eight_days_ago = (date.today() - timedelta(days=8)).isoformat()
         assert freshness_label(eight_days_ago) == "STALE"
 
+    def test_explicit_now(self):
+        """now を渡すと時計を読まずにその時刻基準で判定"""
+        from datetime import datetime
+        now = datetime(2026, 1, 10, 12, 0)
+        assert freshness_label("2026-01-10", now) == "FRESH"
+        assert freshness_label("2026-01-07", now) == "RECENT"
+        assert freshness_label("2025-12-01", now) == "STALE"
+
+    def test_bulk_matches_scalar(self):
+        """_bulk_freshness は freshness_label を個別に呼んだ結果と一致"""
+        from datetime import datetime
+        from src.data.context.freshness import _bulk_freshness
+        now = datetime(2026, 1, 10, 12, 0)
+        dates = ["2026-01-10", "2026-01-07T09:00:00", "2025-12-01", "", None]
+        assert _bulk_freshness(dates, now) == [freshness_label(d, now) for d in dates]
+        assert _bulk_freshness(["?", "2026-01-10"], now) == ["STALE", "FRESH"]
+
+    def test_bulk_rejects_non_iso_dates(self):
+        """today / NaT / 年だけ・年月だけの日付は scalar と同じく STALE"""
+        from datetime import datetime
+        from src.data.context.freshness import _bulk_freshness
+        now = datetime(2026, 1, 10, 12, 0)
+        dates = ["today", "now", "NaT", "2026", "2026-01"]
+        assert _bulk_freshness(dates, now) == ["STALE"] * len(dates)
+
 
 class TestFreshnessAction:
     def test_fresh(self):
@@ -622,6 +662,38 @@ class TestResolveSymbol:
         result = _resolve_symbol("トヨタの状況は？")
         assert result is None
 
+    def test_name_lookup_uses_fulltext_index(self):
+        """企業名逆引きは fulltext インデックスをフレーズ検索する"""
+        session = MagicMock()
+        session.run.return_value.single.return_value = {"symbol": "7203.T"}
+        assert _resolve_symbol('トヨタ "自動車"', session=session) == "7203.T"
+        query, = session.run.call_args.args
+        assert "stock_name_ft" in query
+        assert session.run.call_args.kwargs["phrase"] == '"トヨタ \\"自動車\\""'
+
+    def test_name_lookup_falls_back_to_scan(self):
+        """fulltext インデックスが無い場合はラベルスキャンにフォールバック"""
+        session = MagicMock()
+        fulltext = MagicMock()
+        fulltext.single.side_effect = Exception("no such index")
+        scan = MagicMock()
+        scan.single.return_value = {"symbol": "7203.T"}
+        session.run.side_effect = [fulltext, scan]
+        assert _resolve_symbol("トヨタ", session=session) == "7203.T"
+        assert "MATCH (s:Stock)" in session.run.call_args.args[0]
+
+
+    def test_name_lookup_scans_when_fulltext_finds_nothing(self):
+        """フレーズ検索でトークン途中の部分一致が取れない場合もスキャンで補う"""
+        session = MagicMock()
+        fulltext = MagicMock()
+        fulltext.single.return_value = None
+        scan = MagicMock()
+        scan.single.return_value = {"symbol": "6758.T"}
+        session.run.side_effect = [fulltext, scan]
+        assert _resolve_symbol("ソニー", session=session) == "6758.T"
+        assert "stock_name_ft" in session.run.call_args_list[0].args[0]
+        assert "MATCH (s:Stock)" in session.run.call_args_list[1].args[0]
 
 # ===================================================================
 # Check bookmarked (with Neo4j mock)
@@ -759,6 +831,66 @@ class TestGetContext:
         assert result["recommended_skill"] == "report"
         assert result["relationship"] == "ウォッチ中"
 
+    @patch("src.data.context.auto_context._check_bookmarked")
+    @patch("src.data.context.auto_context.graph_store")
+    def test_flags_from_history_query_skip_extra_lookups(self, mock_gs, mock_bookmark):
+        """履歴クエリがフラグを返す場合、個別の照会は行わない"""
+        mock_gs.is_available.return_value = True
+        mock_gs.get_stock_history.return_value = {"bookmarked": True, "held": False}
+
+        result = get_context("7203.Tってどう？")
+        assert result["relationship"] == "ウォッチ中"
+        mock_gs.get_stock_history.assert_called_once_with(
+            "7203.T", include_flags=True, session=ANY,
+        )
+        mock_bookmark.assert_not_called()
+        mock_gs.is_held.assert_not_called()
+
+    @patch("src.data.context.auto_context.graph_store")
+    def test_symbol_lookups_share_one_session(self, mock_gs):
+        """企業名逆引き・履歴・フォールバック照会が1セッションを共有する"""
+        mock_driver = MagicMock()
+        mock_session = MagicMock()
+        mock_session.run.return_value.single.return_value = {"symbol": "7203.T", "cnt": 0}
+        mock_driver.session.return_value.__enter__.return_value = mock_session
+        mock_gs._get_driver.return_value = mock_driver
+        mock_gs.is_available.return_value = True
+        mock_gs.get_stock_history.return_value = {}  # flags missing -> fallbacks
+
+        result = get_context("トヨタの状況は？")
+        assert result["symbol"] == "7203.T"
+        mock_driver.session.assert_called_once_with(default_access_mode="READ")
+        mock_gs.get_stock_history.assert_called_once_with(
+            "7203.T", include_flags=True, session=mock_session,
+        )
+        mock_gs.is_held.assert_called_once_with("7203.T", session=mock_session)
+        # Name lookup + watchlist fallback ran on the shared session
+        assert mock_session.run.call_count == 2
+
+    @patch("src.data.context.auto_context._check_bookmarked")
+    @patch("src.data.context.auto_context.graph_store")
+    def test_vector_search_overlaps_graph_lookup(self, mock_gs, mock_bookmark):
+        """ベクトル検索はグラフ照会と並行して実行される"""
+        import threading
+        history_started = threading.Event()
+        overlapped = []
+
+        def fake_vector_search(text):
+            # Only returns True if the graph lookup starts while we are running
+            overlapped.append(history_started.wait(timeout=2))
+            return []
+
+        def fake_history(symbol, **kw):
+            history_started.set()
+            return {"bookmarked": False, "held": False}
+
+        mock_gs.is_available.return_value = True
+        mock_gs.get_stock_history.side_effect = fake_history
+        with patch("src.data.context.auto_context._vector_search", side_effect=fake_vector_search):
+            result = get_context("7203.Tってどう？")
+        assert result is not None
+        assert overlapped == [True]
+
     @patch("src.data.context.auto_context._check_bookmarked")
     @patch("src.data.context.auto_context.graph_store")
     def test_context_includes_all_fields(self, mock_gs, mock_bookmark):
@@ -805,6 +937,33 @@ class TestVectorSearch:
         assert len(result) == 1
         assert result[0]["label"] == "Report"
 
+    @patch("src.data.context.auto_context.graph_query")
+    def test_repeat_prompt_reuses_embedding(self, mock_gq):
+        """同じ入力の再検索では TEI を呼ばずに埋め込みを再利用する"""
+        mock_gq.vector_search.return_value = []
+        with patch("src.data.embedding_client.is_available", return_value=True), \
+             patch("src.data.embedding_client.get_embedding",
+                   return_value=[0.1] * 384) as mock_embed:
+            _vector_search("Toyota report")
+            _vector_search("  Toyota report ")
+            _vector_search("Sony report")
+        assert [c.args[0] for c in mock_embed.call_args_list] == [
+            "Toyota report", "Sony report",
+        ]
+        assert mock_gq.vector_search.call_count == 3
+
+    @patch("src.data.context.auto_context.graph_query")
+    def test_embedding_failure_not_cached(self, mock_gq):
+        """埋め込み失敗は記録せず次回再試行する"""
+        mock_gq.vector_search.return_value = []
+        with patch("src.data.embedding_client.is_available", return_value=True), \
+             patch("src.data.embedding_client.get_embedding",
+                   side_effect=[None, [0.1] * 384]) as mock_embed:
+            assert _vector_search("retry me") == []
+            _vector_search("retry me")
+        assert mock_embed.call_count == 2
+        mock_gq.vector_search.assert_called_once()
+
     @patch("src.data.context.auto_context.graph_query")
     def test_embedding_failure_returns_empty(self, mock_gq):
         """TEI is available but embedding fails → 空リスト"""
@@ -859,6 +1018,20 @@ class TestFormatVectorResults:
         md = _format_vector_results(results)
         assert "[NONE]" in md
 
+    def test_vector_only_merge_reads_clock_once(self):
+        """ベクトルのみのマージでは時計を1回だけ読む"""
+        today = date.today().isoformat()
+        results = [{"label": "Report", "summary": f"r{i}", "score": 0.8,
+                    "date": today, "id": f"r{i}"} for i in range(5)]
+        with patch("src.data.context.freshness.datetime") as mock_dt:
+            mock_dt.now.return_value = datetime.now()
+            mock_dt.fromisoformat.side_effect = datetime.fromisoformat
+            merged = _merge_context(None, results)
+        assert mock_dt.now.call_count == 1
+        md = merged["context_markdown"]
+        assert md.startswith("⛔ FRESH")
+        assert md.count("[FRESH]") == 5
+
 
 class TestInferSkillFromVectors:
     """Tests for _infer_skill_from_vectors()."""
@@ -886,6 +1059,12 @@ class TestInferSkillFromVectors:
     def test_empty_returns_report(self):
         assert _infer_skill_from_vectors([]) == "report"
 
+    def test_tie_prefers_first_seen_label(self):
+        results = [{"label": "Trade"}, {"label": "Screen"}, {"label": "Screen"},
+                   {"label": "Trade"}, {"label": "Report"}, {"label": "Screen"}]
+        # Only the top 5 count: Trade=2, Screen=2 -> first seen wins
+        assert _infer_skill_from_vectors(results) == "health"
+
 
 class TestMergeContext:
     """Tests for _merge_context()."""
@@ -1243,3 +1422,32 @@ class TestGetContextWithLessons:
         result = get_context("PF ヘルスチェック")
         assert result is not None
         assert "## 保有銘柄の重要メモ" not in result["context_markdown"]
+
+
+# ===================================================================
+# Single-pass history summary
+# ===================================================================
+
+class TestSummarizeHistory:
+    def test_flags_match_individual_helpers(self):
+        from src.data.context.skill_recommender import _summarize_history
+        old = (date.today() - timedelta(days=120)).isoformat()
+        recent = (date.today() - timedelta(days=3)).isoformat()
+        history = {
+            "trades": [{"type": "buy"}, {"type": "buy"}, {"type": "sell"}],
+            "notes": [
+                {"type": "thesis", "date": old},
+                {"type": "lesson", "date": recent},
+                {"type": "concern", "date": recent},
+            ],
+            "health_checks": [{"date": recent}],
+            "screens": [{}, {}],
+            "researches": [{"date": recent}],
+        }
+        flags = _summarize_history(history)
+        assert flags.bought_not_sold is _has_bought_not_sold(history)
+        assert flags.thesis_stale is _thesis_needs_review(history, 90)
+        assert flags.exit_alert is _has_exit_alert(history)
+        assert flags.screen_count == _screening_count(history)
+        assert flags.recent_research is _has_recent_research(history, 7)
+        assert flags.has_concern is _has_concern_notes(history)
@@ -178,20 +178,23 @@ class TestGetRecentMarketContext:
 class TestGetTradeContext:
     def test_returns_trades_and_notes(self, gq_with_driver):
         gq, _, session = gq_with_driver
-        trade_rec = MagicMock()
-        trade_rec.__getitem__ = lambda self, k: {"date": "2025-01-15", "type": "buy", "shares": 100, "price": 2850}[k]
-        trade_rec.keys = lambda: ["date", "type", "shares", "price"]
-        note_rec = MagicMock()
-        note_rec.__getitem__ = lambda self, k: {"date": "2025-01-15", "type": "thesis", "content": "Strong buy"}[k]
-        note_rec.keys = lambda: ["date", "type", "content"]
-        # session.run called twice: first for trades, second for notes
-        session.run.side_effect = [iter([trade_rec]), iter([note_rec])]
+        # One statement returns both collected lists
+        session.run.return_value.single.return_value = {
+            "trades": [{"date": "2025-01-15", "type": "buy", "shares": 100, "price": 2850}],
+            "notes": [{"date": "2025-01-15", "type": "thesis", "content": "Strong buy"}],
+        }
         result = gq.get_trade_context("7203.T")
+        assert session.run.call_count == 1
         assert len(result["trades"]) == 1
         assert result["trades"][0]["shares"] == 100
         assert len(result["notes"]) == 1
         assert result["notes"][0]["content"] == "Strong buy"
 
+    def test_unknown_stock_returns_empty(self, gq_with_driver):
+        gq, _, session = gq_with_driver
+        session.run.return_value.single.return_value = None
+        assert gq.get_trade_context("ZZZZ") == {"trades": [], "notes": []}
+
     def test_returns_empty_no_driver(self):
         import src.data.graph_query as gq
         with patch("src.data.graph_store._get_driver", return_value=None):
@@ -52,6 +52,48 @@ class TestConnection:
         with patch("src.data.graph_store._get_driver", return_value=None):
             assert gs.is_available() is False
 
+    def test_get_driver_applies_pool_config(self):
+        import sys
+        import src.data.graph_store._common as common
+        fake_neo4j = MagicMock()
+        with patch.dict(sys.modules, {"neo4j": fake_neo4j}):
+            driver = common._get_driver()
+        kwargs = fake_neo4j.GraphDatabase.driver.call_args.kwargs
+        assert kwargs["connection_timeout"] == 2.0
+        assert kwargs["max_connection_pool_size"] == common._DRIVER_CONFIG["max_connection_pool_size"]
+        assert driver._driver is fake_neo4j.GraphDatabase.driver.return_value
+
+    @pytest.mark.parametrize("raw,expected", [
+        (None, 32), ("16", 16), ("abc", 32), ("", 32), ("0", 32),
+    ])
+    def test_pool_size_env_is_lenient(self, monkeypatch, raw, expected):
+        import src.data.graph_store._common as common
+        if raw is None:
+            monkeypatch.delenv("NEO4J_POOL_SIZE", raising=False)
+        else:
+            monkeypatch.setenv("NEO4J_POOL_SIZE", raw)
+        assert common._pool_size_env() == expected
+
+    def test_driver_sessions_name_database(self):
+        """Sessions default to NEO4J_DATABASE; explicit database wins."""
+        from src.data.graph_store._common import _DatabaseDriver
+        raw = MagicMock()
+        driver = _DatabaseDriver(raw, "neo4j")
+        driver.session()
+        driver.session(database="other", default_access_mode="READ")
+        assert raw.session.call_args_list == [
+            call(database="neo4j"),
+            call(database="other", default_access_mode="READ"),
+        ]
+        driver.close()
+        raw.close.assert_called_once()
+
+    def test_execute_query_names_database(self):
+        from src.data.graph_store._common import _DatabaseDriver
+        raw = MagicMock()
+        _DatabaseDriver(raw, "neo4j").execute_query("RETURN 1", {"a": 1})
+        raw.execute_query.assert_called_once_with("RETURN 1", {"a": 1}, database_="neo4j")
+
     def test_is_available_success(self, gs_with_driver):
         gs, driver, _ = gs_with_driver
         driver.verify_connectivity.return_value = None
@@ -82,8 +124,17 @@ class TestSchema:
     def test_init_schema_success(self, gs_with_driver):
         gs, _, session = gs_with_driver
         assert gs.init_schema() is True
-        # 25 constraints + 20 indexes + 10 vector indexes = 55 (KIK-414/420/428/472/547/571/603)
-        assert session.run.call_count == 55
+        # 25 constraints + 21 indexes in one transaction (KIK-414/428/472/547/571/603)
+        session.execute_write.assert_called_once()
+        assert len(session.execute_write.call_args[0][1]) == 46
+        # 10 vector indexes + 1 fulltext index run separately (KIK-420)
+        assert session.run.call_count == 11
+
+    def test_init_schema_runs_once_per_driver(self, gs_with_driver):
+        gs, driver, session = gs_with_driver
+        assert gs.init_schema() is True
+        assert gs.init_schema() is True
+        driver.session.assert_called_once()
 
     def test_init_schema_no_driver(self):
         import src.data.graph_store as gs
@@ -92,8 +143,26 @@ class TestSchema:
 
     def test_init_schema_error(self, gs_with_driver):
         gs, driver, session = gs_with_driver
-        driver.session.return_value.__enter__.return_value.run.side_effect = Exception("DB error")
+        session.execute_write.side_effect = Exception("DB error")
         assert gs.init_schema() is False
+        # A failed init is retried on the next call
+        session.execute_write.side_effect = None
+        assert gs.init_schema() is True
+
+    def test_list_constraints(self, gs_with_driver):
+        gs, _, session = gs_with_driver
+        session.run.return_value = [{"name": "stock_symbol"}, {"name": "note_id"}]
+        assert gs.list_constraints() == ["stock_symbol", "note_id"]
+
+    def test_list_constraints_no_driver(self):
+        import src.data.graph_store as gs
+        with patch("src.data.graph_store._get_driver", return_value=None):
+            assert gs.list_constraints() == []
+
+    def test_list_constraints_error(self, gs_with_driver):
+        gs, _, session = gs_with_driver
+        session.run.side_effect = Exception("DB error")
+        assert gs.list_constraints() == []
 
 
 # ===================================================================
@@ -102,14 +171,17 @@ class TestSchema:
 
 class TestMergeStock:
     def test_merge_stock_basic(self, gs_with_driver):
-        gs, _, session = gs_with_driver
+        gs, driver, session = gs_with_driver
         assert gs.merge_stock("7203.T", "Toyota", "Automotive") is True
-        assert session.run.call_count == 2  # MERGE stock + MERGE sector
+        assert driver.execute_query.call_count == 1  # MERGE stock + sector in one statement
+        assert "IN_SECTOR" in driver.execute_query.call_args[0][0]
+        session.run.assert_not_called()
 
     def test_merge_stock_no_sector(self, gs_with_driver):
-        gs, _, session = gs_with_driver
+        gs, driver, _ = gs_with_driver
         assert gs.merge_stock("7203.T") is True
-        assert session.run.call_count == 1  # Only MERGE stock, no sector
+        assert driver.execute_query.call_count == 1  # Only MERGE stock, no sector
+        assert "IN_SECTOR" not in driver.execute_query.call_args[0][0]
 
     def test_merge_stock_no_driver(self):
         import src.data.graph_store as gs
@@ -118,10 +190,194 @@ class TestMergeStock:
 
     def test_merge_stock_error(self, gs_with_driver):
         gs, driver, _ = gs_with_driver
-        driver.session.return_value.__enter__.return_value.run.side_effect = Exception("err")
+        driver.execute_query.side_effect = Exception("err")
         assert gs.merge_stock("7203.T") is False
 
 
+class TestBulkMergeStocks:
+    def test_single_batch(self, gs_with_driver):
+        gs, _, session = gs_with_driver
+        rows = [
+            {"symbol": "7203.T", "name": "Toyota", "sector": "Automotive"},
+            {"symbol": "AAPL"},
+            {"symbol": ""},
+        ]
+        assert gs.bulk_merge_stocks(rows) == 2
+        session.execute_write.assert_called_once()
+        batch = session.execute_write.call_args[0][1]
+        assert batch[1] == {"symbol": "AAPL", "name": "", "sector": "", "country": ""}
+
+    def test_splits_into_batches(self, gs_with_driver):
+        gs, _, session = gs_with_driver
+        rows = [{"symbol": f"S{i}"} for i in range(5)]
+        assert gs.bulk_merge_stocks(rows, batch_size=2) == 5
+        assert session.execute_write.call_count == 3
+
+    def test_empty_rows(self, gs_with_driver):
+        gs, _, session = gs_with_driver
+        assert gs.bulk_merge_stocks([]) == 0
+        session.execute_write.assert_not_called()
+
+    def test_no_driver(self):
+        import src.data.graph_store as gs
+        with patch("src.data.graph_store._get_driver", return_value=None):
+            assert gs.bulk_merge_stocks([{"symbol": "7203.T"}]) == 0
+
+    def test_error(self, gs_with_driver):
+        gs, _, session = gs_with_driver
+        session.execute_write.side_effect = Exception("err")
+        assert gs.bulk_merge_stocks([{"symbol": "7203.T"}]) == 0
+
+
+class TestWriteBatch:
+    def test_queues_writes_until_exit(self, gs_with_driver):
+        gs, driver, session = gs_with_driver
+        with gs.write_batch():
+            assert gs.merge_stock("7203.T", name="Toyota", sector="Automotive") is True
+            assert gs.merge_screen("2025-01-15", "value", "japan", 1, ["7203.T"]) is True
+            session.run.assert_not_called()
+            driver.session.assert_not_called()
+        session.run.assert_not_called()
+        session.execute_write.assert_called_once()
+        statements = session.execute_write.call_args[0][1]
+        # merge_stock: node + sector, merge_screen: node + SURFACED UNWIND
+        assert len(statements) == 3
+        assert statements[0][1]["symbol"] == "7203.T"
+
+    def test_flushes_every_batch_size(self, gs_with_driver):
+        gs, _, session = gs_with_driver
+        with gs.write_batch(batch_size=2):
+            for sym in ["A", "B", "C"]:
+                gs.merge_stock(sym)
+            assert session.execute_write.call_count == 1
+        assert session.execute_write.call_count == 2
+
+    def test_nested_blocks_share_one_buffer(self, gs_with_driver):
+        gs, _, session = gs_with_driver
+        with gs.write_batch():
+            with gs.write_batch():
+                gs.merge_stock("A")
+            session.execute_write.assert_not_called()
+        session.execute_write.assert_called_once()
+
+    def test_flush_error_is_reported_on_exit(self, gs_with_driver, capsys):
+        gs, _, session = gs_with_driver
+        session.execute_write.side_effect = Exception("connection reset")
+        with pytest.raises(RuntimeError, match="1 of 1 batched graph writes failed"):
+            with gs.write_batch():
+                assert gs.merge_stock("A") is True
+        assert "batched write failed" in capsys.readouterr().err
+
+    def test_bad_statement_is_isolated(self, gs_with_driver):
+        """A batch rejected by one statement is replayed one by one."""
+        gs, _, session = gs_with_driver
+        bad = Exception("syntax")
+        bad.code = "Neo.ClientError.Statement.SyntaxError"
+        committed = []
+
+        def execute_write(fn, statements):
+            if len(statements) > 1 or statements[0][1].get("symbol") == "B":
+                raise bad
+            committed.extend(params["symbol"] for _, params in statements)
+
+        session.execute_write.side_effect = execute_write
+        with pytest.raises(RuntimeError, match="1 of 3") as excinfo:
+            with gs.write_batch() as batch:
+                for sym in ["A", "B", "C"]:
+                    gs.merge_stock(sym)
+        assert committed == ["A", "C"]
+        assert (batch.failed, batch.total) == (1, 3)
+        assert excinfo.value.__cause__ is bad
+
+    def test_auto_flush_failure_keeps_later_batches(self, gs_with_driver):
+        gs, _, session = gs_with_driver
+        session.execute_write.side_effect = [Exception("connection reset"), None]
+        with pytest.raises(RuntimeError, match="2 of 3"):
+            with gs.write_batch(batch_size=2):
+                for sym in ["A", "B", "C"]:
+                    gs.merge_stock(sym)  # the failing flush must not raise here
+        assert session.execute_write.call_count == 2
+        assert session.execute_write.call_args[0][1][0][1]["symbol"] == "C"
+
+    def test_body_error_is_not_masked(self, gs_with_driver):
+        gs, _, session = gs_with_driver
+        session.execute_write.side_effect = Exception("connection reset")
+        with pytest.raises(KeyError):
+            with gs.write_batch():
+                gs.merge_stock("A")
+                raise KeyError("body")
+
+    def test_outside_batch_runs_immediately(self, gs_with_driver):
+        gs, driver, session = gs_with_driver
+        with gs.write_batch():
+            pass
+        gs.merge_stock("A")
+        assert driver.execute_query.call_count == 1
+        session.execute_write.assert_not_called()
+
+    def test_no_driver_is_noop(self):
+        import src.data.graph_store as gs
+        with patch("src.data.graph_store._get_driver", return_value=None):
+            with gs.write_batch():
+                assert gs.merge_stock("A") is False
+
+
+class TestBackgroundWrites:
+    def test_off_mode_runs_inline(self, monkeypatch):
+        import src.data.graph_store as gs
+        monkeypatch.setenv("NEO4J_MODE", "off")
+        calls = []
+        assert gs.submit_background(calls.append, 1) is True
+        assert calls == [1]
+
+    def test_jobs_run_in_order_on_writer_thread(self, monkeypatch):
+        import threading
+        import src.data.graph_store as gs
+        monkeypatch.setenv("NEO4J_MODE", "full")
+        calls = []
+
+        def job(i):
+            calls.append((i, threading.current_thread().name))
+
+        for i in range(3):
+            assert gs.submit_background(job, i) is True
+        assert gs.flush_background(timeout=5) is True
+        assert calls == [(i, "graph-store-writer") for i in range(3)]
+
+    def test_failing_job_does_not_stop_worker(self, monkeypatch):
+        import src.data.graph_store as gs
+        monkeypatch.setenv("NEO4J_MODE", "full")
+        calls = []
+        gs.submit_background(lambda: 1 / 0)
+        gs.submit_background(calls.append, "after")
+        assert gs.flush_background(timeout=5) is True
+        assert calls == ["after"]
+
+    def test_full_queue_drops_job(self, monkeypatch, capsys):
+        import queue
+        from src.data.graph_store import _common
+        monkeypatch.setenv("NEO4J_MODE", "full")
+        full = queue.Queue(maxsize=1)
+        full.put(None)
+        monkeypatch.setattr(_common, "_background_queue", lambda: full)
+        assert _common.submit_background(print, "x") is False
+        assert "queue full" in capsys.readouterr().err
+
+    def test_exit_drain_waits_past_timeout(self, monkeypatch, capsys):
+        import threading
+        from src.data.graph_store import _common
+        monkeypatch.setenv("NEO4J_MODE", "full")
+        monkeypatch.setattr(_common, "_BACKGROUND_EXIT_TIMEOUT", 0.01)
+        release = threading.Event()
+        calls = []
+        _common.submit_background(release.wait, 5)
+        _common.submit_background(calls.append, "late")
+        threading.Timer(0.1, release.set).start()
+        _common._drain_background_at_exit()
+        assert calls == ["late"]
+        assert "pending Neo4j background writes" in capsys.readouterr().err
+
+
 # ===================================================================
 # merge_screen tests
 # ===================================================================
@@ -131,8 +387,11 @@ class TestMergeScreen:
         gs, _, session = gs_with_driver
         symbols = ["7203.T", "AAPL"]
         assert gs.merge_screen("2025-01-15", "value", "japan", 2, symbols) is True
-        # 1 MERGE screen + 2 SURFACED relationships
-        assert session.run.call_count == 3
+        # 1 MERGE screen + 1 UNWIND for both SURFACED relationships
+        assert session.run.call_count == 2
+        rel_call = session.run.call_args_list[1]
+        assert "UNWIND $symbols" in rel_call[0][0]
+        assert rel_call[1]["symbols"] == symbols
 
     def test_merge_screen_empty_symbols(self, gs_with_driver):
         """KIK-491: empty symbols should skip Screen node creation."""
@@ -154,7 +413,8 @@ class TestMergeReport:
     def test_merge_report_basic(self, gs_with_driver):
         gs, _, session = gs_with_driver
         assert gs.merge_report("2025-01-15", "7203.T", 72.5, "割安") is True
-        assert session.run.call_count == 2  # MERGE report + ANALYZED rel
+        assert session.run.call_count == 1  # MERGE report + ANALYZED rel
+        assert "ANALYZED" in session.run.call_args[0][0]
 
     def test_merge_report_no_driver(self):
         import src.data.graph_store as gs
@@ -170,15 +430,15 @@ class TestMergeTrade:
     def test_merge_trade_buy(self, gs_with_driver):
         gs, _, session = gs_with_driver
         assert gs.merge_trade("2025-01-15", "buy", "7203.T", 100, 2850, "JPY", "test") is True
-        assert session.run.call_count == 2
+        assert session.run.call_count == 1
         # Verify BOUGHT relationship type in the Cypher
-        cypher = session.run.call_args_list[1][0][0]
+        cypher = session.run.call_args_list[0][0][0]
         assert "BOUGHT" in cypher
 
     def test_merge_trade_sell(self, gs_with_driver):
         gs, _, session = gs_with_driver
         assert gs.merge_trade("2025-01-15", "sell", "AAPL", 5, 175.0, "USD") is True
-        cypher = session.run.call_args_list[1][0][0]
+        cypher = session.run.call_args_list[0][0][0]
         assert "SOLD" in cypher
 
     def test_merge_trade_no_driver(self):
@@ -197,7 +457,8 @@ class TestMergeHealth:
         summary = {"total": 5, "healthy": 3, "exit": 1}
         symbols = ["7203.T", "AAPL", "D05.SI"]
         assert gs.merge_health("2025-01-15", summary, symbols) is True
-        assert session.run.call_count == 4  # 1 MERGE + 3 CHECKED
+        assert session.run.call_count == 2  # 1 MERGE + 1 UNWIND for 3 CHECKED
+        assert session.run.call_args_list[1][1]["symbols"] == symbols
 
     def test_merge_health_empty_summary(self, gs_with_driver):
         gs, _, session = gs_with_driver
@@ -217,7 +478,8 @@ class TestMergeNote:
             "2025-01-15", "thesis", "Strong buy",
             symbol="7203.T", source="manual",
         ) is True
-        assert session.run.call_count == 2  # MERGE note + ABOUT rel
+        assert session.run.call_count == 1  # MERGE note + ABOUT rel
+        assert "Stock {symbol: $symbol}" in session.run.call_args[0][0]
 
     def test_merge_note_without_symbol(self, gs_with_driver):
         gs, _, session = gs_with_driver
@@ -226,6 +488,7 @@ class TestMergeNote:
             "2025-01-15", "observation", "Market is volatile",
         ) is True
         assert session.run.call_count == 1  # Only MERGE note, no ABOUT
+        assert "ABOUT" not in session.run.call_args[0][0]
 
     def test_merge_note_portfolio_category(self, gs_with_driver):
         """KIK-491: portfolio category note links to Portfolio node."""
@@ -235,8 +498,9 @@ class TestMergeNote:
             "2025-01-15", "review", "PF review",
             category="portfolio",
         ) is True
-        # 1 MERGE note + 1 ABOUT->Portfolio
-        assert session.run.call_count == 2
+        # MERGE note + ABOUT->Portfolio in one statement
+        assert session.run.call_count == 1
+        assert "Portfolio" in session.run.call_args[0][0]
 
     def test_merge_note_market_category(self, gs_with_driver):
         """KIK-491: market category note links to MarketContext node."""
@@ -246,8 +510,9 @@ class TestMergeNote:
             "2025-01-15", "observation", "Market memo",
             category="market",
         ) is True
-        # 1 MERGE note + 1 ABOUT->MarketContext (OPTIONAL MATCH)
-        assert session.run.call_count == 2
+        # MERGE note + ABOUT->MarketContext (OPTIONAL MATCH) in one statement
+        assert session.run.call_count == 1
+        assert "MarketContext" in session.run.call_args[0][0]
 
 
 # ===================================================================
@@ -256,9 +521,10 @@ class TestMergeNote:
 
 class TestTagTheme:
     def test_tag_theme_basic(self, gs_with_driver):
-        gs, _, session = gs_with_driver
+        gs, driver, _ = gs_with_driver
         assert gs.tag_theme("7203.T", "EV") is True
-        assert session.run.call_count == 1
+        assert driver.execute_query.call_count == 1
+        assert driver.execute_query.call_args[0][1] == {"theme": "EV", "symbol": "7203.T"}
 
     def test_tag_theme_no_driver(self):
         import src.data.graph_store as gs
@@ -299,6 +565,60 @@ class TestGetStockHistory:
         # KIK-573: 1 query instead of 7
         assert session.run.call_count == 1
 
+    def test_get_stock_history_include_flags(self, gs_with_driver):
+        gs, _, session = gs_with_driver
+        from unittest.mock import MagicMock
+        record = MagicMock()
+        record.__getitem__ = lambda s, k: {
+            "screens": [], "reports": [], "trades": [],
+            "health_checks": [], "notes": [], "themes": [],
+            "researches": [], "bookmarked": True, "held": False,
+        }[k]
+        session.run.return_value.single.return_value = record
+        result = gs.get_stock_history("7203.T", include_flags=True)
+        assert result["bookmarked"] is True
+        assert result["held"] is False
+        # Watchlist + HOLDS resolved in the same query
+        assert session.run.call_count == 1
+        assert "BOOKMARKED" in session.run.call_args[0][0]
+
+    def test_get_stock_history_include_flags_unknown_stock(self, gs_with_driver):
+        gs, _, session = gs_with_driver
+        session.run.return_value.single.return_value = None
+        result = gs.get_stock_history("ZZZZ", include_flags=True)
+        assert result["bookmarked"] is False
+        assert result["held"] is False
+        assert result["screens"] == []
+
+    def test_get_stock_history_collects_each_section_separately(self, gs_with_driver):
+        gs, _, session = gs_with_driver
+        session.run.return_value.single.return_value = None
+        gs.get_stock_history("7203.T")
+        query = session.run.call_args[0][0]
+        # Every OPTIONAL MATCH is aggregated before the next (no cross product)
+        assert query.count("OPTIONAL MATCH") == 7
+        assert query.count("WITH ") == 7
+        assert query.endswith(
+            "RETURN screens, reports, trades, health_checks, notes, themes, researches"
+        )
+
+    def test_get_stock_history_reuses_session(self, gs_with_driver):
+        gs, driver, _ = gs_with_driver
+        from unittest.mock import MagicMock
+        shared = MagicMock()
+        shared.run.return_value.single.return_value = None
+        result = gs.get_stock_history("ZZZZ", include_flags=True, session=shared)
+        assert result["held"] is False
+        shared.run.assert_called_once()
+        driver.session.assert_not_called()
+
+    def test_get_stock_history_uses_read_session(self, gs_with_driver):
+        gs, driver, session = gs_with_driver
+        session.run.return_value.single.return_value = None
+        gs.get_stock_history("7203.T")
+        # Read access lets a cluster route the query to a replica
+        driver.session.assert_called_once_with(default_access_mode="READ")
+
     def test_get_stock_history_error(self, gs_with_driver):
         gs, driver, _ = gs_with_driver
         driver.session.return_value.__enter__.return_value.run.side_effect = Exception("err")
@@ -427,10 +747,10 @@ class TestMergeWatchlist:
 
 class TestLinkResearchSupersedes:
     def test_link_supersedes_basic(self, gs_with_driver):
-        gs, _, session = gs_with_driver
+        gs, driver, _ = gs_with_driver
         assert gs.link_research_supersedes("stock", "7203.T") is True
-        assert session.run.call_count == 1
-        kwargs = session.run.call_args[1]
+        assert driver.execute_query.call_count == 1
+        kwargs = driver.execute_query.call_args[0][1]
         assert kwargs["rtype"] == "stock"
         assert kwargs["target"] == "7203.T"
 
@@ -441,7 +761,7 @@ class TestLinkResearchSupersedes:
 
     def test_link_supersedes_error(self, gs_with_driver):
         gs, driver, _ = gs_with_driver
-        driver.session.return_value.__enter__.return_value.run.side_effect = Exception("err")
+        driver.execute_query.side_effect = Exception("err")
         assert gs.link_research_supersedes("stock", "7203.T") is False
 
 
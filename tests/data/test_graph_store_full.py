@@ -162,15 +162,17 @@ class TestModeOffGuard:
 
 class TestMergeReportFull:
     def test_full_mode_sets_extended_props(self, gs_full):
-        gs, _, session = gs_full
+        gs, driver, session = gs_full
         result = gs.merge_report_full(
             "2025-01-01", "7203.T", 72.5, "割安",
             price=2850.0, per=8.5, pbr=0.9,
             dividend_yield=0.032, roe=12.5, market_cap=30000000000000,
         )
         assert result is True
-        # merge_report base call + SET extended props = at least 3 session.run calls
-        assert session.run.call_count >= 3
+        # merge_report base call, then SET extended props via execute_query
+        assert session.run.call_count >= 1
+        assert driver.execute_query.call_count == 1
+        assert driver.execute_query.call_args[0][1]["per"] == 8.5
 
     def test_summary_mode_falls_back(self, gs_summary):
         gs, _, session = gs_summary
@@ -179,8 +181,8 @@ class TestMergeReportFull:
             price=2850.0,
         )
         assert result is True
-        # Should only call base merge_report (2 runs: MERGE report + MERGE ANALYZED)
-        assert session.run.call_count == 2
+        # Should only call base merge_report (1 run: MERGE report + ANALYZED)
+        assert session.run.call_count == 1
 
     def test_off_mode_returns_false(self, gs_off):
         result = gs_off.merge_report_full("2025-01-01", "7203.T", 50, "test")
@@ -53,7 +53,7 @@ def gs_with_driver(mock_driver):
 
 class TestMergeThemeTrend:
     def test_merge_theme_trend_basic(self, gs_with_driver):
-        gs, _, session = gs_with_driver
+        gs, driver, session = gs_with_driver
         result = gs.merge_theme_trend(
             theme="ai",
             date="2026-04-16",
@@ -63,22 +63,22 @@ class TestMergeThemeTrend:
             region="japan",
         )
         assert result is True
-        assert session.run.call_count == 1
+        assert driver.execute_query.call_count == 1
         # Verify the Cypher contains MERGE ThemeTrend and Theme
-        cypher = session.run.call_args[0][0]
+        cypher = driver.execute_query.call_args[0][0]
         assert "ThemeTrend" in cypher
         assert "Theme" in cypher
         assert "FOR_THEME" in cypher
 
     def test_merge_theme_trend_id_format(self, gs_with_driver):
-        gs, _, session = gs_with_driver
+        gs, driver, session = gs_with_driver
         gs.merge_theme_trend(
             theme="ev",
             date="2026-04-16",
             rank=2,
             region="us",
         )
-        kwargs = session.run.call_args[1]
+        kwargs = driver.execute_query.call_args[0][1]
         assert kwargs["id"] == "theme_trend_2026-04-16_ev_us"
 
     def test_merge_theme_trend_no_driver(self):
@@ -87,19 +87,19 @@ class TestMergeThemeTrend:
             assert gs.merge_theme_trend(theme="ai", date="2026-04-16") is False
 
     def test_merge_theme_trend_mode_off(self, gs_with_driver):
-        gs, _, session = gs_with_driver
+        gs, driver, session = gs_with_driver
         with patch("src.data.graph_store._common._get_mode", return_value="off"):
             assert gs.merge_theme_trend(theme="ai", date="2026-04-16") is False
-        assert session.run.call_count == 0
+        assert driver.execute_query.call_count == 0
 
     def test_merge_theme_trend_error(self, gs_with_driver):
         gs, driver, _ = gs_with_driver
-        driver.session.return_value.__enter__.return_value.run.side_effect = Exception("DB error")
+        driver.execute_query.side_effect = Exception("DB error")
         assert gs.merge_theme_trend(theme="ai", date="2026-04-16") is False
 
     def test_merge_theme_trend_updates_on_redetection(self, gs_with_driver):
         """MERGE semantics: re-detecting same theme+date+region updates the node."""
-        gs, _, session = gs_with_driver
+        gs, driver, session = gs_with_driver
         # First call
         gs.merge_theme_trend(
             theme="ai", date="2026-04-16", confidence=0.8, rank=1, region="japan"
@@ -108,18 +108,18 @@ class TestMergeThemeTrend:
         gs.merge_theme_trend(
             theme="ai", date="2026-04-16", confidence=0.95, rank=1, region="japan"
         )
-        assert session.run.call_count == 2
+        assert driver.execute_query.call_count == 2
         # Both use same id (MERGE ensures upsert)
-        first_kwargs = session.run.call_args_list[0][1]
-        second_kwargs = session.run.call_args_list[1][1]
+        first_kwargs = driver.execute_query.call_args_list[0][0][1]
+        second_kwargs = driver.execute_query.call_args_list[1][0][1]
         assert first_kwargs["id"] == second_kwargs["id"]
         assert second_kwargs["confidence"] == 0.95
 
     def test_merge_theme_trend_defaults(self, gs_with_driver):
         """Default values for optional parameters."""
-        gs, _, session = gs_with_driver
+        gs, driver, session = gs_with_driver
         gs.merge_theme_trend(theme="biotech", date="2026-04-16")
-        kwargs = session.run.call_args[1]
+        kwargs = driver.execute_query.call_args[0][1]
         assert kwargs["confidence"] == 0.0
         assert kwargs["reason"] == ""
         assert kwargs["rank"] == 0
@@ -111,6 +111,36 @@ class TestVectorSearchSingleSession:
         with patch("src.data.graph_store._get_driver", return_value=None):
             assert vector_search([0.1] * 384) == []
 
+    def test_all_indexes_in_one_statement(self, gs_with_driver):
+        gs, driver, session = gs_with_driver
+        session.run.return_value = iter([
+            {"label": "Report", "summary": "s", "date": "2026-03-01",
+             "id": "r1", "symbol": "7203.T", "score": 0.9},
+        ])
+
+        from src.data.graph_query.portfolio import vector_search
+        result = vector_search([0.1] * 384, top_k=3, node_labels=["Screen", "Report"])
+        assert session.run.call_count == 1
+        query = session.run.call_args.args[0]
+        assert "screen_embedding" in query and "report_embedding" in query
+        assert result == [{"label": "Report", "summary": "s", "date": "2026-03-01",
+                           "id": "r1", "symbol": "7203.T", "score": 0.9}]
+
+    def test_falls_back_per_index(self, gs_with_driver):
+        gs, driver, session = gs_with_driver
+        row = {"summary": "s", "date": "2026-03-01", "id": "n1",
+               "symbol": None, "score": 0.5}
+        session.run.side_effect = [
+            Exception("no such index"),      # combined statement
+            Exception("no such index"),      # screen_embedding
+            iter([row]),                     # note_embedding
+        ]
+
+        from src.data.graph_query.portfolio import vector_search
+        result = vector_search([0.1] * 384, node_labels=["Screen", "Note"])
+        assert session.run.call_count == 3
+        assert [r["label"] for r in result] == ["Note"]
+
 
 # ===================================================================
 # P3/P6: Cleanup script
@@ -641,6 +641,46 @@ class TestGraphDualWrite:
         with patch.dict("sys.modules", {}):
             save_screening("value", "japan", [{"symbol": "7203.T", "name": "Toyota", "sector": "Auto"}], base_dir=str(tmp_path))
 
+    def test_screening_graph_writes_share_one_transaction(self, tmp_path, monkeypatch):
+        from unittest.mock import MagicMock
+        driver = MagicMock()
+        session = driver.session.return_value.__enter__.return_value
+        monkeypatch.setenv("NEO4J_MODE", "full")
+        monkeypatch.setattr("src.data.graph_store._get_driver", lambda: driver)
+        results = [{"symbol": f"S{i}", "name": "", "sector": ""} for i in range(5)]
+        save_screening("value", "japan", results, theme="ai", base_dir=str(tmp_path))
+        session.execute_write.assert_called_once()
+        statements = session.execute_write.call_args[0][1]
+        queries = [q for q, _ in statements]
+        assert sum(q.startswith("MERGE (s:Stock") for q in queries) == 5
+        assert sum(q.startswith("MERGE (t:Theme") for q in queries) == 5
+        assert any(q.startswith("MERGE (sc:Screen") for q in queries)
+        session.run.assert_not_called()
+        driver.execute_query.assert_not_called()
+
+    def test_screening_bad_statement_keeps_other_graph_writes(self, tmp_path, monkeypatch):
+        from unittest.mock import MagicMock
+        driver = MagicMock()
+        session = driver.session.return_value.__enter__.return_value
+        monkeypatch.setenv("NEO4J_MODE", "full")
+        monkeypatch.setattr("src.data.graph_store._get_driver", lambda: driver)
+        bad = Exception("constraint")
+        bad.code = "Neo.ClientError.Schema.ConstraintValidationFailed"
+        committed = []
+
+        def execute_write(fn, statements):
+            if len(statements) > 1 or statements[0][0].startswith("MERGE (t:Theme"):
+                raise bad
+            committed.extend(q for q, _ in statements)
+
+        session.execute_write.side_effect = execute_write
+        results = [{"symbol": f"S{i}", "name": "", "sector": ""} for i in range(3)]
+        path = save_screening("value", "japan", results, theme="ai", base_dir=str(tmp_path))
+        assert Path(path).exists()
+        assert sum(q.startswith("MERGE (s:Stock") for q in committed) == 3
+        assert any(q.startswith("MERGE (sc:Screen") for q in committed)
+        assert not any(q.startswith("MERGE (t:Theme") for q in committed)
+
     def test_screening_graph_failure_still_saves(self, tmp_path):
         with patch("src.data.graph_store.merge_stock", side_effect=Exception("Neo4j down")):
             path = save_screening("value", "japan", [{"symbol": "7203.T"}], base_dir=str(tmp_path))
@@ -19,6 +19,9 @@ from scripts.init_graph import (
     import_notes,
     import_portfolio,
     import_watchlists,
+    import_history,
+    _iter_json,
+    _load_json,
 )
 
 
@@ -32,13 +35,18 @@ def _write_json(path: Path, data):
         json.dump(data, f, ensure_ascii=False, indent=2)
 
 
+def _stock_rows(mock_bulk) -> list[dict]:
+    """Flatten all rows passed to a mocked bulk_merge_stocks."""
+    return [row for c in mock_bulk.call_args_list for row in c[0][0]]
+
+
 # ===================================================================
 # import_screens tests
 # ===================================================================
 
 class TestImportScreens:
     @patch("scripts.init_graph.merge_screen")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.bulk_merge_stocks")
     def test_import_screens_basic(self, mock_stock, mock_screen, tmp_path):
         d = tmp_path / "screen"
         _write_json(d / "2025-01-15_japan_value.json", {
@@ -52,17 +60,40 @@ class TestImportScreens:
         })
         count = import_screens(str(tmp_path))
         assert count == 1
-        assert mock_stock.call_count == 2
+        mock_stock.assert_called_once()
+        assert _stock_rows(mock_stock) == [
+            {"symbol": "7203.T", "name": "Toyota", "sector": "Automotive"},
+            {"symbol": "9984.T", "name": "SoftBank", "sector": "Tech"},
+        ]
         mock_screen.assert_called_once()
 
     @patch("scripts.init_graph.merge_screen")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.bulk_merge_stocks")
+    def test_import_screens_dedupes_stocks(self, mock_stock, mock_screen, tmp_path):
+        d = tmp_path / "screen"
+        _write_json(d / "2025-01-15_japan_value.json", {
+            "date": "2025-01-15", "preset": "value", "region": "japan",
+            "results": [{"symbol": "7203.T", "name": "Toyota", "sector": ""}],
+        })
+        _write_json(d / "2025-01-16_japan_value.json", {
+            "date": "2025-01-16", "preset": "value", "region": "japan",
+            "results": [{"symbol": "7203.T", "name": "", "sector": "Automotive"}],
+        })
+        count = import_screens(str(tmp_path))
+        assert count == 2
+        assert mock_screen.call_count == 2
+        assert _stock_rows(mock_stock) == [
+            {"symbol": "7203.T", "name": "Toyota", "sector": "Automotive"},
+        ]
+
+    @patch("scripts.init_graph.merge_screen")
+    @patch("scripts.init_graph.bulk_merge_stocks")
     def test_import_screens_empty_dir(self, mock_stock, mock_screen, tmp_path):
         count = import_screens(str(tmp_path))
         assert count == 0
 
     @patch("scripts.init_graph.merge_screen")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.bulk_merge_stocks")
     def test_import_screens_corrupted_file(self, mock_stock, mock_screen, tmp_path):
         d = tmp_path / "screen"
         d.mkdir(parents=True)
@@ -77,7 +108,7 @@ class TestImportScreens:
 
 class TestImportReports:
     @patch("scripts.init_graph.merge_report_full")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.bulk_merge_stocks")
     def test_import_reports_basic(self, mock_stock, mock_report, tmp_path):
         d = tmp_path / "report"
         _write_json(d / "2025-01-15_7203_T.json", {
@@ -90,11 +121,13 @@ class TestImportReports:
         })
         count = import_reports(str(tmp_path))
         assert count == 1
-        mock_stock.assert_called_once_with(symbol="7203.T", name="Toyota", sector="Automotive")
+        assert _stock_rows(mock_stock) == [
+            {"symbol": "7203.T", "name": "Toyota", "sector": "Automotive"},
+        ]
         mock_report.assert_called_once()
 
     @patch("scripts.init_graph.merge_report_full")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.bulk_merge_stocks")
     def test_import_reports_no_symbol(self, mock_stock, mock_report, tmp_path):
         d = tmp_path / "report"
         _write_json(d / "2025-01-15_empty.json", {"date": "2025-01-15"})
@@ -108,7 +141,7 @@ class TestImportReports:
 
 class TestImportTrades:
     @patch("scripts.init_graph.merge_trade")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.bulk_merge_stocks")
     def test_import_trades_basic(self, mock_stock, mock_trade, tmp_path):
         d = tmp_path / "trade"
         _write_json(d / "2025-01-15_buy_7203_T.json", {
@@ -122,7 +155,7 @@ class TestImportTrades:
         })
         count = import_trades(str(tmp_path))
         assert count == 1
-        mock_stock.assert_called_once_with(symbol="7203.T")
+        assert _stock_rows(mock_stock) == [{"symbol": "7203.T"}]
         # KIK-420: Now includes semantic_summary and embedding kwargs
         mock_trade.assert_called_once()
         call_kwargs = mock_trade.call_args[1]
@@ -137,7 +170,7 @@ class TestImportTrades:
         assert "embedding" in call_kwargs
 
     @patch("scripts.init_graph.merge_trade")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.bulk_merge_stocks")
     def test_import_trades_no_symbol(self, mock_stock, mock_trade, tmp_path):
         d = tmp_path / "trade"
         _write_json(d / "2025-01-15_buy_empty.json", {"date": "2025-01-15"})
@@ -183,6 +216,17 @@ class TestImportHealth:
         count = import_health(str(tmp_path))
         assert count == 1
 
+    @patch("scripts.init_graph.merge_health")
+    def test_import_health_dedupes_symbols_in_order(self, mock_health, tmp_path):
+        d = tmp_path / "health"
+        _write_json(d / "2025-01-15_health.json", {
+            "date": "2025-01-15",
+            "summary": {},
+            "positions": [{"symbol": "AAPL"}, {"symbol": ""}, {"symbol": "7203.T"}, {"symbol": "AAPL"}],
+        })
+        import_health(str(tmp_path))
+        assert mock_health.call_args[0][2] == ["AAPL", "7203.T"]
+
 
 # ===================================================================
 # import_notes tests
@@ -225,6 +269,17 @@ class TestImportNotes:
         count = import_notes(str(tmp_path))
         assert count == 1
 
+    @patch("scripts.init_graph.merge_note")
+    def test_import_notes_jsonl(self, mock_note, tmp_path):
+        (tmp_path / "2025-01-16.jsonl").write_text(
+            json.dumps({"id": "note_a", "date": "2025-01-16", "type": "thesis"}) + "\n"
+            + json.dumps({"id": "note_b", "date": "2025-01-16", "type": "review"}) + "\n",
+            encoding="utf-8",
+        )
+        count = import_notes(str(tmp_path))
+        assert count == 2
+        assert {c.kwargs["note_id"] for c in mock_note.call_args_list} == {"note_a", "note_b"}
+
     @patch("scripts.init_graph.merge_note")
     def test_import_notes_no_id_skipped(self, mock_note, tmp_path):
         _write_json(tmp_path / "bad_note.json", [
@@ -251,7 +306,7 @@ class TestImportNotes:
 class TestImportResearch:
     @patch("scripts.init_graph.link_research_supersedes")
     @patch("scripts.init_graph.merge_research_full")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.bulk_merge_stocks")
     def test_import_research_stock(self, mock_stock, mock_research, mock_link, tmp_path):
         d = tmp_path / "research"
         _write_json(d / "2025-01-15_stock_7203_T.json", {
@@ -263,7 +318,7 @@ class TestImportResearch:
         })
         count = import_research(str(tmp_path))
         assert count == 1
-        mock_stock.assert_called_once_with(symbol="7203.T", name="Toyota")
+        assert _stock_rows(mock_stock) == [{"symbol": "7203.T", "name": "Toyota"}]
         # KIK-420: Now includes semantic_summary and embedding kwargs
         mock_research.assert_called_once()
         call_kwargs = mock_research.call_args[1]
@@ -278,7 +333,7 @@ class TestImportResearch:
 
     @patch("scripts.init_graph.link_research_supersedes")
     @patch("scripts.init_graph.merge_research_full")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.bulk_merge_stocks")
     def test_import_research_industry(self, mock_stock, mock_research, mock_link, tmp_path):
         d = tmp_path / "research"
         _write_json(d / "2025-01-15_industry_semiconductor.json", {
@@ -289,13 +344,13 @@ class TestImportResearch:
         })
         count = import_research(str(tmp_path))
         assert count == 1
-        mock_stock.assert_not_called()  # industry type: no Stock merge
+        assert _stock_rows(mock_stock) == []  # industry type: no Stock merge
         mock_research.assert_called_once()
         mock_link.assert_called_once_with("industry", "半導体")
 
     @patch("scripts.init_graph.link_research_supersedes")
     @patch("scripts.init_graph.merge_research_full")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.bulk_merge_stocks")
     def test_import_research_market(self, mock_stock, mock_research, mock_link, tmp_path):
         d = tmp_path / "research"
         _write_json(d / "2025-01-15_market_nikkei.json", {
@@ -306,11 +361,11 @@ class TestImportResearch:
         })
         count = import_research(str(tmp_path))
         assert count == 1
-        mock_stock.assert_not_called()  # market type: no Stock merge
+        assert _stock_rows(mock_stock) == []  # market type: no Stock merge
 
     @patch("scripts.init_graph.link_research_supersedes")
     @patch("scripts.init_graph.merge_research_full")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.bulk_merge_stocks")
     def test_import_research_business(self, mock_stock, mock_research, mock_link, tmp_path):
         d = tmp_path / "research"
         _write_json(d / "2025-01-15_business_7751_T.json", {
@@ -321,12 +376,12 @@ class TestImportResearch:
         })
         count = import_research(str(tmp_path))
         assert count == 1
-        mock_stock.assert_called_once_with(symbol="7751.T", name="")
+        assert _stock_rows(mock_stock) == [{"symbol": "7751.T"}]
         mock_research.assert_called_once()
 
     @patch("scripts.init_graph.link_research_supersedes")
     @patch("scripts.init_graph.merge_research_full")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.bulk_merge_stocks")
     def test_import_research_no_target_skipped(self, mock_stock, mock_research, mock_link, tmp_path):
         d = tmp_path / "research"
         _write_json(d / "2025-01-15_bad.json", {
@@ -339,7 +394,7 @@ class TestImportResearch:
 
     @patch("scripts.init_graph.link_research_supersedes")
     @patch("scripts.init_graph.merge_research_full")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.bulk_merge_stocks")
     def test_import_research_supersedes_chains(self, mock_stock, mock_research, mock_link, tmp_path):
         """Multiple research files for same target should create one SUPERSEDES chain."""
         d = tmp_path / "research"
@@ -363,14 +418,14 @@ class TestImportResearch:
 
     @patch("scripts.init_graph.link_research_supersedes")
     @patch("scripts.init_graph.merge_research_full")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.bulk_merge_stocks")
     def test_import_research_empty_dir(self, mock_stock, mock_research, mock_link, tmp_path):
         count = import_research(str(tmp_path))
         assert count == 0
 
     @patch("scripts.init_graph.link_research_supersedes")
     @patch("scripts.init_graph.merge_research_full")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.bulk_merge_stocks")
     def test_import_research_corrupted_file(self, mock_stock, mock_research, mock_link, tmp_path):
         d = tmp_path / "research"
         d.mkdir(parents=True)
@@ -396,7 +451,7 @@ def _write_csv(path: Path, rows: list[dict]):
 
 
 class TestImportPortfolio:
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.bulk_merge_stocks")
     def test_import_portfolio_basic(self, mock_stock, tmp_path):
         csv_path = tmp_path / "portfolio.csv"
         _write_csv(csv_path, [
@@ -405,11 +460,12 @@ class TestImportPortfolio:
         ])
         count = import_portfolio(str(csv_path))
         assert count == 2
-        assert mock_stock.call_count == 2
-        mock_stock.assert_any_call(symbol="7203.T", name="Toyota")
-        mock_stock.assert_any_call(symbol="AAPL", name="Apple")
+        assert _stock_rows(mock_stock) == [
+            {"symbol": "7203.T", "name": "Toyota"},
+            {"symbol": "AAPL", "name": "Apple"},
+        ]
 
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.bulk_merge_stocks")
     def test_import_portfolio_skip_cash(self, mock_stock, tmp_path):
         csv_path = tmp_path / "portfolio.csv"
         _write_csv(csv_path, [
@@ -418,15 +474,15 @@ class TestImportPortfolio:
         ])
         count = import_portfolio(str(csv_path))
         assert count == 1
-        mock_stock.assert_called_once_with(symbol="7203.T", name="Toyota")
+        assert _stock_rows(mock_stock) == [{"symbol": "7203.T", "name": "Toyota"}]
 
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.bulk_merge_stocks")
     def test_import_portfolio_nonexistent(self, mock_stock, tmp_path):
         count = import_portfolio(str(tmp_path / "missing.csv"))
         assert count == 0
         mock_stock.assert_not_called()
 
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.bulk_merge_stocks")
     def test_import_portfolio_empty_symbol(self, mock_stock, tmp_path):
         csv_path = tmp_path / "portfolio.csv"
         _write_csv(csv_path, [
@@ -443,12 +499,12 @@ class TestImportPortfolio:
 class TestImportWatchlists:
     @patch("scripts.init_graph._get_embedding", return_value=None)
     @patch("scripts.init_graph.merge_watchlist")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.bulk_merge_stocks")
     def test_import_watchlists_basic(self, mock_stock, mock_wl, mock_emb, tmp_path):
         _write_json(tmp_path / "favorites.json", ["7203.T", "AAPL", "D05.SI"])
         count = import_watchlists(str(tmp_path))
         assert count == 1
-        assert mock_stock.call_count == 3
+        assert len(_stock_rows(mock_stock)) == 3
         mock_wl.assert_called_once_with(
             "favorites", ["7203.T", "AAPL", "D05.SI"],
             semantic_summary="favorites watchlist: 7203.T, AAPL, D05.SI",
@@ -456,7 +512,7 @@ class TestImportWatchlists:
         )
 
     @patch("scripts.init_graph.merge_watchlist")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.bulk_merge_stocks")
     def test_import_watchlists_multiple_files(self, mock_stock, mock_wl, tmp_path):
         _write_json(tmp_path / "japan.json", ["7203.T", "9984.T"])
         _write_json(tmp_path / "us.json", ["AAPL", "MSFT"])
@@ -465,7 +521,7 @@ class TestImportWatchlists:
         assert mock_wl.call_count == 2
 
     @patch("scripts.init_graph.merge_watchlist")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.bulk_merge_stocks")
     def test_import_watchlists_empty_list(self, mock_stock, mock_wl, tmp_path):
         _write_json(tmp_path / "empty.json", [])
         count = import_watchlists(str(tmp_path))
@@ -473,20 +529,20 @@ class TestImportWatchlists:
         mock_wl.assert_not_called()
 
     @patch("scripts.init_graph.merge_watchlist")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.bulk_merge_stocks")
     def test_import_watchlists_not_a_list(self, mock_stock, mock_wl, tmp_path):
         _write_json(tmp_path / "bad.json", {"key": "value"})
         count = import_watchlists(str(tmp_path))
         assert count == 0
 
     @patch("scripts.init_graph.merge_watchlist")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.bulk_merge_stocks")
     def test_import_watchlists_nonexistent_dir(self, mock_stock, mock_wl, tmp_path):
         count = import_watchlists(str(tmp_path / "missing"))
         assert count == 0
 
     @patch("scripts.init_graph.merge_watchlist")
-    @patch("scripts.init_graph.merge_stock")
+    @patch("scripts.init_graph.bulk_merge_stocks")
     def test_import_watchlists_corrupted_file(self, mock_stock, mock_wl, tmp_path):
         tmp_path.mkdir(exist_ok=True)
         (tmp_path / "bad.json").write_text("not json")
@@ -546,3 +602,131 @@ class TestImportMarketContext:
         (d / "bad.json").write_text("not json")
         count = import_market_context(str(tmp_path))
         assert count == 0
+
+
+# ===================================================================
+# import_history tests
+# ===================================================================
+
+class TestImportHistory:
+    @patch("scripts.init_graph.merge_health")
+    @patch("scripts.init_graph.merge_trade")
+    @patch("scripts.init_graph.merge_screen")
+    @patch("scripts.init_graph.bulk_merge_stocks")
+    def test_runs_all_importers(self, mock_stock, mock_screen, mock_trade,
+                                mock_health, tmp_path):
+        mock_stock.side_effect = len
+        _write_json(tmp_path / "screen" / "2025-01-15_japan_value.json", {
+            "date": "2025-01-15", "preset": "value", "region": "japan",
+            "results": [{"symbol": "7203.T"}],
+        })
+        _write_json(tmp_path / "trade" / "2025-01-15_buy_7203_T.json", {
+            "date": "2025-01-15", "symbol": "7203.T", "trade_type": "buy",
+        })
+        _write_json(tmp_path / "health" / "2025-01-15_health.json", {
+            "date": "2025-01-15", "summary": {}, "positions": [],
+        })
+        counts = import_history(str(tmp_path), max_workers=4)
+        assert list(counts) == [
+            "Screens", "Reports", "Trades", "Health", "Research",
+            "MarketContext", "StressTests", "Forecasts",
+        ]
+        assert counts["Screens"] == 1
+        assert counts["Trades"] == 1
+        assert counts["Health"] == 1
+        assert counts["Reports"] == 0
+
+    @patch("scripts.init_graph.import_reports", side_effect=RuntimeError("boom"))
+    def test_failed_importer_counts_zero(self, mock_reports, tmp_path, capsys):
+        counts = import_history(str(tmp_path))
+        assert counts["Reports"] == 0
+        assert "Reports import failed: boom" in capsys.readouterr().out
+
+    def test_lost_writes_keep_count_and_report(self, capsys):
+        import contextlib
+        from types import SimpleNamespace
+        from scripts.init_graph import _run_batched
+
+        @contextlib.contextmanager
+        def fake_batch():
+            batch = SimpleNamespace(failed=1, total=1000)
+            yield batch
+            raise RuntimeError("1 of 1000 batched graph writes failed")
+
+        with patch("scripts.init_graph.write_batch", fake_batch):
+            assert _run_batched("Notes", lambda path: 42, "notes") == 42
+        assert "Notes: 1/1000 graph writes failed" in capsys.readouterr().out
+
+    @patch("scripts.init_graph.merge_forecast")
+    @patch("scripts.init_graph.merge_health")
+    @patch("scripts.init_graph.merge_trade")
+    @patch("scripts.init_graph.merge_screen")
+    @patch("scripts.init_graph.bulk_merge_stocks", side_effect=len)
+    def test_stocks_merged_once_before_importers(self, mock_stock, mock_screen,
+                                                  mock_trade, mock_health,
+                                                  mock_forecast, tmp_path):
+        _write_json(tmp_path / "screen" / "s.json", {
+            "date": "2025-01-15",
+            "results": [{"symbol": "7203.T", "name": "Toyota", "sector": "Auto"}],
+        })
+        _write_json(tmp_path / "trade" / "t.json", {"date": "2025-01-15", "symbol": "AAPL"})
+        _write_json(tmp_path / "health" / "h.json", {
+            "date": "2025-01-15", "positions": [{"symbol": "7203.T"}, {"symbol": "D05.SI"}],
+        })
+        _write_json(tmp_path / "forecast" / "f.json", {
+            "date": "2025-01-15", "positions": [{"symbol": "MSFT"}],
+        })
+        import_history(str(tmp_path), max_workers=4)
+        mock_stock.assert_called_once()
+        rows = {r["symbol"]: r for r in _stock_rows(mock_stock)}
+        assert sorted(rows) == ["7203.T", "AAPL", "D05.SI", "MSFT"]
+        assert rows["7203.T"]["name"] == "Toyota"
+
+    @patch("scripts.init_graph.merge_trade")
+    @patch("scripts.init_graph.bulk_merge_stocks", return_value=0)
+    def test_incomplete_stock_prepass_falls_back_to_serial(self, mock_stock, mock_trade,
+                                                           tmp_path, capsys):
+        _write_json(tmp_path / "trade" / "t.json", {"date": "2025-01-15", "symbol": "AAPL"})
+        counts = import_history(str(tmp_path), max_workers=4)
+        assert counts["Trades"] == 1
+        assert "importing history serially" in capsys.readouterr().out
+        # The pre-pass plus the trade importer's own Stock flush
+        assert mock_stock.call_count == 2
+
+
+# ===================================================================
+# _load_json tests
+# ===================================================================
+
+class TestLoadJson:
+    def test_parses_utf8(self, tmp_path):
+        fp = tmp_path / "a.json"
+        _write_json(fp, {"target": "半導体"})
+        assert _load_json(fp) == {"target": "半導体"}
+
+    def test_stdlib_fallback(self, tmp_path):
+        fp = tmp_path / "a.json"
+        _write_json(fp, ["7203.T"])
+        with patch("scripts.init_graph._HAS_ORJSON", False):
+            assert _load_json(fp) == ["7203.T"]
+
+    def test_invalid_raises_json_decode_error(self, tmp_path):
+        fp = tmp_path / "bad.json"
+        fp.write_text("not json")
+        with pytest.raises(json.JSONDecodeError):
+            _load_json(fp)
+
+
+class TestIterJson:
+    def test_sorted_and_filtered(self, tmp_path):
+        _write_json(tmp_path / "b.json", {"n": 2})
+        _write_json(tmp_path / "a.json", {"n": 1})
+        (tmp_path / "notes.txt").write_text("ignored")
+        (tmp_path / "bad.json").write_text("not json")
+        (tmp_path / "sub.json").mkdir()
+        items = list(_iter_json(tmp_path))
+        assert [p.name for p, _ in items] == ["a.json", "b.json"]
+        assert [d["n"] for _, d in items] == [1, 2]
+
+    def test_missing_dir(self, tmp_path):
+        assert list(_iter_json(tmp_path / "missing")) == []
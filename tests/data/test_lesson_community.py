@@ -120,6 +120,7 @@ class TestGetLessonsByTheme:
 
 class TestSaveNoteIntegration:
     def test_lesson_gets_community(self, tmp_path):
+        from src.data.graph_store import flush_background
         from src.data.note_manager import save_note
 
         with patch("src.data.lesson_community.merge_lesson_community", return_value=True) as mock_merge:
@@ -130,6 +131,8 @@ class TestSaveNoteIntegration:
                 expected_action="-15%で撤退",
                 base_dir=str(tmp_path),
             )
+            # Graph writes may run on the background writer
+            assert flush_background(timeout=5) is True
 
         assert note.get("_lesson_community") == "売買ルール"
         mock_merge.assert_called_once()
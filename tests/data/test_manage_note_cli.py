@@ -69,6 +69,23 @@ class TestManageNoteCLIArgs:
         result = _run(["list"])
         assert result.returncode == 0
 
+    def test_list_does_not_import_scripts_common(self):
+        """list は graph 依存の重い scripts.common を読み込まないこと."""
+        import os
+        code = (
+            "import runpy, sys; sys.argv = [%r, 'list']; "
+            "runpy.run_path(%r, run_name='__main__'); "
+            "assert 'scripts.common' not in sys.modules" % (SCRIPT, SCRIPT)
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env=os.environ.copy(),
+            timeout=30,
+        )
+        assert result.returncode == 0, result.stderr
+
 
 # ===================================================================
 # Function tests (direct import with mocks)
@@ -104,7 +121,7 @@ class TestManageNoteFunctions:
         """cmd_list がメモなしの場合に適切なメッセージを表示すること."""
         mod = _load_module()
 
-        with patch.object(mod, "load_notes", return_value=[]):
+        with patch.object(mod, "iter_notes", return_value=[]):
             args = types.SimpleNamespace(symbol=None, type=None, category=None)
             mod.cmd_list(args)
 
@@ -119,7 +136,7 @@ class TestManageNoteFunctions:
             {"date": "2026-02-17", "symbol": "7203.T", "type": "thesis", "content": "EV growth potential"},
             {"date": "2026-02-16", "symbol": "AAPL", "type": "concern", "content": "Valuation stretched"},
         ]
-        with patch.object(mod, "load_notes", return_value=mock_notes):
+        with patch.object(mod, "iter_notes", return_value=mock_notes):
             args = types.SimpleNamespace(symbol=None, type=None, category=None)
             mod.cmd_list(args)
 
@@ -158,7 +175,7 @@ class TestManageNoteFunctions:
         mock_notes = [
             {"date": "2026-02-17", "symbol": "7203.T", "type": "thesis", "content": "EV growth"},
         ]
-        with patch.object(mod, "load_notes", return_value=mock_notes):
+        with patch.object(mod, "iter_notes", return_value=mock_notes):
             args = types.SimpleNamespace(symbol="7203.T", type=None, category=None)
             mod.cmd_list(args)
 
@@ -174,13 +191,29 @@ class TestManageNoteFunctions:
             {"date": "2026-02-17", "symbol": "7203.T", "type": "thesis",
              "content": "A" * 80},
         ]
-        with patch.object(mod, "load_notes", return_value=mock_notes):
+        with patch.object(mod, "iter_notes", return_value=mock_notes):
             args = types.SimpleNamespace(symbol=None, type=None, category=None)
             mod.cmd_list(args)
 
         captured = capsys.readouterr()
         assert "..." in captured.out
 
+    def test_cmd_list_escapes_table_cells(self, capsys):
+        """cmd_list がパイプと改行をエスケープして1行に収めること."""
+        mod = _load_module()
+
+        mock_notes = [
+            {"date": "2026-02-17", "symbol": "7203.T", "type": "thesis",
+             "content": "a|b\nc"},
+        ]
+        with patch.object(mod, "iter_notes", return_value=mock_notes):
+            args = types.SimpleNamespace(symbol=None, type=None, category=None)
+            mod.cmd_list(args)
+
+        captured = capsys.readouterr()
+        assert "| a\\|b c |" in captured.out
+        assert captured.out.endswith("合計 1 件\n")
+
     # KIK-429: category support tests
 
     def test_cmd_save_with_category(self, capsys):
@@ -229,7 +262,7 @@ class TestManageNoteFunctions:
         mock_notes = [
             {"date": "2026-02-19", "symbol": "", "type": "review", "content": "PF check", "category": "portfolio"},
         ]
-        with patch.object(mod, "load_notes", return_value=mock_notes) as mock_load:
+        with patch.object(mod, "iter_notes", return_value=mock_notes) as mock_load:
             args = types.SimpleNamespace(symbol=None, type=None, category="portfolio")
             mod.cmd_list(args)
 
@@ -243,7 +276,7 @@ class TestManageNoteFunctions:
         """category フィルタでメモなしのメッセージが適切であること."""
         mod = _load_module()
 
-        with patch.object(mod, "load_notes", return_value=[]):
+        with patch.object(mod, "iter_notes", return_value=[]):
             args = types.SimpleNamespace(symbol=None, type=None, category="market")
             mod.cmd_list(args)
 
@@ -324,7 +357,7 @@ class TestManageNoteJournal:
                 "detected_symbols": ["NVDA"],
             },
         ]
-        with patch.object(mod, "load_notes", return_value=mock_notes):
+        with patch.object(mod, "iter_notes", return_value=mock_notes):
             args = types.SimpleNamespace(symbol=None, type=None, category=None)
             mod.cmd_list(args)
 
@@ -167,3 +167,12 @@ class TestClearMemoryCache:
         clear_memory_cache()
         assert price_history_cache.get("test") is None
         assert stock_detail_cache.get("test") is None
+
+    def test_singletons_hold_multiple_screen_universes(self):
+        """Singleton capacity covers several ~250-symbol screens without eviction."""
+        from src.data.yahoo_client._memory_cache import (
+            price_history_cache,
+            stock_detail_cache,
+        )
+        assert stock_detail_cache.stats()["maxsize"] >= 1000
+        assert price_history_cache.stats()["maxsize"] >= 1000
@@ -12,12 +12,18 @@ import pytest
 from src.data.note_manager import (
     save_note,
     load_notes,
+    iter_notes,
     delete_note,
     _VALID_TYPES,
     _VALID_CATEGORIES,
 )
 
 
+def _read_jsonl(path: Path) -> list[dict]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
 # ===================================================================
 # save_note tests
 # ===================================================================
@@ -32,12 +38,10 @@ class TestSaveNote:
         assert note["id"].startswith("note_")
         assert "7203.T" in note["id"]
 
-        # Verify JSON file was created
-        files = list(tmp_path.glob("*.json"))
-        assert len(files) == 1
-        with open(files[0], encoding="utf-8") as f:
-            data = json.load(f)
-        assert isinstance(data, list)
+        # Verify the day's JSONL file was created
+        files = list(tmp_path.glob("*.jsonl"))
+        assert [f.name for f in files] == [f"{note['date']}.jsonl"]
+        data = _read_jsonl(files[0])
         assert len(data) == 1
         assert data[0]["content"] == "Strong buy candidate"
 
@@ -45,20 +49,21 @@ class TestSaveNote:
         save_note("7203.T", "thesis", "First note", base_dir=str(tmp_path))
         save_note("7203.T", "thesis", "Second note", base_dir=str(tmp_path))
 
-        files = list(tmp_path.glob("*.json"))
+        files = list(tmp_path.glob("*.jsonl"))
         assert len(files) == 1  # Same file, appended
-        with open(files[0], encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_jsonl(files[0])
         assert len(data) == 2
         assert data[0]["content"] == "First note"
         assert data[1]["content"] == "Second note"
 
-    def test_save_note_different_types_separate_files(self, tmp_path):
+    def test_save_note_same_day_shares_file(self, tmp_path):
         save_note("7203.T", "thesis", "Thesis", base_dir=str(tmp_path))
-        save_note("7203.T", "concern", "Concern", base_dir=str(tmp_path))
+        save_note("AAPL", "concern", "Concern", base_dir=str(tmp_path))
+        save_note(note_type="review", content="PF", category="portfolio", base_dir=str(tmp_path))
 
-        files = list(tmp_path.glob("*.json"))
-        assert len(files) == 2
+        files = list(tmp_path.glob("*.jsonl"))
+        assert len(files) == 1
+        assert [n["type"] for n in _read_jsonl(files[0])] == ["thesis", "concern", "review"]
 
     def test_save_note_invalid_type(self, tmp_path):
         with pytest.raises(ValueError, match="Invalid note type"):
@@ -83,20 +88,39 @@ class TestSaveNote:
             note = save_note("7203.T", "thesis", "content", base_dir=str(tmp_path))
 
         assert note["content"] == "content"
-        files = list(tmp_path.glob("*.json"))
+        files = list(tmp_path.glob("*.jsonl"))
         assert len(files) == 1
 
+    def test_save_note_graph_write_runs_in_background(self, tmp_path, monkeypatch):
+        """Neo4j 書き込みはバックグラウンドで実行され、flush で完了すること."""
+        import src.data.graph_store as gs
+        monkeypatch.setenv("NEO4J_MODE", "full")
+        with patch("src.data.graph_store.merge_note") as mock_merge:
+            note = save_note("7203.T", "thesis", "content", base_dir=str(tmp_path))
+            assert gs.flush_background(timeout=5) is True
+        mock_merge.assert_called_once()
+        assert mock_merge.call_args.kwargs["note_id"] == note["id"]
+        assert mock_merge.call_args.kwargs["symbol"] == "7203.T"
+
     def test_save_note_creates_directory(self, tmp_path):
         nested = tmp_path / "sub" / "notes"
         save_note("AAPL", "thesis", "test", base_dir=str(nested))
         assert nested.exists()
 
+    def test_save_note_recreates_removed_directory(self, tmp_path):
+        import shutil
+        nested = tmp_path / "notes"
+        save_note("AAPL", "thesis", "first", base_dir=str(nested))
+        shutil.rmtree(nested)
+        save_note("AAPL", "thesis", "second", base_dir=str(nested))
+        assert [n["content"] for n in load_notes(base_dir=str(nested))] == ["second"]
+
     def test_save_note_dot_in_symbol(self, tmp_path):
-        """Dots in symbol should be replaced with underscore in filename."""
+        """Symbols are stored verbatim in the JSONL record."""
         save_note("D05.SI", "thesis", "test", base_dir=str(tmp_path))
-        files = list(tmp_path.glob("*.json"))
+        files = list(tmp_path.glob("*.jsonl"))
         assert len(files) == 1
-        assert "D05_SI" in files[0].name
+        assert _read_jsonl(files[0])[0]["symbol"] == "D05.SI"
 
     # KIK-429: category support
     def test_save_note_without_symbol(self, tmp_path):
@@ -105,9 +129,9 @@ class TestSaveNote:
         assert note["symbol"] == ""
         assert note["category"] == "portfolio"
         assert "portfolio" in note["id"]
-        files = list(tmp_path.glob("*.json"))
+        files = list(tmp_path.glob("*.jsonl"))
         assert len(files) == 1
-        assert "portfolio" in files[0].name
+        assert _read_jsonl(files[0])[0]["category"] == "portfolio"
 
     def test_save_note_with_symbol_category_is_stock(self, tmp_path):
         """symbol 指定時は category が自動で stock になること."""
@@ -371,6 +395,92 @@ class TestLoadNotes:
         assert notes[0]["content"] == "PF review"
 
 
+class TestIterNotes:
+    def test_matches_load_notes(self, tmp_path):
+        """iter_notes は load_notes と同じメモ・同じフィルタ結果を返すこと."""
+        save_note("7203.T", "thesis", "Toyota thesis", base_dir=str(tmp_path))
+        save_note("AAPL", "concern", "Apple concern", base_dir=str(tmp_path))
+        save_note(note_type="review", content="PF", category="portfolio", base_dir=str(tmp_path))
+        for kwargs in ({}, {"symbol": "AAPL"}, {"note_type": "review"}, {"category": "stock"}):
+            streamed = list(iter_notes(base_dir=str(tmp_path), **kwargs))
+            loaded = load_notes(base_dir=str(tmp_path), **kwargs)
+            assert sorted(n["id"] for n in streamed) == sorted(n["id"] for n in loaded)
+
+    def test_yields_newest_file_first(self, tmp_path):
+        """日付プレフィックスのファイル名降順 (= 日付降順) で返すこと."""
+        (tmp_path / "2026-01-01_AAPL_thesis.json").write_text(
+            json.dumps([{"id": "old", "date": "2026-01-01"}])
+        )
+        (tmp_path / "2026-03-01_AAPL_thesis.json").write_text(
+            json.dumps([{"id": "new", "date": "2026-03-01"}])
+        )
+        (tmp_path / "bad.json").write_text("not valid json")
+        assert [n["id"] for n in iter_notes(base_dir=str(tmp_path))] == ["new", "old"]
+
+    def test_reads_jsonl_and_legacy_json(self, tmp_path):
+        """日別 JSONL と旧形式 JSON を混在で読み、壊れた行は飛ばすこと."""
+        (tmp_path / "2026-03-01.jsonl").write_text(
+            json.dumps({"id": "new", "date": "2026-03-01"}) + "\n{broken\n"
+        )
+        (tmp_path / "2026-02-01_AAPL_thesis.json").write_text(
+            json.dumps([{"id": "legacy", "date": "2026-02-01"}])
+        )
+        assert [n["id"] for n in iter_notes(base_dir=str(tmp_path))] == ["new", "legacy"]
+        assert [n["id"] for n in load_notes(base_dir=str(tmp_path))] == ["new", "legacy"]
+
+    def test_nonexistent_dir(self, tmp_path):
+        assert list(iter_notes(base_dir=str(tmp_path / "nonexistent"))) == []
+
+    def test_merges_dates_across_files(self, tmp_path):
+        """ファイル名と日付がずれていても全体で日付降順にマージすること."""
+        (tmp_path / "2026-03-01.jsonl").write_text(
+            json.dumps({"id": "a", "date": "2026-03-01"}) + "\n"
+            + json.dumps({"id": "c", "date": "2026-01-01"}) + "\n"
+        )
+        (tmp_path / "2026-02-01_AAPL_thesis.json").write_text(
+            json.dumps([{"id": "b", "date": "2026-02-01"}])
+        )
+        assert [n["id"] for n in iter_notes(base_dir=str(tmp_path))] == ["a", "b", "c"]
+
+    def test_load_notes_limit(self, tmp_path):
+        """limit 指定で新しい順に先頭 K 件だけ返すこと."""
+        for day in ("2026-01-01", "2026-02-01", "2026-03-01"):
+            (tmp_path / f"{day}.jsonl").write_text(json.dumps({"id": day, "date": day}) + "\n")
+        notes = load_notes(base_dir=str(tmp_path), limit=2)
+        assert [n["id"] for n in notes] == ["2026-03-01", "2026-02-01"]
+
+
+class TestNoteFileCache:
+    def test_unchanged_files_are_not_reparsed(self, tmp_path):
+        import src.data.note_manager as nm
+        save_note("7203.T", "thesis", "First", base_dir=str(tmp_path))
+        with patch.object(nm, "_parse_note_file", wraps=nm._parse_note_file) as parse:
+            load_notes(base_dir=str(tmp_path))
+            load_notes(symbol="7203.T", base_dir=str(tmp_path))
+            assert parse.call_count <= 1
+
+            save_note("7203.T", "thesis", "Second", base_dir=str(tmp_path))
+            notes = load_notes(base_dir=str(tmp_path))
+        assert [n["content"] for n in notes] == ["First", "Second"]
+
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_jsonl_round_trip_keeps_utf8(self, tmp_path, has_orjson):
+        import src.data.note_manager as nm
+        if has_orjson:
+            pytest.importorskip("orjson")
+        with patch.object(nm, "_HAS_ORJSON", has_orjson):
+            note = save_note("7203.T", "thesis", "トヨタ強気", base_dir=str(tmp_path))
+            raw = (tmp_path / f"{note['date']}.jsonl").read_bytes()
+            assert "トヨタ強気".encode("utf-8") in raw
+            assert load_notes(base_dir=str(tmp_path))[0]["content"] == "トヨタ強気"
+
+    def test_mutating_result_does_not_leak(self, tmp_path):
+        save_note("7203.T", "thesis", "Original", base_dir=str(tmp_path))
+        load_notes(base_dir=str(tmp_path))[0]["content"] = "changed"
+        next(iter_notes(base_dir=str(tmp_path)))["content"] = "changed"
+        assert load_notes(base_dir=str(tmp_path))[0]["content"] == "Original"
+
+
 # ===================================================================
 # delete_note tests
 # ===================================================================
@@ -380,7 +490,7 @@ class TestDeleteNote:
         note = save_note("7203.T", "thesis", "To delete", base_dir=str(tmp_path))
         assert delete_note(note["id"], base_dir=str(tmp_path)) is True
         # File should be removed (was the only note)
-        assert list(tmp_path.glob("*.json")) == []
+        assert list(tmp_path.iterdir()) == []
 
     def test_delete_note_keeps_others(self, tmp_path):
         n1 = save_note("7203.T", "thesis", "Keep me", base_dir=str(tmp_path))
@@ -399,3 +509,31 @@ class TestDeleteNote:
 
     def test_delete_note_nonexistent_dir(self, tmp_path):
         assert delete_note("any_id", base_dir=str(tmp_path / "nonexistent")) is False
+
+    def test_graph_delete_uses_configured_database(self, tmp_path, monkeypatch):
+        from unittest.mock import MagicMock
+        import src.data.graph_store as gs
+        from src.data.graph_store._common import _DatabaseDriver
+        note = save_note("7203.T", "thesis", "To delete", base_dir=str(tmp_path))
+        raw = MagicMock()
+        monkeypatch.setattr(gs, "_get_mode", lambda: "full")
+        monkeypatch.setattr(gs, "_get_driver", lambda: _DatabaseDriver(raw, "research"))
+        assert delete_note(note["id"], base_dir=str(tmp_path)) is True
+        gs.flush_background()
+        assert raw.execute_query.call_args.kwargs["database_"] == "research"
+
+    def test_graph_delete_runs_after_pending_save(self, tmp_path, monkeypatch):
+        """保存直後の削除でも、Neo4j の DETACH DELETE は MERGE の後に走ること."""
+        from unittest.mock import MagicMock
+        import src.data.graph_store as gs
+        monkeypatch.setenv("NEO4J_MODE", "full")
+        calls = []
+        driver = MagicMock()
+        driver.execute_query.side_effect = lambda *a, **kw: calls.append("delete")
+        monkeypatch.setattr(gs, "_get_driver", lambda: driver)
+        with patch("src.data.graph_store.merge_note",
+                   side_effect=lambda **kw: calls.append("merge")):
+            note = save_note("7203.T", "thesis", "content", base_dir=str(tmp_path))
+            assert delete_note(note["id"], base_dir=str(tmp_path)) is True
+            assert gs.flush_background(timeout=5) is True
+        assert calls == ["merge", "delete"]
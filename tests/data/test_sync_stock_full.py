@@ -40,7 +40,7 @@ class TestSyncStockFull:
         assert result["trades"] == 0
 
     def test_enriches_stock_metadata(self, gs_with_driver):
-        gs, _, session = gs_with_driver
+        gs, driver, _ = gs_with_driver
 
         mock_info = {"name": "Toyota", "sector": "Industrials", "country": "Japan"}
         mock_client = MagicMock()
@@ -51,7 +51,7 @@ class TestSyncStockFull:
 
         assert result["stock"] is True
         # merge_stock should have been called with metadata
-        merge_calls = [c for c in session.run.call_args_list
+        merge_calls = [c for c in driver.execute_query.call_args_list
                        if "Stock" in str(c) and "sector" in str(c)]
         assert len(merge_calls) > 0
 
@@ -22,11 +22,14 @@ from src.data.yahoo_client import (
     MACRO_TICKERS,
     _build_dividend_history_from_actions,
     _cache_path,
+    _history_cache_path,
     _normalize_ratio,
     _read_cache,
+    _read_history_cache,
     _safe_get,
     _sanitize_anomalies,
     _write_cache,
+    _write_history_cache,
     get_macro_indicators,
 )
 
@@ -267,6 +270,57 @@ class TestCacheReadWrite:
             assert (nested_dir / "TEST.json").exists()
 
 
+# ---------------------------------------------------------------------------
+# Price history file cache
+# ---------------------------------------------------------------------------
+
+def _sample_history() -> pd.DataFrame:
+    index = pd.date_range("2026-01-05", periods=3, freq="D", tz="Asia/Tokyo")
+    return pd.DataFrame(
+        {"Open": [1.0, 2.0, 3.0], "Close": [1.1, 2.2, 3.3], "Volume": [10, 20, 30]},
+        index=index,
+    )
+
+
+class TestHistoryCache:
+    """Tests for the price-history file cache."""
+
+    def test_round_trip_keeps_index_and_values(self, tmp_path):
+        with patch(_CACHE_DIR_PATCH, tmp_path):
+            df = _sample_history()
+            _write_history_cache("7203.T", "1y", df)
+            assert (tmp_path / "7203_T_history_1y.pkl").exists()
+            pd.testing.assert_frame_equal(_read_history_cache("7203.T", "1y"), df)
+            assert _read_history_cache("7203.T", "6mo") is None
+
+    def test_expired_beyond_ttl(self, tmp_path):
+        import os
+        with patch(_CACHE_DIR_PATCH, tmp_path):
+            _write_history_cache("AAPL", "1y", _sample_history())
+            old = time.time() - (CACHE_TTL_HOURS + 1) * 3600
+            os.utime(_history_cache_path("AAPL", "1y"), (old, old))
+            assert _read_history_cache("AAPL", "1y") is None
+
+    def test_corrupt_file_returns_none(self, tmp_path):
+        with patch(_CACHE_DIR_PATCH, tmp_path):
+            _history_cache_path("BAD", "1y").write_bytes(b"not a pickle")
+            assert _read_history_cache("BAD", "1y") is None
+
+    def test_get_price_history_uses_file_cache(self, tmp_path):
+        """Second fetch is served from the file cache after the memory cache is cleared."""
+        from src.data.yahoo_client import clear_memory_cache, get_price_history
+        df = _sample_history()
+        with patch(_CACHE_DIR_PATCH, tmp_path), \
+                patch("src.data.yahoo_client.history.time.sleep"), \
+                patch("src.data.yahoo_client.history.yf.Ticker") as mock_ticker:
+            mock_ticker.return_value.history.return_value = df
+            first = get_price_history("7203.T")
+            clear_memory_cache()
+            second = get_price_history("7203.T")
+        assert mock_ticker.call_count == 1
+        pd.testing.assert_frame_equal(second, first)
+
+
 # ---------------------------------------------------------------------------
 # _sanitize_anomalies
 # ---------------------------------------------------------------------------
@@ -127,6 +127,13 @@ class TestFormatMarkdown:
         # Symbol should still appear
         assert "TEST" in output
 
+    def test_row_cells_exact(self):
+        """Each cell matches fmt_float / fmt_pct output, '-' for None."""
+        results = [{"symbol": "TEST", "price": 1234.6, "per": None, "pbr": 0.5,
+                    "dividend_yield": 0.031, "roe": None, "value_score": 60}]
+        row = format_markdown(results).split("\n")[2]
+        assert row == "| 1 | TEST | 1235 | - | 0.50 | 3.10% | - | 60.00 |"
+
 
 # ---------------------------------------------------------------------------
 # format_query_markdown
@@ -222,6 +229,12 @@ class TestFormatPullbackMarkdown:
         output = format_pullback_markdown(results)
         assert "△部分一致" in output
 
+    def test_sma_cells(self):
+        """SMA50/SMA200 are whole numbers, '-' when missing."""
+        results = [{"symbol": "TEST", "sma50": 2900.4, "sma200": None}]
+        cells = format_pullback_markdown(results).split("\n")[2].split(" | ")
+        assert cells[7:9] == ["2900", "-"]
+
     def test_empty_list_returns_not_found_message(self):
         """Empty results list produces pullback-specific 'not found' message."""
         output = format_pullback_markdown([])
@@ -165,7 +165,7 @@ class TestNoteList:
         from manage_note import cmd_list
 
         args = argparse.Namespace(symbol=None, type=None, category=None)
-        with patch("manage_note.load_notes", return_value=[]):
+        with patch("manage_note.iter_notes", return_value=[]):
             cmd_list(args)
         output = capsys.readouterr().out
         assert "メモはありません" in output
@@ -183,7 +183,7 @@ class TestNoteList:
             }
         ]
         args = argparse.Namespace(symbol=None, type=None, category=None)
-        with patch("manage_note.load_notes", return_value=mock_notes):
+        with patch("manage_note.iter_notes", return_value=mock_notes):
             cmd_list(args)
         output = capsys.readouterr().out
         assert "投資メモ一覧" in output